@@ -2,6 +2,8 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 from tartiflette.directive.directive import Directive
 from tartiflette.engine import Engine
+from tartiflette.options import EngineOptions
+from tartiflette.pool import EnginePool
 from tartiflette.resolver.resolver import Resolver
 from tartiflette.resolver.type_resolver import TypeResolver
 from tartiflette.scalar.scalar import Scalar
@@ -12,6 +14,8 @@ __all__ = (
     "create_engine",
     "Directive",
     "Engine",
+    "EngineOptions",
+    "EnginePool",
     "Resolver",
     "TypeResolver",
     "Scalar",
@@ -29,6 +33,7 @@ async def create_engine(
     custom_default_resolver: Optional[Callable] = None,
     custom_default_type_resolver: Optional[Callable] = None,
     modules: Optional[Union[str, List[str], List[Dict[str, Any]]]] = None,
+    options: Optional["EngineOptions"] = None,
 ) -> "Engine":
     """
     Create an engine by analyzing the SDL and connecting it with the imported
@@ -47,12 +52,16 @@ async def create_engine(
     :param modules: list of string containing the name of the modules you want
     the engine to import, usually this modules contains your Resolvers,
     Directives, Scalar or Subscription code
+    :param options: options tuning how the schema is cooked and how the
+    queries are stored, validated & executed (query cache, persisted queries,
+    cost analyzer, base engine...)
     :type sdl: Union[str, List[str]]
     :type schema_name: str
     :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
     :type custom_default_resolver: Optional[Callable]
     :type custom_default_type_resolver: Optional[Callable]
     :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
+    :type options: Optional[EngineOptions]
     :return: a Cooked Engine instance
     :rtype: Engine
 
@@ -74,6 +83,7 @@ async def create_engine(
         custom_default_type_resolver=custom_default_type_resolver,
         modules=modules,
         schema_name=schema_name,
+        options=options,
     )
 
     return e
@@ -10,7 +10,7 @@ class Path:
     Representations of the path traveled during the coercion.
     """
 
-    __slots__ = ("prev", "key")
+    __slots__ = ("prev", "key", "_as_list")
 
     def __init__(self, prev: Optional["Path"], key: Union[str, int]) -> None:
         """
@@ -21,6 +21,7 @@ class Path:
         """
         self.prev = prev
         self.key = key
+        self._as_list: Optional[List[Union[str, int]]] = None
 
     def __repr__(self) -> str:
         """
@@ -49,16 +50,17 @@ class Path:
 
     def as_list(self) -> List[str]:
         """
-        Computes and returns the path as a list.
+        Computes and returns the path as a list. The list is computed once
+        from the one of the previous path, which is computed once too, so that
+        errors sharing a part of their path don't walk it again.
         :return: the full path as a list
         :rtype: List[str]
         """
-        path = []
-        current_path = self
-        while current_path:
-            path.append(current_path.key)
-            current_path = current_path.prev
-        return path[::-1]
+        if self._as_list is None:
+            self._as_list = (
+                self.prev.as_list() if self.prev is not None else []
+            ) + [self.key]
+        return list(self._as_list)
 
 
 class CoercionResult:
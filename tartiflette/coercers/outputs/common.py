@@ -1,10 +1,16 @@
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
-from tartiflette.execution.collect import collect_subfields
+from tartiflette.coercers.common import Path
+from tartiflette.coercers.outputs.non_null_coercer import check_non_null_output
 from tartiflette.execution.execute import execute_fields
+from tartiflette.execution.plan import get_subfields_execution_plan
 from tartiflette.utils.errors import located_error
 
-__all__ = ("complete_value_catching_error", "complete_object_value")
+__all__ = (
+    "complete_value_catching_error",
+    "complete_scalar_value_catching_error",
+    "complete_object_value",
+)
 
 
 def handle_field_error(
@@ -83,6 +89,62 @@ async def complete_value_catching_error(
         )
 
 
+def complete_scalar_value_catching_error(
+    result: Any,
+    execution_context: "ExecutionContext",
+    parent_type: "GraphQLObjectType",
+    field_definition: "GraphQLField",
+    field_nodes: List["FieldNode"],
+    parent_path: Optional["Path"],
+    key: str,
+) -> Any:
+    """
+    Synchronously coerce the resolved value of a (non-null) scalar field or
+    catch the resolver exception to add it to the execution context. The path
+    of the field is only allocated when an error has to be located.
+    :param result: resolved field value
+    :param execution_context: instance of the query execution context
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param field_definition: GraphQLField instance of the resolved field
+    :param field_nodes: AST nodes related to the resolved field
+    :param parent_path: the path traveled until the field's parent
+    :param key: the response key of the field
+    :type result: Any
+    :type execution_context: ExecutionContext
+    :type parent_type: GraphQLObjectType
+    :type field_definition: GraphQLField
+    :type field_nodes: List[FieldNode]
+    :type parent_path: Optional[Path]
+    :type key: str
+    :return: the coerced resolved field value
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        if isinstance(result, Exception):
+            raise result
+
+        coerced_output = (
+            field_definition.sync_output_coercer(result)
+            if result is not None
+            else None
+        )
+        # The coercer of the scalar may also return null
+        if field_definition.graphql_type.is_non_null_type:
+            return check_non_null_output(
+                coerced_output, parent_type, field_definition.name
+            )
+        return coerced_output
+    except Exception as raw_exception:  # pylint: disable=broad-except
+        return handle_field_error(
+            raw_exception,
+            field_nodes,
+            Path(parent_path, key),
+            field_definition.graphql_type,
+            execution_context,
+        )
+
+
 async def complete_object_value(
     result: Any,
     info: "ResolveInfo",
@@ -113,6 +175,8 @@ async def complete_object_value(
         return_type,
         result,
         path,
-        await collect_subfields(execution_context, return_type, field_nodes),
+        await get_subfields_execution_plan(
+            execution_context, return_type, field_nodes
+        ),
         info.is_introspection,
     )
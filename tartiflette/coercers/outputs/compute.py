@@ -1,10 +1,10 @@
 from functools import partial
-from typing import Callable
+from typing import Callable, Optional
 
 from tartiflette.coercers.outputs.list_coercer import list_coercer
 from tartiflette.coercers.outputs.non_null_coercer import non_null_coercer
 
-__all__ = ("get_output_coercer",)
+__all__ = ("get_output_coercer", "get_sync_output_coercer")
 
 
 def get_output_coercer(graphql_type: "GraphQLType") -> Callable:
@@ -39,3 +39,23 @@ def get_output_coercer(graphql_type: "GraphQLType") -> Callable:
         coercer = partial(wrapper_coercer, inner_coercer=coercer)
 
     return coercer
+
+
+def get_sync_output_coercer(
+    graphql_type: "GraphQLType",
+) -> Optional[Callable]:
+    """
+    Returns the synchronous output coercer of the scalar type (possibly
+    wrapped into a non-null type) or None if the values of the schema type
+    can't be coerced synchronously.
+    :param graphql_type: the schema type for which compute the coercer
+    :type graphql_type: GraphQLType
+    :return: the synchronous coercer of the scalar type
+    :rtype: Optional[Callable]
+    """
+    inner_type = (
+        graphql_type.wrapped_type
+        if graphql_type.is_non_null_type
+        else graphql_type
+    )
+    return getattr(inner_type, "sync_output_coercer", None)
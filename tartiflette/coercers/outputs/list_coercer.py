@@ -1,5 +1,3 @@
-import asyncio
-
 from typing import Any, Callable, List
 
 from tartiflette.coercers.common import Path
@@ -45,8 +43,8 @@ async def list_coercer(
             f"{info.parent_type.name}.{info.field_name}."
         )
 
-    results = await asyncio.gather(
-        *[
+    results = await execution_context.execution_strategy(
+        [
             complete_value_catching_error(
                 item,
                 info,
@@ -57,8 +55,7 @@ async def list_coercer(
                 inner_coercer,
             )
             for index, item in enumerate(result)
-        ],
-        return_exceptions=True,
+        ]
     )
 
     exceptions = extract_exceptions_from_results(results)
@@ -1,6 +1,29 @@
 from typing import Any, Callable, List
 
-__all__ = ("non_null_coercer",)
+__all__ = ("check_non_null_output", "non_null_coercer")
+
+
+def check_non_null_output(
+    coerced_output: Any, parent_type: "GraphQLObjectType", field_name: str
+) -> Any:
+    """
+    Raises an error if the coerced value of a non-null field is None or
+    returns it.
+    :param coerced_output: the coerced value of the field
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param field_name: name of the field
+    :type coerced_output: Any
+    :type parent_type: GraphQLObjectType
+    :type field_name: str
+    :return: the coerced value of the field
+    :rtype: Any
+    """
+    if coerced_output is None:
+        raise ValueError(
+            "Cannot return null for non-nullable field "
+            f"{parent_type.name}.{field_name}."
+        )
+    return coerced_output
 
 
 async def non_null_coercer(
@@ -29,12 +52,10 @@ async def non_null_coercer(
     :return: the computed value
     :rtype: Any
     """
-    coerced_output = await inner_coercer(
-        result, info, execution_context, field_nodes, path
+    return check_non_null_output(
+        await inner_coercer(
+            result, info, execution_context, field_nodes, path
+        ),
+        info.parent_type,
+        info.field_name,
     )
-    if coerced_output is None:
-        raise ValueError(
-            "Cannot return null for non-nullable field "
-            f"{info.parent_type.name}.{info.field_name}."
-        )
-    return coerced_output
@@ -3,7 +3,25 @@ from typing import Any, List
 from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
 from tartiflette.utils.values import is_invalid_value
 
-__all__ = ("scalar_coercer",)
+__all__ = ("scalar_coercer", "sync_scalar_coercer")
+
+
+def sync_scalar_coercer(result: Any, scalar_type: "GraphQLScalar") -> Any:
+    """
+    Computes the value of a scalar type synchronously.
+    :param result: resolved value
+    :param scalar_type: the GraphQLType instance of the scalar
+    :type result: Any
+    :type scalar_type: GraphQLScalar
+    :return: the computed value
+    :rtype: Any
+    """
+    coerced_result = scalar_type.coerce_output(result)
+    if is_invalid_value(coerced_result):
+        raise ValueError(
+            f"Expected value of type {scalar_type} but received {type(result)}."
+        )
+    return coerced_result
 
 
 @null_coercer_wrapper
@@ -33,9 +51,4 @@ async def scalar_coercer(
     :rtype: Any
     """
     # pylint: disable=unused-argument
-    coerced_result = scalar_type.coerce_output(result)
-    if is_invalid_value(coerced_result):
-        raise ValueError(
-            f"Expected value of type {scalar_type} but received {type(result)}."
-        )
-    return coerced_result
+    return sync_scalar_coercer(result, scalar_type)
@@ -1,7 +1,10 @@
+import asyncio
 import logging
+import re
+import sys
 
 from functools import partial
-from importlib import import_module, invalidate_caches
+from importlib import import_module, invalidate_caches, reload
 from inspect import isawaitable
 from typing import (
     Any,
@@ -10,19 +13,41 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
 )
 
-from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.cache import DocumentCache, LRUDocumentCache
+from tartiflette.execution.collect import (
+    parse_and_validate_query,
+    rebind_document,
+)
+from tartiflette.execution.cost import QueryCost, QueryCostAnalyzer
 from tartiflette.execution.execute import create_source_event_stream, execute
+from tartiflette.execution.limits import QueryLimits
+from tartiflette.execution.persisted import (
+    InMemoryPersistedQueryStore,
+    PersistedQueryStore,
+    compute_query_id,
+)
 from tartiflette.execution.response import build_response
+from tartiflette.execution.snapshot import (
+    dump_document_snapshot,
+    load_document_snapshot,
+)
+from tartiflette.execution.strategies import gather_strategy
+from tartiflette.options import EngineOptions
 from tartiflette.schema.bakery import SchemaBakery
 from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.schema.sharing import SharedSchema
 from tartiflette.types.exceptions.tartiflette import (
     ImproperlyConfigured,
     NonCallable,
     NonCoroutine,
+    PersistedQueryMismatch,
+    PersistedQueryNotFound,
 )
 from tartiflette.utils.callables import is_valid_coroutine
 from tartiflette.utils.errors import (
@@ -48,6 +73,17 @@ _BUILTINS_MODULES = (
     "tartiflette.schema.builtins.introspection",
 )
 
+# Built-ins modules which are only baked, when built-ins are lazily imported,
+# if the name they implement is referenced by the SDL
+_OPTIONAL_BUILTINS_MODULES = {
+    "tartiflette.directive.builtins.non_introspectable": "nonIntrospectable",
+    "tartiflette.scalar.builtins.date": "Date",
+    "tartiflette.scalar.builtins.datetime": "DateTime",
+    "tartiflette.scalar.builtins.time": "Time",
+}
+
+_NAME_PATTERN = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+
 
 async def _bake_module(
     module: object, schema_name: str, config: Optional[Dict[str, Any]] = None
@@ -69,49 +105,164 @@ async def _bake_module(
     return msdl or ""
 
 
+def _reload_module(name: str, reloaded_names: Set[str]) -> object:
+    """
+    Imports a module after executing it again, along with its already
+    imported submodules, so that the objects they register are registered
+    again. The modules which have already been reloaded aren't executed
+    again, in order not to register their objects twice.
+    :param name: name of the module to reload
+    :param reloaded_names: names of the already reloaded modules
+    :type name: str
+    :type reloaded_names: Set[str]
+    :return: the reloaded module
+    :rtype: object
+    """
+    prefix = f"{name}."
+    module_names = sorted(
+        (
+            module_name
+            for module_name, module in list(sys.modules.items())
+            if module is not None
+            and (module_name == name or module_name.startswith(prefix))
+        ),
+        key=lambda module_name: module_name.count("."),
+        reverse=True,
+    )
+
+    # Submodules are reloaded before the packages importing them
+    for module_name in module_names:
+        if module_name not in reloaded_names:
+            reloaded_names.add(module_name)
+            reload(sys.modules[module_name])
+
+    module = import_module(name)
+    reloaded_names.update(
+        module_name
+        for module_name in list(sys.modules)
+        if module_name == name or module_name.startswith(prefix)
+    )
+    return module
+
+
+def _is_implemented_in(obj: object, module_names: List[str]) -> bool:
+    """
+    Determines whether or not the implementation of a registered object is
+    defined in one of the modules (or in one of their submodules).
+    :param obj: the registered object
+    :param module_names: names of the modules
+    :type obj: object
+    :type module_names: List[str]
+    :return: whether or not the implementation of the object is defined in
+    one of the modules
+    :rtype: bool
+    """
+    implementation_module_name = getattr(
+        getattr(obj, "_implementation", None), "__module__", None
+    )
+    if implementation_module_name is None:
+        return False
+    return any(
+        implementation_module_name == module_name
+        or implementation_module_name.startswith(f"{module_name}.")
+        for module_name in module_names
+    )
+
+
 async def _import_builtins(
-    imported_modules: List[object], sdl: str, schema_name: str
+    imported_modules: List[object],
+    sdl: str,
+    schema_name: str,
+    referenced_names: Optional[Set[str]] = None,
 ) -> Tuple[List[object], str]:
     """
     Imports and bakes built-ins directives and scalars if not already
-    implemented.
+    implemented. When the names referenced by the SDL are provided, the
+    optional built-ins which aren't referenced are neither imported nor baked.
     :param imported_modules: list of already imported modules
     :param sdl: SDL with complementary content from already baked modules
     :param schema_name: schema name to link with
+    :param referenced_names: names referenced by the SDL
     :type imported_modules: List[object]
     :type sdl: str
     :type schema_name: str
+    :type referenced_names: Optional[Set[str]]
     :return: couple list of imported modules instance/final SDL
     :rtype: Tuple[List[object], str]
     """
+    sdl_parts = [sdl]
     for module in _BUILTINS_MODULES:
+        if (
+            referenced_names is not None
+            and module in _OPTIONAL_BUILTINS_MODULES
+            and _OPTIONAL_BUILTINS_MODULES[module] not in referenced_names
+        ):
+            continue
+
         try:
             module = import_module(module)
-            sdl = "{sdl}\n{msdl}".format(
-                sdl=sdl, msdl=await _bake_module(module, schema_name)
-            )
+            sdl_parts.append(await _bake_module(module, schema_name))
             imported_modules.append(module)
         except ImproperlyConfigured:
             pass
 
-    return imported_modules, sdl
+    return imported_modules, "\n".join(sdl_parts)
+
+
+def _find_referenced_names(
+    sdl: Optional[str], sdl_parts: List[str]
+) -> Optional[Set[str]]:
+    """
+    Returns the names referenced by the SDL of the schema and the SDL of its
+    modules, names appearing in descriptions or comments being also
+    considered as referenced, which only bakes a few unused built-ins.
+    :param sdl: SDL of the schema
+    :param sdl_parts: SDL of the modules of the schema
+    :type sdl: Optional[str]
+    :type sdl_parts: List[str]
+    :return: the referenced names or None if the SDL of the schema isn't
+    provided
+    :rtype: Optional[Set[str]]
+    """
+    if sdl is None:
+        return None
+
+    referenced_names = set(_NAME_PATTERN.findall(sdl))
+    for module_sdl in sdl_parts:
+        referenced_names.update(_NAME_PATTERN.findall(module_sdl))
+    return referenced_names
 
 
 async def _import_modules(
-    module_definitions: List[Union[str, Dict[str, Any]]], schema_name: str
+    module_definitions: List[Union[str, Dict[str, Any]]],
+    schema_name: str,
+    sdl: Optional[str] = None,
+    import_builtins: bool = True,
+    reload_modules: bool = False,
 ) -> Tuple[List[object], str]:
     """
     Imports and bakes the list of modules filled at engine initialisation
-    before importing & baking built-ins modules.
+    before importing & baking built-ins modules. When the SDL of the schema
+    is provided, only the optional built-ins referenced by this SDL or by the
+    SDL of the modules are imported & baked.
     :param module_definitions: list of modules filled at engine initialisation
     :param schema_name: schema name to link with
+    :param sdl: SDL of the schema to scan for the referenced built-ins
+    :param import_builtins: whether or not the built-ins modules should be
+    imported & baked
+    :param reload_modules: whether or not the already imported modules
+    should be executed again
     :type module_definitions: List[Union[str, Dict[str, Any]]]
     :type schema_name: str
+    :type sdl: Optional[str]
+    :type import_builtins: bool
+    :type reload_modules: bool
     :return: couple list of imported modules instance/final SDL
     :rtype: Tuple[List[object], str]
     """
-    sdl = ""
+    sdl_parts = [""]
     imported_modules = []
+    reloaded_names = set()
 
     invalidate_caches()
 
@@ -119,17 +270,27 @@ async def _import_modules(
         if not isinstance(module_definition, dict):
             module_definition = {"name": module_definition, "config": None}
 
-        module = import_module(module_definition["name"])
+        if reload_modules:
+            module = _reload_module(module_definition["name"], reloaded_names)
+        else:
+            module = import_module(module_definition["name"])
         if callable(getattr(module, "bake", None)):
-            sdl = "{sdl}\n{msdl}".format(
-                sdl=sdl,
-                msdl=await _bake_module(
+            sdl_parts.append(
+                await _bake_module(
                     module, schema_name, module_definition["config"]
-                ),
+                )
             )
         imported_modules.append(module)
 
-    return await _import_builtins(imported_modules, sdl, schema_name)
+    if not import_builtins:
+        return imported_modules, "\n".join(sdl_parts)
+
+    return await _import_builtins(
+        imported_modules,
+        "\n".join(sdl_parts),
+        schema_name,
+        _find_referenced_names(sdl, sdl_parts),
+    )
 
 
 class Engine:
@@ -145,6 +306,7 @@ class Engine:
         custom_default_resolver=None,
         custom_default_type_resolver=None,
         modules=None,
+        options=None,
     ) -> None:
         """
         Creates an uncooked Engine instance.
@@ -160,6 +322,10 @@ class Engine:
         self._build_response = None
         self._query_executor = None
         self._subcription_executor = None
+        self._options = options
+        self._shared_schema = None
+        self._module_definitions = None
+        self._reload_lock = None
 
     async def cook(
         self,
@@ -171,6 +337,7 @@ class Engine:
         custom_default_type_resolver: Optional[Callable] = None,
         modules: Optional[Union[str, List[str], List[Dict[str, Any]]]] = None,
         schema_name: str = None,
+        options: Optional[EngineOptions] = None,
     ) -> None:
         """
         Cook the tartiflette, basically prepare the engine by binding it to
@@ -189,12 +356,16 @@ class Engine:
         want the engine to import, usually this modules contains your
         Resolvers, Directives, Scalar or Subscription code
         :param schema_name: name of the SDL
+        :param options: options tuning how the schema is cooked and how the
+        queries are stored, validated & executed (query cache, persisted
+        queries, cost analyzer, base engine...)
         :type sdl: Union[str, List[str]]
         :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
         :type schema_name: str
+        :type options: Optional[EngineOptions]
         """
         if self._cooked:
             return
@@ -204,12 +375,19 @@ class Engine:
 
         if isinstance(modules, str):
             modules = [modules]
+        self._module_definitions = modules
+
+        self._set_options(options)
+        base_engine = self._options.base_engine
 
-        sdl = sdl or self._sdl
-        if not sdl:
+        # The SDL of an engine extending a base engine can be empty
+        sdl = sdl or self._sdl or ("" if base_engine is not None else None)
+        if sdl is None:
             raise Exception("Please provide a SDL")
+        self._sdl = sdl
 
         schema_name = schema_name or self._schema_name or "default"
+        self._schema_name = schema_name
 
         custom_error_coercer = error_coercer or self._error_coercer
         if custom_error_coercer and not is_valid_coroutine(
@@ -228,6 +406,7 @@ class Engine:
             raise NonCoroutine(
                 "Given < custom_default_resolver > is not a coroutine callable."
             )
+        self._custom_default_resolver = custom_default_resolver
 
         custom_default_type_resolver = (
             custom_default_type_resolver or self._custom_default_type_resolver
@@ -238,19 +417,16 @@ class Engine:
             raise NonCallable(
                 "Given < custom_default_type_resolver > is not a coroutine callable."
             )
+        self._custom_default_type_resolver = custom_default_type_resolver
+
+        self._inherit_default_resolvers(base_engine)
 
         self._error_coercer = error_coercer_factory(
             custom_error_coercer or default_error_coercer
         )
 
-        self._modules, modules_sdl = await _import_modules(
-            modules, schema_name
-        )
-
-        SchemaRegistry.register_sdl(schema_name, sdl, modules_sdl)
-        self._schema = await SchemaBakery.bake(
-            schema_name, custom_default_resolver, custom_default_type_resolver
-        )
+        self._modules, self._schema = await self._bake_schema(sdl, modules)
+        self._shared_schema = SharedSchema(self._schema)
         self._build_response = partial(
             build_response, error_coercer=self._error_coercer
         )
@@ -262,8 +438,495 @@ class Engine:
             self._perform_query, self._perform_subsciption
         )
 
+        self._options.persisted_query_store.bind(
+            partial(parse_and_validate_query, schema=self._schema),
+            self._schema,
+        )
+        if self._options.persisted_queries_directory:
+            await self._options.persisted_query_store.prewarm(
+                self._options.persisted_queries_directory,
+                validate=not self._options.trust_persisted_queries,
+            )
+
+        if self._options.document_snapshot:
+            await self._load_document_snapshot(self._options.document_snapshot)
+
         self._cooked = True
 
+    def _set_options(self, options: Optional[EngineOptions]) -> None:
+        """
+        Checks the options of the engine and fills in the default query
+        cache, persisted query store & execution strategy, so that they are
+        owned by the engine.
+        :param options: options of the engine
+        :type options: Optional[EngineOptions]
+        """
+        options = options or self._options or EngineOptions()
+        if not isinstance(options, EngineOptions):
+            raise ImproperlyConfigured(
+                "Given < options > is not an EngineOptions instance."
+            )
+
+        options = options.replace(
+            query_cache=options.query_cache
+            if options.query_cache is not None
+            else LRUDocumentCache(),
+            persisted_query_store=options.persisted_query_store
+            if options.persisted_query_store is not None
+            else InMemoryPersistedQueryStore(),
+            execution_strategy=options.execution_strategy or gather_strategy,
+        )
+
+        for option_name, option_type in (
+            ("query_cache", DocumentCache),
+            ("persisted_query_store", PersistedQueryStore),
+            ("cost_analyzer", QueryCostAnalyzer),
+            ("query_limits", QueryLimits),
+        ):
+            value = getattr(options, option_name)
+            if value is not None and not isinstance(value, option_type):
+                raise ImproperlyConfigured(
+                    f"Given < {option_name} > is not a "
+                    f"{option_type.__name__} instance."
+                )
+
+        if not is_valid_coroutine(options.execution_strategy):
+            raise NonCoroutine(
+                "Given < execution_strategy > is not a coroutine callable."
+            )
+
+        if options.base_engine is not None and (
+            not isinstance(options.base_engine, Engine)
+            or not options.base_engine.cooked
+        ):
+            raise ImproperlyConfigured(
+                "Given < base_engine > is not a cooked Engine instance."
+            )
+
+        self._options = options
+
+    def _inherit_default_resolvers(
+        self, base_engine: Optional["Engine"]
+    ) -> None:
+        """
+        Makes the engine inherit the default resolvers of its base engine.
+        :param base_engine: cooked engine whose schema is extended
+        :type base_engine: Optional[Engine]
+        """
+        if base_engine is None:
+            return
+
+        # The types shared with the schema of the base engine are baked with
+        # its default resolvers, thus they are inherited & can't be changed
+        for parameter_name in (
+            "custom_default_resolver",
+            "custom_default_type_resolver",
+        ):
+            attribute_name = f"_{parameter_name}"
+            base_value = getattr(base_engine, attribute_name)
+            value = getattr(self, attribute_name)
+            if value is None:
+                setattr(self, attribute_name, base_value)
+            elif value is not base_value:
+                raise ImproperlyConfigured(
+                    f"Given < {parameter_name} > differs from the one of the "
+                    "< base_engine >."
+                )
+
+    async def _bake_schema(
+        self,
+        sdl: Union[str, List[str]],
+        modules: List[Union[str, Dict[str, Any]]],
+        reload_modules: bool = False,
+        previous_schema_info: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[object], "GraphQLSchema"]:
+        """
+        Imports the modules and bakes the schema of the engine from the SDL.
+        :param sdl: path or list of path to the files / directories containing
+        the SDL
+        :param modules: list of the modules to import
+        :param reload_modules: whether or not the already imported modules
+        should be executed again, in which case the SDL is converted in the
+        background
+        :param previous_schema_info: the information previously registered
+        for the schema, whose objects which aren't implemented by the modules
+        are carried over
+        :type sdl: Union[str, List[str]]
+        :type modules: List[Union[str, Dict[str, Any]]]
+        :type reload_modules: bool
+        :type previous_schema_info: Optional[Dict[str, Any]]
+        :return: couple list of imported modules instance/baked schema
+        :rtype: Tuple[List[object], GraphQLSchema]
+        """
+        base_engine = self._options.base_engine
+        if self._options.lazy_builtins:
+            sdl = SchemaRegistry.read_sdl(sdl)
+
+        # The built-ins are shared with the schema of the base engine
+        imported_modules, modules_sdl = await _import_modules(
+            modules,
+            self._schema_name,
+            sdl if self._options.lazy_builtins else None,
+            import_builtins=base_engine is None,
+            reload_modules=reload_modules,
+        )
+
+        if previous_schema_info is not None:
+            self._carry_over_objects(modules, previous_schema_info)
+
+        SchemaRegistry.register_sdl(self._schema_name, sdl, modules_sdl)
+        schema = await SchemaBakery.bake(
+            self._schema_name,
+            self._custom_default_resolver,
+            self._custom_default_type_resolver,
+            self._options.schema_cache_directory,
+            base_engine.shared_schema if base_engine is not None else None,
+            background=reload_modules,
+        )
+        schema.cost_analyzer = self._options.cost_analyzer
+        schema.query_limits = self._options.query_limits
+
+        full_sdl = SchemaRegistry.find_schema_info(self._schema_name)["sdl"]
+        if base_engine is not None:
+            full_sdl = (
+                f"{base_engine.shared_schema.schema.fingerprint}\n{full_sdl}"
+            )
+        schema.fingerprint = schema.compute_fingerprint(full_sdl)
+        return imported_modules, schema
+
+    def _carry_over_objects(
+        self,
+        modules: List[Union[str, Dict[str, Any]]],
+        previous_schema_info: Dict[str, Any],
+    ) -> None:
+        """
+        Registers again the objects previously registered for the schema
+        which aren't implemented by the modules.
+        :param modules: list of the imported modules
+        :param previous_schema_info: the information previously registered
+        for the schema
+        :type modules: List[Union[str, Dict[str, Any]]]
+        :type previous_schema_info: Dict[str, Any]
+        """
+        # The objects registered outside of the modules (e.g. by the script
+        # cooking the engine) aren't registered again by importing them, the
+        # ones implemented by the modules (previous ones included) & by the
+        # built-ins are left out so that their removal is taken into account
+        module_names = [
+            module_definition["name"]
+            if isinstance(module_definition, dict)
+            else module_definition
+            for module_definition in [
+                *self._module_definitions,
+                *modules,
+                *_BUILTINS_MODULES,
+            ]
+        ]
+        SchemaRegistry.carry_over_objects(
+            self._schema_name,
+            previous_schema_info,
+            lambda obj: not _is_implemented_in(obj, module_names),
+        )
+
+    async def reload(
+        self,
+        sdl: Optional[Union[str, List[str]]] = None,
+        modules: Optional[Union[str, List[str], List[Dict[str, Any]]]] = None,
+    ) -> None:
+        """
+        Bakes a new schema from the SDL & modules of the engine (or from the
+        ones provided) and swaps it with the current schema of the engine.
+        The modules are executed again, so that their updated resolvers,
+        directives, scalars & subscriptions are registered again, the ones
+        registered outside of the modules being carried over. The
+        executions in progress finish against the previous schema, the next
+        ones are executed against the new one. The cached documents are
+        rebound to the new schema before the swap (as is if the SDL didn't
+        change, validated again otherwise), so that the queries aren't parsed
+        again after the swap. If the new schema can't be baked, the engine
+        keeps its current schema.
+        :param sdl: path or list of path to the files / directories containing
+        the new SDL
+        :param modules: list of the modules to import
+        :type sdl: Optional[Union[str, List[str]]]
+        :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
+        """
+        if not self._cooked:
+            raise ImproperlyConfigured(
+                "Can't reload an engine which hasn't been cooked."
+            )
+
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+
+        async with self._reload_lock:
+            sdl = sdl or self._sdl
+            if modules is None:
+                modules = self._module_definitions
+            if isinstance(modules, str):
+                modules = [modules]
+
+            previous_schema_info = SchemaRegistry.replace_schema_info(
+                self._schema_name
+            )
+            try:
+                imported_modules, schema = await self._bake_schema(
+                    sdl,
+                    modules,
+                    reload_modules=True,
+                    previous_schema_info=previous_schema_info,
+                )
+                query_executor, subscription_executor = schema.bake_execute(
+                    self._perform_query, self._perform_subsciption
+                )
+                shared_schema = SharedSchema(schema)
+            except Exception:
+                SchemaRegistry.replace_schema_info(
+                    self._schema_name, previous_schema_info
+                )
+                raise
+
+            # Swapped right after the cached documents, without yielding to
+            # the event loop: each execution either uses the previous schema &
+            # documents or the new ones
+            await self._rebind_query_cache(schema)
+            (
+                self._sdl,
+                self._module_definitions,
+                self._modules,
+                self._schema,
+                self._query_executor,
+                self._subcription_executor,
+                self._shared_schema,
+            ) = (
+                sdl,
+                modules,
+                imported_modules,
+                schema,
+                query_executor,
+                subscription_executor,
+                shared_schema,
+            )
+
+            self._options.persisted_query_store.bind(
+                partial(parse_and_validate_query, schema=self._schema),
+                self._schema,
+            )
+            if self._options.persisted_queries_directory:
+                await self._options.persisted_query_store.prewarm(
+                    self._options.persisted_queries_directory,
+                    validate=not self._options.trust_persisted_queries,
+                )
+
+    async def _rebind_query_cache(self, schema: "GraphQLSchema") -> None:
+        """
+        Rebinds the cached documents to a new schema while the requests keep
+        being executed, then swaps them with the cached ones without yielding
+        to the event loop.
+        :param schema: the GraphQLSchema instance to rebind the documents to
+        :type schema: GraphQLSchema
+        """
+        rebound_results = {}
+        for query, result in self._options.query_cache.items():
+            rebound_results[query] = self._rebind_result(query, result, schema)
+            await asyncio.sleep(0)
+
+        # The queries cached while rebinding the documents are rebound during
+        # the swap
+        for query, result in self._options.query_cache.items():
+            self._options.query_cache.replace(
+                query,
+                rebound_results.get(query)
+                or self._rebind_result(query, result, schema),
+            )
+
+    @staticmethod
+    def _rebind_result(
+        query: Union[str, bytes],
+        result: Tuple[
+            Optional["DocumentNode"], Optional[List["TartifletteError"]]
+        ],
+        schema: "GraphQLSchema",
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Rebinds a cached result of the parsing & validation of a query to a
+        new schema. The query is parsed again if it was invalid.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param result: the cached DocumentNode or errors
+        :param schema: the GraphQLSchema instance to rebind the result to
+        :type query: Union[str, bytes]
+        :type result: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        :type schema: GraphQLSchema
+        :return: a DocumentNode bound to the schema or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        document, _ = result
+        if document is None:
+            return parse_and_validate_query(query, schema)
+        return rebind_document(document, schema)
+
+    @property
+    def cooked(self) -> bool:
+        """
+        Returns whether or not the engine has been cooked.
+        :return: whether or not the engine has been cooked
+        :rtype: bool
+        """
+        return self._cooked
+
+    @property
+    def shared_schema(self) -> Optional[SharedSchema]:
+        """
+        Returns the schema of the engine, shared with the engines extending
+        it through their `base_engine` parameter.
+        :return: the schema of the engine shared with the engines extending it
+        :rtype: Optional[SharedSchema]
+        """
+        return self._shared_schema
+
+    @property
+    def options(self) -> Optional[EngineOptions]:
+        """
+        Returns the options of the engine (with its default query cache,
+        persisted query store & execution strategy once cooked).
+        :return: the options of the engine
+        :rtype: Optional[EngineOptions]
+        """
+        return self._options
+
+    @property
+    def query_cache(self) -> Optional[DocumentCache]:
+        """
+        Returns the cache storing the parsed & validated queries of the engine.
+        :return: the cache storing the parsed & validated queries
+        :rtype: Optional[DocumentCache]
+        """
+        return self._options.query_cache if self._options is not None else None
+
+    @property
+    def persisted_query_store(self) -> Optional[PersistedQueryStore]:
+        """
+        Returns the store holding the documents of the persisted queries.
+        :return: the store holding the documents of the persisted queries
+        :rtype: Optional[PersistedQueryStore]
+        """
+        return (
+            self._options.persisted_query_store
+            if self._options is not None
+            else None
+        )
+
+    @property
+    def cost_analyzer(self) -> Optional[QueryCostAnalyzer]:
+        """
+        Returns the analyzer computing the cost of the operations.
+        :return: the analyzer computing the cost of the operations
+        :rtype: Optional[QueryCostAnalyzer]
+        """
+        return (
+            self._options.cost_analyzer if self._options is not None else None
+        )
+
+    async def _load_document_snapshot(self, path: str) -> None:
+        """
+        Loads the documents of a snapshot into the query cache if they have
+        been validated against a schema sharing the fingerprint of the schema
+        of the engine.
+        :param path: path of the snapshot file
+        :type path: str
+        """
+        documents = await asyncio.get_event_loop().run_in_executor(
+            None, load_document_snapshot, path, self._schema.fingerprint
+        )
+        if documents is None:
+            logger.warning(
+                "Document snapshot < %s > is missing or doesn't match the "
+                "schema, documents will be parsed & validated on demand.",
+                path,
+            )
+            return
+
+        for query, document in documents:
+            self._options.query_cache.set(query, (document, None))
+
+    async def dump_document_snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Writes the parsed & validated documents of the query cache into a
+        snapshot file, which can be loaded by the engines sharing the same
+        schema at cook time through the `document_snapshot` parameter in order
+        to start with a warm query cache.
+        :param path: path of the snapshot file (defaults to the
+        `document_snapshot` parameter of the engine)
+        :type path: Optional[str]
+        :return: the number of documents written into the snapshot
+        :rtype: int
+        """
+        path = path or self._options.document_snapshot
+        if not path:
+            raise ImproperlyConfigured(
+                "Please provide a < path > or a < document_snapshot >."
+            )
+
+        documents = [
+            (query, document)
+            for query, (document, _) in self._options.query_cache.items()
+            if document is not None
+            and document.schema_fingerprint == self._schema.fingerprint
+        ]
+        await asyncio.get_event_loop().run_in_executor(
+            None,
+            dump_document_snapshot,
+            path,
+            documents,
+            self._schema.fingerprint,
+        )
+        return len(documents)
+
+    def _parse_and_validate_query(
+        self, query: Union[str, bytes]
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Returns the cached result of the parsing & validation of the query or
+        computes & caches it.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :type query: Union[str, bytes]
+        :return: a DocumentNode representing the query or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        result = self._options.query_cache.get(query)
+        if result is UNDEFINED_VALUE:
+            result = parse_and_validate_query(query, self._schema)
+            self._options.query_cache.set(query, result)
+        return result
+
+    def compute_query_cost(
+        self,
+        query: Union[str, bytes],
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Optional[QueryCost]:
+        """
+        Computes the cost of a GraphQL request without executing it (e.g. in
+        order to rate limit the clients). The parsed & validated query is
+        cached and thus reused by its execution.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param variables: the variables provided in the GraphQL request
+        :type query: Union[str, bytes]
+        :type operation_name: Optional[str]
+        :type variables: Optional[Dict[str, Any]]
+        :return: the cost of the operation to execute or None if the query is
+        invalid
+        :rtype: Optional[QueryCost]
+        """
+        document, errors = self._parse_and_validate_query(query)
+        if errors:
+            return None
+
+        return (
+            self._options.cost_analyzer or QueryCostAnalyzer()
+        ).analyze_document(self._schema, document, operation_name, variables)
+
     async def _perform_subsciption(
         self,
         schema: "GraphQLSchema",
@@ -295,13 +958,14 @@ class Engine:
 
         async for payload in source_event_stream:
             yield await execute(
-                self._schema,
+                schema,
                 document,
                 self._build_response,
                 payload,
                 context,
                 variables,
                 operation_name,
+                self._options.execution_strategy,
             )
 
     async def _perform_query(
@@ -325,6 +989,7 @@ class Engine:
             context,
             variables,
             operation_name,
+            self._options.execution_strategy,
         )
 
     async def execute(
@@ -352,7 +1017,7 @@ class Engine:
         :return: computed response corresponding to the request
         :rtype: Dict[str, Any]
         """
-        document, errors = parse_and_validate_query(query, self._schema)
+        document, errors = self._parse_and_validate_query(query)
 
         # Goes through potential schema directives and finish in self._perfom_query
         return await self._query_executor(
@@ -366,6 +1031,106 @@ class Engine:
             context_coercer=context,
         )
 
+    async def _get_persisted_document(
+        self,
+        schema: "GraphQLSchema",
+        query_id: str,
+        query: Optional[Union[str, bytes]],
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Returns the persisted document linked to the query identifier bound
+        to the schema, after persisting the query if it's provided and isn't
+        persisted yet.
+        :param schema: the GraphQLSchema instance to execute the document on
+        :param query_id: the SHA-256 digest of the query
+        :param query: the GraphQL request / query to persist
+        :type schema: GraphQLSchema
+        :type query_id: str
+        :type query: Optional[Union[str, bytes]]
+        :return: the persisted document or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        document = await self._options.persisted_query_store.get(query_id)
+        if document is None:
+            if (
+                query is None
+                or self._options.persisted_query_store.allow_list_only
+            ):
+                return None, [PersistedQueryNotFound("PersistedQueryNotFound")]
+            if compute_query_id(query) != query_id:
+                return (
+                    None,
+                    [
+                        PersistedQueryMismatch(
+                            "Provided < query_id > doesn't match the query."
+                        )
+                    ],
+                )
+            document, errors = await self._options.persisted_query_store.set(
+                query_id, query
+            )
+            if document is None:
+                return None, errors
+
+        # A document validated against another schema (e.g. persisted while
+        # the engine was reloaded) is validated again against the schema
+        if (
+            document.schema_fingerprint is not None
+            and document.schema_fingerprint != schema.fingerprint
+        ):
+            return rebind_document(document, schema)
+        return document, None
+
+    async def execute_persisted(
+        self,
+        query_id: str,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        query: Optional[Union[str, bytes]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes a persisted GraphQL query/mutation request from its SHA-256
+        digest. If the query isn't persisted yet and is provided, it will be
+        persisted once its digest has been checked (unless the store is an
+        allow-list only store).
+        :param query_id: the SHA-256 digest of the query
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param query: the GraphQL request / query to persist
+        :type query_id: str
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type query: Optional[Union[str, bytes]]
+        :return: computed response corresponding to the request
+        :rtype: Dict[str, Any]
+        """
+        # pylint: disable=too-many-locals
+        # The schema may be swapped by a reload while the store is awaited
+        schema, query_executor = self._schema, self._query_executor
+        document, errors = await self._get_persisted_document(
+            schema, query_id, query
+        )
+
+        # Goes through potential schema directives and finish in self._perfom_query
+        return await query_executor(
+            schema,
+            document,
+            errors,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+            context_coercer=context,
+        )
+
     async def subscribe(
         self,
         query: Union[str, bytes],
@@ -392,7 +1157,7 @@ class Engine:
         :rtype: AsyncIterable[Dict[str, Any]]
         """
 
-        document, errors = parse_and_validate_query(query, self._schema)
+        document, errors = self._parse_and_validate_query(query)
 
         # Goes through potential schema directives and finish in self._perfom_subscription
         async for payload in self._subcription_executor(
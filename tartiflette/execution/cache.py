@@ -0,0 +1,408 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from tartiflette.constants import UNDEFINED_VALUE
+
+__all__ = ("DocumentCache", "LRUDocumentCache", "LFUDocumentCache")
+
+
+class DocumentCache(ABC):
+    """
+    Base class of the caches used by an engine to store the result of the
+    parsing & validation of its queries. An engine owns its own document cache
+    which is thus scoped to the GraphQLSchema instance of the engine.
+
+    The cache is bounded by a maximum number of entries and/or by a maximum
+    cumulated length of the cached queries (their number of characters, or of
+    bytes for the queries provided as bytes) rather than by the size of the
+    cached documents. Subclasses are
+    in charge of the eviction policy by implementing the `_store`, `_touch`,
+    `_pop_victim`, `_remove` & `_replace` methods.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 512,
+        max_query_length: Optional[int] = None,
+    ) -> None:
+        """
+        :param max_size: maximum number of cached documents (unbounded if
+        None)
+        :param max_query_length: maximum cumulated length of the cached
+        queries (unbounded if None)
+        :type max_size: Optional[int]
+        :type max_query_length: Optional[int]
+        """
+        self.max_size = max_size
+        self.max_query_length = max_query_length
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self.query_length = 0
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a DocumentCache instance.
+        :return: the representation of a DocumentCache instance
+        :rtype: str
+        """
+        return "{}(max_size={!r}, max_query_length={!r})".format(
+            self.__class__.__name__, self.max_size, self.max_query_length
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached documents.
+        :return: the number of cached documents
+        :rtype: int
+        """
+        return self.size
+
+    @abstractmethod
+    def __contains__(self, query: Union[str, bytes]) -> bool:
+        """
+        Determines whether or not the query is cached, without altering its
+        eviction priority nor the counters.
+        :param query: the GraphQL request / query
+        :type query: Union[str, bytes]
+        :return: whether or not the query is cached
+        :rtype: bool
+        """
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters of the cache.
+        :return: the counters of the cache
+        :rtype: Dict[str, int]
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "query_length": self.query_length,
+        }
+
+    def get(self, query: Union[str, bytes]) -> Any:
+        """
+        Returns the cached value linked to the query or UNDEFINED_VALUE if the
+        query isn't cached.
+        :param query: the GraphQL request / query
+        :type query: Union[str, bytes]
+        :return: the cached value or UNDEFINED_VALUE
+        :rtype: Any
+        """
+        try:
+            value = self._touch(query)
+        except KeyError:
+            self.misses += 1
+            return UNDEFINED_VALUE
+        self.hits += 1
+        return value
+
+    def set(self, query: Union[str, bytes], value: Any) -> None:
+        """
+        Caches the value linked to the query and evicts the entries which
+        exceed the bounds of the cache.
+        :param query: the GraphQL request / query
+        :param value: the value to cache
+        :type query: Union[str, bytes]
+        :type value: Any
+        """
+        weight = len(query)
+        if (self.max_size is not None and self.max_size < 1) or (
+            self.max_query_length is not None
+            and weight > self.max_query_length
+        ):
+            return
+
+        try:
+            self.query_length -= self._remove(query)
+            self.size -= 1
+        except KeyError:
+            pass
+
+        while (self.max_size is not None and self.size >= self.max_size) or (
+            self.max_query_length is not None
+            and self.query_length + weight > self.max_query_length
+        ):
+            self.query_length -= self._pop_victim()
+            self.size -= 1
+            self.evictions += 1
+
+        self._store(query, value, weight)
+        self.size += 1
+        self.query_length += weight
+
+    def replace(self, query: Union[str, bytes], value: Any) -> None:
+        """
+        Replaces the value linked to an already cached query without altering
+        its eviction priority nor the counters (e.g. to rebind the cached
+        documents to a new schema). Does nothing if the query isn't cached.
+        :param query: the GraphQL request / query
+        :param value: the value to cache
+        :type query: Union[str, bytes]
+        :type value: Any
+        """
+        try:
+            self._replace(query, value)
+        except KeyError:
+            pass
+
+    def remove(self, query: Union[str, bytes]) -> None:
+        """
+        Removes a cached query without counting it as an eviction (e.g. to
+        remove the documents which can't be bound to a new schema). Does
+        nothing if the query isn't cached.
+        :param query: the GraphQL request / query
+        :type query: Union[str, bytes]
+        """
+        try:
+            self.query_length -= self._remove(query)
+            self.size -= 1
+        except KeyError:
+            pass
+
+    def clear(self) -> None:
+        """
+        Removes all the cached entries and resets the counters.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self.query_length = 0
+
+    @abstractmethod
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Returns the cached queries and their values, from the first to the
+        last to be evicted.
+        :return: the cached queries and their values
+        :rtype: List[Tuple[Hashable, Any]]
+        """
+
+    @abstractmethod
+    def _store(self, key: Hashable, value: Any, weight: int) -> None:
+        """
+        Stores a new entry, which isn't cached yet, with the lowest eviction
+        priority of the new entries.
+        :param key: the GraphQL request / query
+        :param value: the value to cache
+        :param weight: the length of the query
+        :type key: Hashable
+        :type value: Any
+        :type weight: int
+        """
+
+    @abstractmethod
+    def _touch(self, key: Hashable) -> Any:
+        """
+        Returns the value of a cached entry and updates its eviction priority
+        as it's being used.
+        :param key: the GraphQL request / query
+        :type key: Hashable
+        :return: the cached value
+        :rtype: Any
+        :raises KeyError: if the query isn't cached
+        """
+
+    @abstractmethod
+    def _pop_victim(self) -> int:
+        """
+        Removes the entry to evict first according to the eviction policy.
+        :return: the length of the query of the evicted entry
+        :rtype: int
+        """
+
+    @abstractmethod
+    def _replace(self, key: Hashable, value: Any) -> None:
+        """
+        Replaces the value of a cached entry without altering its eviction
+        priority.
+        :param key: the GraphQL request / query
+        :param value: the value to cache
+        :type key: Hashable
+        :type value: Any
+        :raises KeyError: if the query isn't cached
+        """
+
+    @abstractmethod
+    def _remove(self, key: Hashable) -> int:
+        """
+        Removes a cached entry.
+        :param key: the GraphQL request / query
+        :type key: Hashable
+        :return: the length of the query of the removed entry
+        :rtype: int
+        :raises KeyError: if the query isn't cached
+        """
+
+
+class LRUDocumentCache(DocumentCache):
+    """
+    Document cache which evicts the least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 512,
+        max_query_length: Optional[int] = None,
+    ) -> None:
+        """
+        :param max_size: maximum number of cached documents (unbounded if
+        None)
+        :param max_query_length: maximum cumulated length of the cached
+        queries (unbounded if None)
+        :type max_size: Optional[int]
+        :type max_query_length: Optional[int]
+        """
+        super().__init__(max_size, max_query_length)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+
+    def clear(self) -> None:
+        """
+        Removes all the cached entries and resets the counters.
+        """
+        super().clear()
+        self._entries.clear()
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Returns the cached queries and their values, from the least to the
+        most recently used.
+        :return: the cached queries and their values
+        :rtype: List[Tuple[Hashable, Any]]
+        """
+        return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def __contains__(self, query: Union[str, bytes]) -> bool:
+        """
+        Determines whether or not the query is cached, without altering its
+        eviction priority nor the counters.
+        :param query: the GraphQL request / query
+        :type query: Union[str, bytes]
+        :return: whether or not the query is cached
+        :rtype: bool
+        """
+        return query in self._entries
+
+    def _store(self, key: Hashable, value: Any, weight: int) -> None:
+        self._entries[key] = (value, weight)
+
+    def _touch(self, key: Hashable) -> Any:
+        value, _ = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+
+    def _pop_victim(self) -> int:
+        _, (_, weight) = self._entries.popitem(last=False)
+        return weight
+
+    def _remove(self, key: Hashable) -> int:
+        _, weight = self._entries.pop(key)
+        return weight
+
+    def _replace(self, key: Hashable, value: Any) -> None:
+        _, weight = self._entries[key]
+        self._entries[key] = (value, weight)
+
+
+class LFUDocumentCache(DocumentCache):
+    """
+    Document cache which evicts the least frequently used entries first (the
+    least recently used one among entries with the same frequency).
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 512,
+        max_query_length: Optional[int] = None,
+    ) -> None:
+        """
+        :param max_size: maximum number of cached documents (unbounded if
+        None)
+        :param max_query_length: maximum cumulated length of the cached
+        queries (unbounded if None)
+        :type max_size: Optional[int]
+        :type max_query_length: Optional[int]
+        """
+        super().__init__(max_size, max_query_length)
+        # key -> [value, weight, frequency]
+        self._entries: Dict[Hashable, list] = {}
+        # frequency -> keys ordered from the least to the most recently used
+        self._frequencies: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_frequency = 0
+
+    def clear(self) -> None:
+        """
+        Removes all the cached entries and resets the counters.
+        """
+        super().clear()
+        self._entries.clear()
+        self._frequencies.clear()
+        self._min_frequency = 0
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Returns the cached queries and their values, from the least to the
+        most frequently used.
+        :return: the cached queries and their values
+        :rtype: List[Tuple[Hashable, Any]]
+        """
+        return [
+            (key, self._entries[key][0])
+            for frequency in sorted(self._frequencies)
+            for key in self._frequencies[frequency]
+        ]
+
+    def __contains__(self, query: Union[str, bytes]) -> bool:
+        """
+        Determines whether or not the query is cached, without altering its
+        eviction priority nor the counters.
+        :param query: the GraphQL request / query
+        :type query: Union[str, bytes]
+        :return: whether or not the query is cached
+        :rtype: bool
+        """
+        return query in self._entries
+
+    def _unlink(self, key: Hashable, frequency: int) -> None:
+        keys = self._frequencies[frequency]
+        del keys[key]
+        if not keys:
+            del self._frequencies[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency += 1
+
+    def _store(self, key: Hashable, value: Any, weight: int) -> None:
+        self._entries[key] = [value, weight, 1]
+        self._frequencies.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def _touch(self, key: Hashable) -> Any:
+        entry = self._entries[key]
+        self._unlink(key, entry[2])
+        entry[2] += 1
+        self._frequencies.setdefault(entry[2], OrderedDict())[key] = None
+        return entry[0]
+
+    def _pop_victim(self) -> int:
+        key, _ = self._frequencies[self._min_frequency].popitem(last=False)
+        if not self._frequencies[self._min_frequency]:
+            del self._frequencies[self._min_frequency]
+            self._min_frequency = min(self._frequencies, default=0)
+        return self._entries.pop(key)[1]
+
+    def _remove(self, key: Hashable) -> int:
+        _, weight, frequency = self._entries.pop(key)
+        self._unlink(key, frequency)
+        if self._frequencies:
+            self._min_frequency = min(self._frequencies)
+        return weight
+
+    def _replace(self, key: Hashable, value: Any) -> None:
+        self._entries[key][0] = value
@@ -1,5 +1,5 @@
-from functools import lru_cache
-from typing import Dict, List, Optional, Set, Tuple, Union
+from copy import copy
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from tartiflette.execution.nodes.variable_definition import (
     variable_definition_node_to_executable,
@@ -8,8 +8,12 @@ from tartiflette.language.ast import (
     FieldNode,
     FragmentSpreadNode,
     InlineFragmentNode,
+    VariableNode,
 )
 from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.validators import Validators
+from tartiflette.language.validators.query import RULE_SET
+from tartiflette.language.validators.visitor import ValidationVisitor
 from tartiflette.types.exceptions.tartiflette import (
     SkipCollection,
     TartifletteError,
@@ -23,27 +27,35 @@ from tartiflette.utils.type_from_ast import schema_type_from_ast
 
 __all__ = (
     "parse_and_validate_query",
+    "reuse_document",
+    "rebind_document",
+    "has_only_builtin_inclusion_directives",
     "collect_executable_variable_definitions",
     "collect_fields",
     "collect_subfields",
 )
 
+_VALIDATION_VISITOR = ValidationVisitor(RULE_SET)
+
 
-@lru_cache(maxsize=512)
 def parse_and_validate_query(
-    query: Union[str, bytes], schema: "GraphQLSchema"
+    query: Union[str, bytes], schema: "GraphQLSchema", validate: bool = True
 ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
     """
-    Analyzes & validates a query by converting it to a DocumentNode.
+    Analyzes & validates a query by converting it to a DocumentNode. The
+    validation can be skipped for queries coming from a trusted source (e.g.
+    an allow-list of persisted queries).
     :param query: the GraphQL request / query as UTF8-encoded string
     :type query: Union[str, bytes]
     :param schema: the GraphQLSchema instance linked to the engine
     :type schema: GraphQLSchema
+    :param validate: whether or not the query should be validated
+    :type validate: bool
     :return: a DocumentNode representing the query
     :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
     """
     try:
-        document: "DocumentNode" = parse_to_document(query, schema)
+        document: "DocumentNode" = parse_to_document(query, schema, validate)
     except TartifletteError as e:
         return None, [e]
     except Exception as e:  # pylint: disable=broad-except
@@ -58,7 +70,75 @@ def parse_and_validate_query(
     return document, None
 
 
-@lru_cache(maxsize=512)
+def reuse_document(document: "DocumentNode", schema: "GraphQLSchema") -> bool:
+    """
+    Determines whether or not a document validated against another
+    GraphQLSchema instance can be reused with the schema without being
+    validated again, which is the case when both schemas share the same
+    fingerprint. The caches of the document bound to the previous schema
+    instance (execution plans, wrapped resolvers & executable variable
+    definitions) are reset once reused.
+    :param document: the DocumentNode instance to reuse
+    :param schema: the GraphQLSchema instance linked to the engine
+    :type document: DocumentNode
+    :type schema: GraphQLSchema
+    :return: whether or not the document can be reused
+    :rtype: bool
+    """
+    if (
+        document.schema_fingerprint is None
+        or document.schema_fingerprint != schema.fingerprint
+    ):
+        return False
+
+    document.execution_plans = {}
+    document.directive_resolvers = {}
+    document.variable_definitions = {}
+    return True
+
+
+def rebind_document(
+    document: "DocumentNode", schema: "GraphQLSchema"
+) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+    """
+    Returns a copy of a document validated against another GraphQLSchema
+    instance, bound to the schema. The copy is reused as is when both schemas
+    share the same fingerprint, otherwise its definitions are validated again
+    against the schema, without parsing the query again. The caches of the
+    document are left untouched, so that it can still be executed against
+    the other schema.
+    :param document: the DocumentNode instance to rebind
+    :param schema: the GraphQLSchema instance to rebind the document to
+    :type document: DocumentNode
+    :type schema: GraphQLSchema
+    :return: the DocumentNode bound to the schema or the validation errors
+    :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+    """
+    # The copy of a DocumentNode is created with empty caches
+    rebound_document = copy(document)
+    if reuse_document(rebound_document, schema):
+        return rebound_document, None
+
+    validators = Validators(schema, RULE_SET)
+    rebound_document.validators = validators
+    rebound_document.costs = {}
+    try:
+        _VALIDATION_VISITOR.visit(rebound_document, validators)
+    except TartifletteError as e:
+        return None, [e]
+    except Exception as e:  # pylint: disable=broad-except
+        return (
+            None,
+            [to_graphql_error(e, message="Server encountered an error.")],
+        )
+
+    if validators.errors:
+        return None, validators.errors
+
+    rebound_document.schema_fingerprint = schema.fingerprint
+    return rebound_document, None
+
+
 def collect_executable_variable_definitions(
     schema: "GraphQLSchema",
     document: "DocumentNode",
@@ -66,7 +146,9 @@ def collect_executable_variable_definitions(
 ) -> List["ExecutableVariableDefinition"]:
     """
     Go recursively through all variable definition AST nodes to convert them as
-    executable variable definition.
+    executable variable definition. The executable variable definitions are
+    stored on the document, bound to the schema, in order to be reused by the
+    next requests.
     :param schema: the GraphQLSchema instance linked to the engine
     :param document: the DocumentNode instance linked to the GraphQL request
     :param operation: the AST operation definition node to execute
@@ -76,16 +158,88 @@ def collect_executable_variable_definitions(
     :return: a list of executable variable definition
     :rtype: List[ExecutableVariableDefinition]
     """
-    # pylint: disable=unused-argument
-    if not operation.variable_definitions:
-        return []
+    # Nodes are owned by the document which owns the variable definitions,
+    # their identities are thus stable for the lifetime of the definitions
+    key = id(operation)
+    variable_definitions = document.variable_definitions
+    if key not in variable_definitions:
+        variable_definitions[key] = [
+            variable_definition_node_to_executable(
+                schema, variable_definition_node
+            )
+            for variable_definition_node in operation.variable_definitions
+            or []
+        ]
+    return variable_definitions[key]
+
+
+# Modules implementing the built-in @skip & @include directives, the
+# directives are recognized by name and by the module of their implementation
+_BUILTIN_INCLUSION_DIRECTIVES = {
+    "skip": "tartiflette.directive.builtins.skip",
+    "include": "tartiflette.directive.builtins.include",
+}
+
 
-    return [
-        variable_definition_node_to_executable(
-            schema, variable_definition_node
+def has_only_builtin_inclusion_directives(
+    schema: "GraphQLSchema", directive_nodes: List["DirectiveNode"]
+) -> bool:
+    """
+    Determines whether or not the directive nodes are only built-in @skip &
+    @include directives whose implementation hasn't been overridden.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param directive_nodes: list of AST directive node to check
+    :type schema: GraphQLSchema
+    :type directive_nodes: List[DirectiveNode]
+    :return: whether or not the directive nodes are only built-in @skip &
+    @include directives
+    :rtype: bool
+    """
+    for directive_node in directive_nodes:
+        directive_name = directive_node.name.value
+        implementation_module_name = _BUILTIN_INCLUSION_DIRECTIVES.get(
+            directive_name
         )
-        for variable_definition_node in operation.variable_definitions
-    ]
+        if implementation_module_name is None or (
+            getattr(
+                schema.find_directive(directive_name).implementation,
+                "__module__",
+                None,
+            )
+            != implementation_module_name
+        ):
+            return False
+    return True
+
+
+def evaluate_inclusion_directives(
+    directive_nodes: List["DirectiveNode"],
+    variable_values: Optional[Dict[str, Any]],
+) -> bool:
+    """
+    Synchronously evaluates built-in @skip & @include directive nodes, where
+    @skip has higher precedence than @include.
+    :param directive_nodes: list of AST @skip/@include directive node
+    :param variable_values: the variables provided in the GraphQL request
+    :type directive_nodes: List[DirectiveNode]
+    :type variable_values: Optional[Dict[str, Any]]
+    :return: whether or not the node should be collected or skipped
+    :rtype: bool
+    """
+    for directive_node in directive_nodes:
+        value = None
+        for argument in directive_node.arguments:
+            if argument.name.value == "if":
+                value = (
+                    (variable_values or {}).get(argument.value.name.value)
+                    if isinstance(argument.value, VariableNode)
+                    else argument.value.value
+                )
+                break
+
+        if bool(value) is (directive_node.name.value == "skip"):
+            return False
+    return True
 
 
 async def should_include_node(
@@ -105,6 +259,13 @@ async def should_include_node(
     if not node.directives:
         return True
 
+    if has_only_builtin_inclusion_directives(
+        execution_context.schema, node.directives
+    ):
+        return evaluate_inclusion_directives(
+            node.directives, execution_context.variable_values
+        )
+
     hook_name = (
         "on_field_collection"
         if isinstance(node, FieldNode)
@@ -218,7 +379,9 @@ async def collect_fields(
 
     for selection in selection_set.selections:
         if isinstance(selection, FieldNode):
-            if not await should_include_node(execution_context, selection):
+            if selection.directives and not await should_include_node(
+                execution_context, selection
+            ):
                 continue
             fields.setdefault(get_field_entry_key(selection), []).append(
                 selection
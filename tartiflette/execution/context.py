@@ -1,9 +1,11 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from tartiflette.coercers.variables import coerce_variables
 from tartiflette.execution.collect import (
     collect_executable_variable_definitions,
 )
+from tartiflette.execution.loader import DataLoaderRegistry
+from tartiflette.execution.strategies import gather_strategy
 from tartiflette.language.ast import OperationDefinitionNode
 from tartiflette.types.exceptions.tartiflette import (
     MultipleException,
@@ -28,6 +30,11 @@ class ExecutionContext:
         "root_value",
         "variable_values",
         "errors",
+        "execution_plans",
+        "dynamic_execution_plans",
+        "directive_resolvers",
+        "loaders",
+        "execution_strategy",
     )
 
     def __init__(
@@ -38,6 +45,9 @@ class ExecutionContext:
         context: Optional[Any],
         root_value: Optional[Any],
         variable_values: Optional[Dict[str, Any]],
+        execution_plans: Optional[Dict[Any, Any]] = None,
+        directive_resolvers: Optional[Dict[Any, Callable]] = None,
+        execution_strategy: Optional[Callable] = None,
     ) -> None:
         """
         :param schema: the GraphQLSchema instance linked to the engine
@@ -49,12 +59,20 @@ class ExecutionContext:
         :param root_value: an initial value corresponding to the root type
         being executed
         :param variable_values: the variables provided in the GraphQL request
+        :param execution_plans: the execution plans computed for the document
+        :param directive_resolvers: the resolvers wrapped with the directives
+        of the document
+        :param execution_strategy: coroutine in charge of executing the
+        coroutines of the fields & list items
         :type schema: GraphQLSchema
         :type fragments: Dict[str, FragmentDefinitionNode]
         :type operation: OperationDefinitionNode
         :type context: Optional[Any]
         :type root_value: Optional[Any]
         :type variable_values: Optional[Dict[str, Any]]
+        :type execution_plans: Optional[Dict[Any, Any]]
+        :type directive_resolvers: Optional[Dict[Any, Callable]]
+        :type execution_strategy: Optional[Callable]
         """
         # pylint: disable=too-many-arguments,too-many-locals
         self.schema = schema
@@ -64,6 +82,15 @@ class ExecutionContext:
         self.root_value = root_value
         self.variable_values = variable_values
         self.errors: List["TartifletteError"] = []
+        self.execution_plans = (
+            execution_plans if execution_plans is not None else {}
+        )
+        self.dynamic_execution_plans: Dict[Any, Any] = {}
+        self.directive_resolvers = (
+            directive_resolvers if directive_resolvers is not None else {}
+        )
+        self.loaders = DataLoaderRegistry()
+        self.execution_strategy = execution_strategy or gather_strategy
 
     def add_error(
         self,
@@ -107,6 +134,7 @@ async def build_execution_context(
     context: Optional[Any],
     raw_variable_values: Optional[Dict[str, Any]],
     operation_name: str,
+    execution_strategy: Optional[Callable] = None,
 ) -> Tuple[Optional["ExecutionContext"], Optional[List["TartifletteError"]]]:
     """
     Factory function to build and return an ExecutionContext instance.
@@ -118,12 +146,15 @@ async def build_execution_context(
     accessible from the resolvers
     :param raw_variable_values: the variables provided in the GraphQL request
     :param operation_name: the operation name to execute
+    :param execution_strategy: coroutine in charge of executing the coroutines
+    of the fields & list items
     :type schema: GraphQLSchema
     :type document: DocumentNode
     :type root_value: Optional[Any]
     :type context: Optional[Any]
     :type raw_variable_values: Optional[Dict[str, Any]]
     :type operation_name: str
+    :type execution_strategy: Optional[Callable]
     :return: an ExecutionContext instance
     :rtype: Tuple[Optional[ExecutionContext], Optional[List[TartifletteError]]]
     """
@@ -167,6 +198,21 @@ async def build_execution_context(
 
         if variable_errors:
             errors.extend(variable_errors)
+        elif schema.cost_analyzer is not None:
+            # The cost computed while validating the document doesn't take
+            # into account the values of the variables used as multipliers
+            query_cost = document.costs.get(
+                operation.name.value if operation.name else None
+            )
+            if query_cost is None or query_cost.variables:
+                errors.extend(
+                    schema.cost_analyzer.validate(
+                        operation,
+                        schema.cost_analyzer.analyze(
+                            schema, operation, fragments, variable_values
+                        ),
+                    )
+                )
 
     if errors:
         return None, errors
@@ -179,6 +225,9 @@ async def build_execution_context(
             context=context,
             root_value=root_value,
             variable_values=variable_values,
+            execution_plans=document.execution_plans,
+            directive_resolvers=document.directive_resolvers,
+            execution_strategy=execution_strategy,
         ),
         None,
     )
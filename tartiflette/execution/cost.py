@@ -0,0 +1,512 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from tartiflette.language.ast import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    ListValueNode,
+    OperationDefinitionNode,
+    VariableNode,
+)
+from tartiflette.utils.errors import graphql_error_from_nodes
+
+__all__ = ("QueryCost", "QueryCostAnalyzer")
+
+_EXTENSIONS = {
+    "rule": None,
+    "spec": None,
+    "details": None,
+    "tag": "query-cost",
+}
+
+
+class QueryCost:
+    """
+    Cost of an operation computed by a QueryCostAnalyzer.
+    """
+
+    __slots__ = ("cost", "depth", "fields", "variables")
+
+    def __init__(
+        self, cost: int, depth: int, fields: int, variables: Set[str]
+    ) -> None:
+        """
+        :param cost: total cost of the operation
+        :param depth: maximum depth of the fields of the operation
+        :param fields: number of fields selected by the operation once its
+        fragments have been expanded
+        :param variables: names of the variables used as multipliers
+        :type cost: int
+        :type depth: int
+        :type fields: int
+        :type variables: Set[str]
+        """
+        self.cost = cost
+        self.depth = depth
+        self.fields = fields
+        self.variables = variables
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Returns True if `other` instance is identical to `self`.
+        :param other: object instance to compare to `self`
+        :type other: Any
+        :return: whether or not `other` is identical to `self`
+        :rtype: bool
+        """
+        return self is other or (
+            isinstance(other, QueryCost)
+            and self.cost == other.cost
+            and self.depth == other.depth
+            and self.fields == other.fields
+            and self.variables == other.variables
+        )
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a QueryCost instance.
+        :return: the representation of a QueryCost instance
+        :rtype: str
+        """
+        return "QueryCost(cost=%r, depth=%r, fields=%r, variables=%r)" % (
+            self.cost,
+            self.depth,
+            self.fields,
+            self.variables,
+        )
+
+
+def _get_multiplier_value(
+    value_node: "ValueNode", variable_values: Dict[str, Any]
+) -> Optional[int]:
+    """
+    Returns the multiplier corresponding to an argument value, which is the
+    value of integers or the length of lists.
+    :param value_node: AST node of the argument value
+    :param variable_values: values of the variables of the operation
+    :type value_node: ValueNode
+    :type variable_values: Dict[str, Any]
+    :return: the multiplier corresponding to the argument value
+    :rtype: Optional[int]
+    """
+    if isinstance(value_node, IntValueNode):
+        return int(value_node.value)
+    if isinstance(value_node, ListValueNode):
+        return len(value_node.values)
+    if isinstance(value_node, VariableNode):
+        value = variable_values.get(value_node.name.value)
+        if isinstance(value, list):
+            return len(value)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def _get_default_variable_values(
+    operation: "OperationDefinitionNode",
+) -> Dict[str, Any]:
+    """
+    Returns the default values of the variables of the operation which can
+    be used as multipliers.
+    :param operation: the operation whose variables to look at
+    :type operation: OperationDefinitionNode
+    :return: the default values of the variables of the operation
+    :rtype: Dict[str, Any]
+    """
+    variable_values = {}
+    for variable_definition in operation.variable_definitions or []:
+        default_value = variable_definition.default_value
+        if isinstance(default_value, IntValueNode):
+            variable_values[variable_definition.variable.name.value] = int(
+                default_value.value
+            )
+        elif isinstance(default_value, ListValueNode):
+            variable_values[variable_definition.variable.name.value] = [
+                None
+            ] * len(default_value.values)
+    return variable_values
+
+
+class QueryCostAnalyzer:
+    """
+    Computes the cost of the operations and rejects the ones exceeding the
+    configured limits before any of their fields is resolved.
+
+    The cost of a field is its complexity (`default_complexity` unless
+    defined through the `complexity` argument of a `@cost` directive on the
+    field definition) added to the cost of its sub-fields, multiplied by the
+    values of the arguments listed in the `multipliers` argument of the
+    directive (the length is used for list values).
+
+    :Example:
+
+    >>> directive @cost(
+    >>>   complexity: Int
+    >>>   multipliers: [String!]
+    >>> ) on FIELD_DEFINITION
+    >>>
+    >>> type Query {
+    >>>   dogs(first: Int!): [Dog] @cost(complexity: 2, multipliers: ["first"])
+    >>> }
+    """
+
+    def __init__(
+        self,
+        max_cost: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_fields: Optional[int] = None,
+        default_complexity: int = 1,
+        directive_name: str = "cost",
+    ) -> None:
+        """
+        :param max_cost: maximum cost of an operation
+        :param max_depth: maximum depth of the fields of an operation
+        :param max_fields: maximum number of fields selected by an operation
+        once its fragments have been expanded
+        :param default_complexity: complexity of the fields without `@cost`
+        directive
+        :param directive_name: name of the directive providing the cost hints
+        :type max_cost: Optional[int]
+        :type max_depth: Optional[int]
+        :type max_fields: Optional[int]
+        :type default_complexity: int
+        :type directive_name: str
+        """
+        # pylint: disable=too-many-arguments
+        self.max_cost = max_cost
+        self.max_depth = max_depth
+        self.max_fields = max_fields
+        self.default_complexity = default_complexity
+        self.directive_name = directive_name
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a QueryCostAnalyzer instance.
+        :return: the representation of a QueryCostAnalyzer instance
+        :rtype: str
+        """
+        return (
+            "{}(max_cost={!r}, max_depth={!r}, max_fields={!r}, "
+            "default_complexity={!r}, directive_name={!r})".format(
+                self.__class__.__name__,
+                self.max_cost,
+                self.max_depth,
+                self.max_fields,
+                self.default_complexity,
+                self.directive_name,
+            )
+        )
+
+    def _get_field_hints(
+        self, field_definition: Optional["GraphQLField"]
+    ) -> Tuple[int, List[str]]:
+        """
+        Returns the complexity & the multiplier argument names of a field.
+        :param field_definition: GraphQLField instance of the field
+        :type field_definition: Optional[GraphQLField]
+        :return: the complexity & the multiplier argument names of the field
+        :rtype: Tuple[int, List[str]]
+        """
+        complexity = self.default_complexity
+        multipliers = []
+        if field_definition is None:
+            return complexity, multipliers
+
+        for directive in field_definition.directives or []:
+            if directive.name.value != self.directive_name:
+                continue
+
+            for argument in directive.arguments or []:
+                if argument.name.value == "complexity" and isinstance(
+                    argument.value, IntValueNode
+                ):
+                    complexity = int(argument.value.value)
+                elif argument.name.value == "multipliers" and isinstance(
+                    argument.value, ListValueNode
+                ):
+                    multipliers = [
+                        value.value for value in argument.value.values
+                    ]
+        return complexity, multipliers
+
+    def _analyze_field(
+        self,
+        schema: "GraphQLSchema",
+        parent_type_name: str,
+        field_node: "FieldNode",
+        fragments: Dict[str, "FragmentDefinitionNode"],
+        variable_values: Dict[str, Any],
+        visited_fragments: Dict[str, Optional[Tuple[int, int, int]]],
+        variables: Set[str],
+    ) -> Tuple[int, int, int]:
+        """
+        Computes the cost, the depth & the number of fields of a field.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param parent_type_name: name of the field's parent type
+        :param field_node: AST node of the field
+        :param fragments: fragment definitions of the document
+        :param variable_values: values of the variables of the operation
+        :param visited_fragments: costs of the already analyzed fragments
+        :param variables: names of the variables used as multipliers
+        :type schema: GraphQLSchema
+        :type parent_type_name: str
+        :type field_node: FieldNode
+        :type fragments: Dict[str, FragmentDefinitionNode]
+        :type variable_values: Dict[str, Any]
+        :type visited_fragments: Dict[str, Optional[Tuple[int, int, int]]]
+        :type variables: Set[str]
+        :return: the cost, the depth & the number of fields of the field
+        :rtype: Tuple[int, int, int]
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        field_definition = schema.field_definitions.get(
+            (parent_type_name, field_node.name.value)
+        )
+        complexity, multiplier_names = self._get_field_hints(field_definition)
+
+        cost, depth, fields = 0, 0, 0
+        if field_node.selection_set and field_definition is not None:
+            field_type = field_definition.graphql_type
+            while field_type.is_wrapping_type:
+                field_type = field_type.wrapped_type
+
+            cost, depth, fields = self._analyze_selection_set(
+                schema,
+                field_type.name,
+                field_node.selection_set,
+                fragments,
+                variable_values,
+                visited_fragments,
+                variables,
+            )
+
+        multiplier = 1
+        for argument in field_node.arguments or []:
+            if argument.name.value not in multiplier_names:
+                continue
+
+            if isinstance(argument.value, VariableNode):
+                variables.add(argument.value.name.value)
+
+            value = _get_multiplier_value(argument.value, variable_values)
+            if value is not None and value >= 0:
+                multiplier *= value
+
+        return (complexity + cost) * multiplier, depth + 1, fields + 1
+
+    def _analyze_selection_set(
+        self,
+        schema: "GraphQLSchema",
+        parent_type_name: str,
+        selection_set: "SelectionSetNode",
+        fragments: Dict[str, "FragmentDefinitionNode"],
+        variable_values: Dict[str, Any],
+        visited_fragments: Dict[str, Optional[Tuple[int, int, int]]],
+        variables: Set[str],
+    ) -> Tuple[int, int, int]:
+        """
+        Computes the cost, the depth & the number of fields of a selection
+        set. The fragments are analyzed once whatever the number of times
+        they are spread.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param parent_type_name: name of the selection set's parent type
+        :param selection_set: AST node of the selection set
+        :param fragments: fragment definitions of the document
+        :param variable_values: values of the variables of the operation
+        :param visited_fragments: costs of the already analyzed fragments
+        :param variables: names of the variables used as multipliers
+        :type schema: GraphQLSchema
+        :type parent_type_name: str
+        :type selection_set: SelectionSetNode
+        :type fragments: Dict[str, FragmentDefinitionNode]
+        :type variable_values: Dict[str, Any]
+        :type visited_fragments: Dict[str, Optional[Tuple[int, int, int]]]
+        :type variables: Set[str]
+        :return: the cost, the depth & the number of fields of the selection
+        set
+        :rtype: Tuple[int, int, int]
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        cost, depth, fields = 0, 0, 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                result = self._analyze_field(
+                    schema,
+                    parent_type_name,
+                    selection,
+                    fragments,
+                    variable_values,
+                    visited_fragments,
+                    variables,
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                result = self._analyze_selection_set(
+                    schema,
+                    selection.type_condition.name.value
+                    if selection.type_condition
+                    else parent_type_name,
+                    selection.selection_set,
+                    fragments,
+                    variable_values,
+                    visited_fragments,
+                    variables,
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment_name = selection.name.value
+                if fragment_name not in visited_fragments:
+                    fragment = fragments.get(fragment_name)
+                    if fragment is None:
+                        continue
+
+                    # Marks the fragment as visited in order to ignore cycles
+                    visited_fragments[fragment_name] = None
+                    visited_fragments[
+                        fragment_name
+                    ] = self._analyze_selection_set(
+                        schema,
+                        fragment.type_condition.name.value,
+                        fragment.selection_set,
+                        fragments,
+                        variable_values,
+                        visited_fragments,
+                        variables,
+                    )
+
+                result = visited_fragments[fragment_name]
+                if result is None:
+                    continue
+            else:
+                continue
+
+            cost += result[0]
+            depth = max(depth, result[1])
+            fields += result[2]
+        return cost, depth, fields
+
+    def analyze(
+        self,
+        schema: "GraphQLSchema",
+        operation: "OperationDefinitionNode",
+        fragments: Dict[str, "FragmentDefinitionNode"],
+        variable_values: Optional[Dict[str, Any]] = None,
+    ) -> QueryCost:
+        """
+        Computes the cost of an operation. When the values of the variables
+        aren't provided, the default values of the variables are used and the
+        variables without default value aren't taken into account.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param operation: the operation to analyze
+        :param fragments: fragment definitions of the document
+        :param variable_values: values of the variables of the operation
+        :type schema: GraphQLSchema
+        :type operation: OperationDefinitionNode
+        :type fragments: Dict[str, FragmentDefinitionNode]
+        :type variable_values: Optional[Dict[str, Any]]
+        :return: the cost of the operation
+        :rtype: QueryCost
+        """
+        variables = set()
+        cost, depth, fields = self._analyze_selection_set(
+            schema,
+            getattr(
+                schema, f"{operation.operation_type.lower()}_operation_name"
+            ),
+            operation.selection_set,
+            fragments,
+            variable_values
+            if variable_values is not None
+            else _get_default_variable_values(operation),
+            {},
+            variables,
+        )
+        return QueryCost(cost, depth, fields, variables)
+
+    def analyze_document(
+        self,
+        schema: "GraphQLSchema",
+        document: "DocumentNode",
+        operation_name: Optional[str] = None,
+        variable_values: Optional[Dict[str, Any]] = None,
+    ) -> Optional[QueryCost]:
+        """
+        Returns the cost of the operation of the document to execute, which
+        is the one computed during the validation of the document unless it
+        depends on the provided variable values.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param document: the DocumentNode instance linked to the request
+        :param operation_name: the operation name to execute
+        :param variable_values: values of the variables of the operation
+        :type schema: GraphQLSchema
+        :type document: DocumentNode
+        :type operation_name: Optional[str]
+        :type variable_values: Optional[Dict[str, Any]]
+        :return: the cost of the operation or None if there is no operation
+        to execute
+        :rtype: Optional[QueryCost]
+        """
+        operations = {}
+        fragments = {}
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                operations[
+                    definition.name.value if definition.name else None
+                ] = definition
+            else:
+                fragments[definition.name.value] = definition
+
+        if operation_name:
+            operation = operations.get(operation_name)
+        elif len(operations) == 1:
+            operation = next(iter(operations.values()))
+        else:
+            return None
+
+        if operation is None:
+            return None
+
+        query_cost = document.costs.get(
+            operation.name.value if operation.name else None
+        )
+        if query_cost is None or (
+            variable_values is not None and query_cost.variables
+        ):
+            query_cost = self.analyze(
+                schema, operation, fragments, variable_values
+            )
+        return query_cost
+
+    def validate(
+        self, operation: "OperationDefinitionNode", query_cost: QueryCost
+    ) -> List["TartifletteError"]:
+        """
+        Returns the errors related to the limits exceeded by the operation.
+        :param operation: the analyzed operation
+        :param query_cost: the cost of the operation
+        :type operation: OperationDefinitionNode
+        :type query_cost: QueryCost
+        :return: the errors related to the exceeded limits
+        :rtype: List[TartifletteError]
+        """
+        operation_label = (
+            f"Operation < {operation.name.value} >"
+            if operation.name
+            else "Anonymous operation"
+        )
+
+        errors = []
+        for value, limit, name in (
+            (query_cost.cost, self.max_cost, "cost"),
+            (query_cost.depth, self.max_depth, "depth"),
+            (query_cost.fields, self.max_fields, "number of fields"),
+        ):
+            if limit is not None and value > limit:
+                errors.append(
+                    graphql_error_from_nodes(
+                        f"{operation_label} has a {name} of < {value} > "
+                        f"which exceeds the maximum {name} of < {limit} >.",
+                        nodes=operation,
+                        extensions=_EXTENSIONS,
+                    )
+                )
+        return errors
@@ -1,71 +1,42 @@
-import asyncio
-
 from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Union
 
 from tartiflette.coercers.arguments import coerce_arguments
-from tartiflette.coercers.common import Path
-from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.execution.collect import collect_fields
 from tartiflette.execution.context import build_execution_context
 from tartiflette.execution.helpers import get_field_definition
+from tartiflette.execution.plan import get_operation_execution_plan
 from tartiflette.execution.types import build_resolve_info
 from tartiflette.utils.errors import extract_exceptions_from_results
 from tartiflette.utils.values import is_invalid_value
 
 __all__ = (
-    "resolve_field",
     "execute_fields",
     "execute",
     "create_source_event_stream",
 )
 
 
-async def resolve_field(
-    execution_context: "ExecutionContext",
-    parent_type: "GraphQLObjectType",
-    source: Any,
-    field_nodes: List["FieldNode"],
-    path: "Path",
-    is_introspection_context: bool = False,
-) -> Any:
+def is_trivial_field(
+    field_nodes: List["FieldNode"], field_definition: "GraphQLField"
+) -> bool:
     """
-    Resolves the field on the given source object. In particular, this
-    figures out the value that the field returns by calling its resolve
-    function, then calls completeValue to complete promises, serialize scalars,
-    or execute the sub-selection-set for objects.
-    :param execution_context: instance of the query execution context
-    :param parent_type: GraphQLObjectType of the field's parent
-    :param source: default root value or field parent value
+    Determines whether or not the field can be resolved synchronously, which
+    is the case for fields having a synchronous resolver whose nodes carry no
+    query directives.
     :param field_nodes: AST nodes related to the resolved field
-    :param path: the path traveled until this resolver
-    :param is_introspection_context: determines whether or not the resolved
-    field is in a context of an introspection query
-    :type execution_context: ExecutionContext
-    :type parent_type: GraphQLObjectType
-    :type source: Any
+    :param field_definition: GraphQLField instance of the resolved field
     :type field_nodes: List[FieldNode]
-    :type path: Path
-    :type is_introspection_context: bool
-    :return: the computed field value
-    :rtype: Any
+    :type field_definition: GraphQLField
+    :return: whether or not the field can be resolved synchronously
+    :rtype: bool
     """
-    field_node = field_nodes[0]
-    field_name = field_node.name.value
+    if field_definition.sync_resolver is None:
+        return False
 
-    field_definition = get_field_definition(
-        execution_context.schema, parent_type, field_name
-    )
-    if field_definition is None:
-        return UNDEFINED_VALUE
-
-    return await field_definition.resolver(
-        execution_context,
-        parent_type,
-        source,
-        field_nodes,
-        path,
-        is_introspection_context,
-    )
+    for field_node in field_nodes:
+        if field_node.directives:
+            return False
+    return True
 
 
 async def execute_fields_serially(
@@ -73,7 +44,7 @@ async def execute_fields_serially(
     parent_type: "GraphQLObjectType",
     source_value: Any,
     path: Optional["Path"],
-    fields: Dict[str, List["FieldNode"]],
+    execution_plan: "ExecutionPlan",
 ) -> Dict[str, Any]:
     """
     Implements the "Evaluating selection sets" section of the spec for "write"
@@ -82,24 +53,36 @@ async def execute_fields_serially(
     :param parent_type: GraphQLObjectType of the field's parent
     :param source_value: default root value or field parent value
     :param path: the path traveled until this resolver
-    :param fields: dictionary of collected fields
+    :param execution_plan: the execution plan of the fields to execute
     :type execution_context: ExecutionContext
     :type parent_type: GraphQLObjectType
     :type source_value: Any
     :type path: Optional[Path]
-    :type fields: Dict[str, List[FieldNode]]
+    :type execution_plan: ExecutionPlan
     :return: the computed fields value
     :rtype: Dict[str, Any]
     """
     results = {}
-    for entry_key, field_nodes in fields.items():
-        result = await resolve_field(
-            execution_context,
-            parent_type,
-            source_value,
-            field_nodes,
-            Path(path, entry_key),
-        )
+    for entry_key, field_nodes, field_definition in execution_plan:
+        if is_trivial_field(field_nodes, field_definition):
+            result = field_definition.sync_resolver(
+                execution_context,
+                parent_type,
+                source_value,
+                field_nodes,
+                path,
+                entry_key,
+            )
+        else:
+            result = await field_definition.resolver(
+                execution_context,
+                parent_type,
+                source_value,
+                field_nodes,
+                path,
+                entry_key,
+                False,
+            )
         if not is_invalid_value(result):
             results[entry_key] = result
     return results
@@ -110,7 +93,7 @@ async def execute_fields(
     parent_type: "GraphQLObjectType",
     source_value: Any,
     path: Optional["Path"],
-    fields: Dict[str, List["FieldNode"]],
+    execution_plan: "ExecutionPlan",
     is_introspection_context: bool = False,
 ) -> Dict[str, Any]:
     """
@@ -120,32 +103,60 @@ async def execute_fields(
     :param parent_type: GraphQLObjectType of the field's parent
     :param source_value: default root value or field parent value
     :param path: the path traveled until this resolver
-    :param fields: dictionary of collected fields
+    :param execution_plan: the execution plan of the fields to execute
     :param is_introspection_context: determines whether or not the resolved
     field is in a context of an introspection query
     :type execution_context: ExecutionContext
     :type parent_type: GraphQLObjectType
     :type source_value: Any
     :type path: Optional[Path]
-    :type fields: Dict[str, List[FieldNode]]
+    :type execution_plan: ExecutionPlan
     :type is_introspection_context: bool
     :return: the computed fields value
     :rtype: Dict[str, Any]
     """
-    results = await asyncio.gather(
-        *[
-            resolve_field(
+    # pylint: disable=too-many-locals
+    results = []
+    awaitable_indexes = []
+    awaitables = []
+    for entry_key, field_nodes, field_definition in execution_plan:
+        if not is_introspection_context and is_trivial_field(
+            field_nodes, field_definition
+        ):
+            try:
+                result = field_definition.sync_resolver(
+                    execution_context,
+                    parent_type,
+                    source_value,
+                    field_nodes,
+                    path,
+                    entry_key,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                result = e
+            results.append(result)
+            continue
+
+        awaitable_indexes.append(len(results))
+        awaitables.append(
+            field_definition.resolver(
                 execution_context,
                 parent_type,
                 source_value,
                 field_nodes,
-                Path(path, entry_key),
+                path,
+                entry_key,
                 is_introspection_context,
             )
-            for entry_key, field_nodes in fields.items()
-        ],
-        return_exceptions=True,
-    )
+        )
+        results.append(None)
+
+    if awaitables:
+        for index, result in zip(
+            awaitable_indexes,
+            await execution_context.execution_strategy(awaitables),
+        ):
+            results[index] = result
 
     exceptions = extract_exceptions_from_results(results)
     if exceptions:
@@ -153,7 +164,7 @@ async def execute_fields(
 
     return {
         entry_key: result
-        for entry_key, result in zip(fields, results)
+        for (entry_key, _, _), result in zip(execution_plan, results)
         if not is_invalid_value(result)
     }
 
@@ -178,8 +189,8 @@ async def execute_operation(
         operation
     )
 
-    fields = await collect_fields(
-        execution_context, operation_root_type, operation.selection_set
+    execution_plan = await get_operation_execution_plan(
+        execution_context, operation_root_type, operation
     )
 
     try:
@@ -189,7 +200,7 @@ async def execute_operation(
                 operation_root_type,
                 root_value,
                 None,
-                fields,
+                execution_plan,
             )
             if operation.operation_type == "mutation"
             else execute_fields(
@@ -197,7 +208,7 @@ async def execute_operation(
                 operation_root_type,
                 root_value,
                 None,
-                fields,
+                execution_plan,
             )
         )
     except Exception as e:  # pylint: disable=broad-except
@@ -213,6 +224,7 @@ async def execute(
     context: Optional[Any],
     variables: Optional[Dict[str, Any]],
     operation_name: Optional[str],
+    execution_strategy: Optional[Callable] = None,
 ) -> Dict[str, Any]:
     """
     Runs the execution of the executable operation.
@@ -226,6 +238,8 @@ async def execute(
     accessible from the resolvers
     :param variables: the variables provided in the GraphQL request
     :param operation_name: the operation name to execute
+    :param execution_strategy: coroutine in charge of executing the coroutines
+    of the fields & list items
     :type schema: GraphQLSchema
     :type document: DocumentNode
     :type response_builder: Callable
@@ -233,20 +247,30 @@ async def execute(
     :type context: Optional[Any]
     :type variables: Optional[Dict[str, Any]]
     :type operation_name: str
+    :type execution_strategy: Optional[Callable]
     :return: the GraphQL response linked to the operation execution
     :rtype: Dict[str, Any]
     """
+    # pylint: disable=too-many-arguments
     execution_context, errors = await build_execution_context(
-        schema, document, root_value, context, variables, operation_name
+        schema,
+        document,
+        root_value,
+        context,
+        variables,
+        operation_name,
+        execution_strategy,
     )
 
     if errors:
         return await response_builder(errors=errors)
 
-    data = await execute_operation(
-        execution_context, execution_context.operation, root_value
+    return await response_builder(
+        data=await execute_operation(
+            execution_context, execution_context.operation, root_value
+        ),
+        errors=execution_context.errors,
     )
-    return await response_builder(data=data, errors=execution_context.errors)
 
 
 async def create_source_event_stream(
@@ -321,7 +345,8 @@ async def create_source_event_stream(
         field_definition,
         field_nodes,
         operation_root_type,
-        Path(None, response_name),
+        None,
+        response_name,
     )
 
     return field_definition.subscribe(
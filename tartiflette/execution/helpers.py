@@ -12,11 +12,7 @@ def get_field_definition(
     :type schema: GraphQLSchema
     :type parent_type: GraphQLObjectType
     :type field_name: str
-    :return: the GraphQLField instance
+    :return: the GraphQLField instance or None if the field doesn't exist
     :rtype: GraphQLField
     """
-    try:
-        return schema.get_field_by_name(f"{parent_type}.{field_name}")
-    except Exception:  # pylint: disable=broad-except
-        pass
-    return None
+    return schema.field_definitions.get((parent_type.name, field_name))
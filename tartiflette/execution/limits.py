@@ -0,0 +1,59 @@
+from typing import Optional
+
+__all__ = ("QueryLimits",)
+
+
+class QueryLimits:
+    """
+    Limits enforced on the selection sets of the documents while validating
+    them, in order to protect the engine from queries multiplying the work of
+    the resolvers (e.g. alias amplification). The fragment spreads are
+    expanded: the selections of a fragment are taken into account at each
+    place where it is spread.
+    """
+
+    __slots__ = (
+        "max_depth",
+        "max_aliases",
+        "max_field_nodes",
+        "max_fragment_spreads",
+    )
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        max_aliases: Optional[int] = None,
+        max_field_nodes: Optional[int] = None,
+        max_fragment_spreads: Optional[int] = None,
+    ) -> None:
+        """
+        :param max_depth: maximum depth of the selection sets
+        :param max_aliases: maximum number of aliases per selection set
+        :param max_field_nodes: maximum number of field nodes per document
+        :param max_fragment_spreads: maximum number of fragment spreads per
+        document
+        :type max_depth: Optional[int]
+        :type max_aliases: Optional[int]
+        :type max_field_nodes: Optional[int]
+        :type max_fragment_spreads: Optional[int]
+        """
+        self.max_depth = max_depth
+        self.max_aliases = max_aliases
+        self.max_field_nodes = max_field_nodes
+        self.max_fragment_spreads = max_fragment_spreads
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a QueryLimits instance.
+        :return: the representation of a QueryLimits instance
+        :rtype: str
+        """
+        return (
+            "QueryLimits(max_depth={!r}, max_aliases={!r}, "
+            "max_field_nodes={!r}, max_fragment_spreads={!r})".format(
+                self.max_depth,
+                self.max_aliases,
+                self.max_field_nodes,
+                self.max_fragment_spreads,
+            )
+        )
@@ -0,0 +1,253 @@
+import asyncio
+
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from tartiflette.types.exceptions.tartiflette import TartifletteError
+
+__all__ = ("DataLoader", "DataLoaderRegistry", "create_batch_resolver")
+
+
+class DataLoader:
+    """
+    Coalesces the `load(key)` calls issued during the same event loop
+    iteration into a single call to the `batch_load_fn` coroutine, which
+    receives the list of keys and has to return a list of values (or
+    exceptions) of the same length and in the same order.
+
+    Unless `cache` is disabled, loaded values are cached by key for the
+    lifetime of the loader, which is a request when the loader is retrieved
+    through `info.loaders`.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable,
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+    ) -> None:
+        """
+        :param batch_load_fn: coroutine in charge of loading a list of keys
+        :param max_batch_size: maximum number of keys per `batch_load_fn` call
+        (unbounded if None)
+        :param cache: determines whether or not loaded values should be cached
+        :type batch_load_fn: Callable
+        :type max_batch_size: Optional[int]
+        :type cache: bool
+        """
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self._cache: Optional[Dict[Hashable, "asyncio.Future"]] = (
+            {} if cache else None
+        )
+        self._queue: List[Tuple[Any, "asyncio.Future"]] = []
+
+    def load(self, key: Any) -> "asyncio.Future":
+        """
+        Returns a future which will be resolved with the value linked to the
+        key once the batch containing it has been loaded.
+        :param key: the key to load
+        :type key: Any
+        :return: a future resolved with the value linked to the key
+        :rtype: asyncio.Future
+        """
+        if self._cache is not None:
+            future = self._cache.get(key)
+            if future is not None:
+                return future
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        if self._cache is not None:
+            self._cache[key] = future
+
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append((key, future))
+        return future
+
+    async def load_many(self, keys: List[Any]) -> List[Any]:
+        """
+        Loads a list of keys.
+        :param keys: the keys to load
+        :type keys: List[Any]
+        :return: the values linked to the keys
+        :rtype: List[Any]
+        """
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """
+        Caches the value linked to the key if the key isn't already cached.
+        :param key: the key to cache
+        :param value: the value linked to the key
+        :type key: Hashable
+        :type value: Any
+        """
+        if self._cache is None or key in self._cache:
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: Hashable) -> None:
+        """
+        Removes the key from the cache.
+        :param key: the key to remove
+        :type key: Hashable
+        """
+        if self._cache is not None:
+            self._cache.pop(key, None)
+
+    def clear_all(self) -> None:
+        """
+        Removes all the keys from the cache.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _dispatch(self) -> None:
+        """
+        Splits the queued keys into batches and loads them.
+        """
+        queue, self._queue = self._queue, []
+        batch_size = self.max_batch_size or len(queue)
+        for index in range(0, len(queue), batch_size):
+            asyncio.ensure_future(
+                self._load_batch(queue[index : index + batch_size])
+            )
+
+    async def _load_batch(
+        self, batch: List[Tuple[Any, "asyncio.Future"]]
+    ) -> None:
+        """
+        Calls the `batch_load_fn` coroutine with the keys of the batch and
+        resolves their futures with the returned values.
+        :param batch: list of key & future to load
+        :type batch: List[Tuple[Any, asyncio.Future]]
+        """
+        keys = [key for key, _ in batch]
+        try:
+            values = await self.batch_load_fn(keys)
+            if not isinstance(values, list) or len(values) != len(keys):
+                raise TartifletteError(
+                    "The batch load function of a DataLoader must return a "
+                    "list with the same length as the list of keys."
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            for key, future in batch:
+                # Failed keys shouldn't stay cached
+                self.clear(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), value in zip(batch, values):
+            if future.done():
+                continue
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+
+class DataLoaderRegistry:
+    """
+    Holds the DataLoader instances of a request.
+    """
+
+    def __init__(self) -> None:
+        self._loaders: Dict[Hashable, "DataLoader"] = {}
+
+    def get(
+        self,
+        batch_load_fn: Callable,
+        key: Optional[Hashable] = None,
+        **options,
+    ) -> "DataLoader":
+        """
+        Returns the DataLoader linked to the key (which defaults to the
+        `batch_load_fn` coroutine) or creates it.
+        :param batch_load_fn: coroutine in charge of loading a list of keys
+        :param key: key identifying the DataLoader
+        :param options: extra parameters to pass to the DataLoader constructor
+        :type batch_load_fn: Callable
+        :type key: Optional[Hashable]
+        :type options: Dict[str, Any]
+        :return: the DataLoader linked to the key
+        :rtype: DataLoader
+        """
+        if key is None:
+            key = batch_load_fn
+
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = DataLoader(batch_load_fn, **options)
+        return loader
+
+
+async def _batch_resolve(
+    implementation: Callable,
+    args: Dict[str, Any],
+    ctx: Optional[Any],
+    info: "ResolveInfo",
+    parents: List[Any],
+) -> List[Any]:
+    """
+    Calls the batch resolver implementation with the list of parents.
+    :param implementation: the batch resolver implementation
+    :param args: computed arguments related to the resolved field
+    :param ctx: context passed to the query execution
+    :param info: information related to the execution and the first resolved
+    parent
+    :param parents: the list of parents to resolve
+    :type implementation: Callable
+    :type args: Dict[str, Any]
+    :type ctx: Optional[Any]
+    :type info: ResolveInfo
+    :type parents: List[Any]
+    :return: the list of resolved values
+    :rtype: List[Any]
+    """
+    return await implementation(parents, args, ctx, info)
+
+
+def create_batch_resolver(implementation: Callable) -> Callable:
+    """
+    Creates a resolver which resolves the parents of a field node through a
+    per-request DataLoader, which calls the implementation once with the list
+    of all the parents (and the arguments, context & info of the first one).
+    :param implementation: the batch resolver implementation
+    :type implementation: Callable
+    :return: a resolver which batches the parents
+    :rtype: Callable
+    """
+
+    async def batch_resolver(
+        parent: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Any],
+        info: "ResolveInfo",
+    ) -> Any:
+        """
+        Resolves the parent through the batch resolver implementation.
+        :param parent: default root value or field parent value
+        :param args: computed arguments related to the resolved field
+        :param ctx: context passed to the query execution
+        :param info: information related to the execution and the resolved
+        field
+        :type parent: Optional[Any]
+        :type args: Dict[str, Any]
+        :type ctx: Optional[Any]
+        :type info: ResolveInfo
+        :return: the resolved value
+        :rtype: Any
+        """
+        return await info.loaders.get(
+            partial(_batch_resolve, implementation, args, ctx, info),
+            key=(batch_resolver, id(info.field_nodes[0])),
+            cache=False,
+        ).load(parent)
+
+    return batch_resolver
@@ -0,0 +1,413 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Tuple, Union
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.cache import LRUDocumentCache
+from tartiflette.execution.collect import reuse_document
+
+__all__ = (
+    "compute_query_id",
+    "PersistedQueryStore",
+    "InMemoryPersistedQueryStore",
+    "FilePersistedQueryStore",
+)
+
+logger = logging.getLogger(__name__)
+
+_QUERY_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def compute_query_id(query: Union[str, bytes]) -> str:
+    """
+    Computes the identifier of a persisted query, which is the SHA-256
+    hexadecimal digest of its UTF8-encoded content.
+    :param query: the GraphQL request / query
+    :type query: Union[str, bytes]
+    :return: the identifier of the query
+    :rtype: str
+    """
+    if isinstance(query, str):
+        query = query.encode("utf-8")
+    return hashlib.sha256(query).hexdigest()
+
+
+class PersistedQueryStore(ABC):
+    """
+    Base class of the stores used by an engine to hold the parsed & validated
+    documents of its persisted queries, identified by the SHA-256 digest of
+    their content. The engine binds the store to its schema at cook time by
+    providing the callable in charge of parsing & validating the queries.
+
+    A store can be shared by successive engines: documents validated against
+    a schema sharing the fingerprint of the schema of the engine are kept
+    without being validated again.
+
+    An allow-list only store is filled from its `.graphql` files only: the
+    queries provided to `Engine.execute_persisted` are never persisted.
+    """
+
+    def __init__(self, allow_list_only: bool = False) -> None:
+        """
+        :param allow_list_only: whether or not the queries provided by the
+        clients should be refused instead of being persisted
+        :type allow_list_only: bool
+        """
+        self.allow_list_only = allow_list_only
+        self._parse: Optional[
+            Callable[
+                [Union[str, bytes]],
+                Tuple[
+                    Optional["DocumentNode"],
+                    Optional[List["TartifletteError"]],
+                ],
+            ]
+        ] = None
+
+    def bind(
+        self,
+        parse: Callable[
+            [Union[str, bytes]],
+            Tuple[
+                Optional["DocumentNode"], Optional[List["TartifletteError"]]
+            ],
+        ],
+        schema: Optional["GraphQLSchema"] = None,
+    ) -> None:
+        """
+        Binds the store to the callable in charge of parsing & validating the
+        queries against the schema of the engine.
+        :param parse: callable in charge of parsing & validating the queries
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type parse: Callable[[Union[str, bytes]], Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]]
+        :type schema: Optional[GraphQLSchema]
+        """
+        # pylint: disable=unused-argument
+        self._parse = parse
+
+    @abstractmethod
+    async def get(self, query_id: str) -> Optional["DocumentNode"]:
+        """
+        Returns the document linked to the query identifier or None if the
+        query isn't persisted.
+        :param query_id: the SHA-256 digest of the query
+        :type query_id: str
+        :return: the document linked to the query identifier
+        :rtype: Optional[DocumentNode]
+        """
+
+    @abstractmethod
+    async def set(
+        self, query_id: str, query: Union[str, bytes], validate: bool = True
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates the query and persists it if it's valid.
+        :param query_id: the SHA-256 digest of the query
+        :param query: the GraphQL request / query
+        :param validate: whether or not the query should be validated
+        :type query_id: str
+        :type query: Union[str, bytes]
+        :type validate: bool
+        :return: a DocumentNode representing the query or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+
+    async def has_document(self, query_id: str) -> bool:
+        """
+        Determines whether or not the document linked to the query identifier
+        is held by the store, the queries already persisted being skipped
+        while pre-warming the store.
+        :param query_id: the SHA-256 digest of the query
+        :type query_id: str
+        :return: whether or not the document is held by the store
+        :rtype: bool
+        """
+        return await self.get(query_id) is not None
+
+    async def prewarm(self, directory: str, validate: bool = True) -> None:
+        """
+        Persists all the `.graphql` files contained in the directory which
+        aren't persisted yet. The validation of the queries can be skipped
+        when the directory is a trusted allow-list.
+        :param directory: path to the directory containing the queries
+        :param validate: whether or not the queries should be validated
+        :type directory: str
+        :type validate: bool
+        """
+        loop = asyncio.get_event_loop()
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".graphql"):
+                continue
+            query = await loop.run_in_executor(
+                None, _read_file, os.path.join(directory, filename)
+            )
+            query_id = compute_query_id(query)
+            if await self.has_document(query_id):
+                continue
+
+            _, errors = await self.set(query_id, query, validate)
+            if errors:
+                logger.warning(
+                    "Persisted query < %s > is invalid and hasn't been "
+                    "persisted: %s",
+                    filename,
+                    "; ".join(str(error) for error in errors),
+                )
+
+
+def _read_file(path: str) -> str:
+    """
+    Returns the content of a file.
+    :param path: path of the file to read
+    :type path: str
+    :return: the content of the file
+    :rtype: str
+    """
+    with open(path, "r", encoding="utf-8") as query_file:
+        return query_file.read()
+
+
+def _count_files(directory: str) -> int:
+    """
+    Returns the number of `.graphql` files contained in a directory.
+    :param directory: path of the directory
+    :type directory: str
+    :return: the number of `.graphql` files contained in the directory
+    :rtype: int
+    """
+    if not os.path.isdir(directory):
+        return 0
+    return sum(
+        1
+        for filename in os.listdir(directory)
+        if filename.endswith(".graphql")
+    )
+
+
+def _write_file(path: str, content: str) -> None:
+    """
+    Writes the content to a file.
+    :param path: path of the file to write
+    :param content: the content to write
+    :type path: str
+    :type content: str
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as query_file:
+        query_file.write(content)
+
+
+class InMemoryPersistedQueryStore(PersistedQueryStore):
+    """
+    Persisted query store holding the documents in an in-process LRU cache,
+    the least recently used documents being evicted once `max_size` documents
+    are persisted.
+    """
+
+    def __init__(
+        self, max_size: Optional[int] = 1024, allow_list_only: bool = False
+    ) -> None:
+        """
+        :param max_size: maximum number of persisted documents (unbounded if
+        None)
+        :param allow_list_only: whether or not the queries provided by the
+        clients should be refused instead of being persisted
+        :type max_size: Optional[int]
+        :type allow_list_only: bool
+        """
+        super().__init__(allow_list_only)
+        self._documents = LRUDocumentCache(max_size)
+
+    def bind(
+        self,
+        parse: Callable[
+            [Union[str, bytes]],
+            Tuple[
+                Optional["DocumentNode"], Optional[List["TartifletteError"]]
+            ],
+        ],
+        schema: Optional["GraphQLSchema"] = None,
+    ) -> None:
+        """
+        Binds the store to the callable in charge of parsing & validating the
+        queries against the schema of the engine and removes the documents
+        which can't be reused with the schema, the reused ones keeping their
+        eviction priority.
+        :param parse: callable in charge of parsing & validating the queries
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type parse: Callable[[Union[str, bytes]], Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]]
+        :type schema: Optional[GraphQLSchema]
+        """
+        super().bind(parse, schema)
+        if schema is not None:
+            for query_id, document in self._documents.items():
+                if not reuse_document(document, schema):
+                    self._documents.remove(query_id)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of persisted queries.
+        :return: the number of persisted queries
+        :rtype: int
+        """
+        return len(self._documents)
+
+    async def get(self, query_id: str) -> Optional["DocumentNode"]:
+        """
+        Returns the document linked to the query identifier or None if the
+        query isn't persisted.
+        :param query_id: the SHA-256 digest of the query
+        :type query_id: str
+        :return: the document linked to the query identifier
+        :rtype: Optional[DocumentNode]
+        """
+        document = self._documents.get(query_id)
+        return document if document is not UNDEFINED_VALUE else None
+
+    async def has_document(self, query_id: str) -> bool:
+        """
+        Determines whether or not the document linked to the query identifier
+        is held in memory, without altering its eviction priority.
+        :param query_id: the SHA-256 digest of the query
+        :type query_id: str
+        :return: whether or not the document is held in memory
+        :rtype: bool
+        """
+        return query_id in self._documents
+
+    async def set(
+        self, query_id: str, query: Union[str, bytes], validate: bool = True
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates the query and persists it if it's valid.
+        :param query_id: the SHA-256 digest of the query
+        :param query: the GraphQL request / query
+        :param validate: whether or not the query should be validated
+        :type query_id: str
+        :type query: Union[str, bytes]
+        :type validate: bool
+        :return: a DocumentNode representing the query or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        document, errors = self._parse(query, validate=validate)
+        if document is not None:
+            self._documents.set(query_id, document)
+        return document, errors
+
+
+class FilePersistedQueryStore(InMemoryPersistedQueryStore):
+    """
+    Persisted query store writing the queries as `<query_id>.graphql` files
+    into a directory. Queries are parsed & validated the first time they are
+    read from the directory, the resulting documents are then kept in memory
+    (up to `max_size` documents, the evicted ones being read again from the
+    directory on demand). Once the directory contains `max_files` queries,
+    the new queries are only kept in memory. While pre-warming the store,
+    the queries which aren't kept in memory are parsed from the pre-warmed
+    files (without being validated if they are trusted) rather than read
+    from the directory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: Optional[int] = 1024,
+        max_files: Optional[int] = 10000,
+        allow_list_only: bool = False,
+    ) -> None:
+        """
+        :param directory: path to the directory containing the queries
+        :param max_size: maximum number of documents kept in memory
+        (unbounded if None)
+        :param max_files: maximum number of queries written into the
+        directory (unbounded if None)
+        :param allow_list_only: whether or not the queries provided by the
+        clients should be refused instead of being persisted
+        :type directory: str
+        :type max_size: Optional[int]
+        :type max_files: Optional[int]
+        :type allow_list_only: bool
+        """
+        super().__init__(max_size, allow_list_only)
+        self.directory = directory
+        self.max_files = max_files
+        self._files_count: Optional[int] = None
+
+    def _get_path(self, query_id: str) -> Optional[str]:
+        """
+        Returns the path of the file containing the query or None if the query
+        identifier isn't a valid SHA-256 digest.
+        :param query_id: the SHA-256 digest of the query
+        :type query_id: str
+        :return: the path of the file containing the query
+        :rtype: Optional[str]
+        """
+        if not _QUERY_ID_PATTERN.match(query_id):
+            return None
+        return os.path.join(self.directory, f"{query_id}.graphql")
+
+    async def get(self, query_id: str) -> Optional["DocumentNode"]:
+        """
+        Returns the document linked to the query identifier or None if the
+        query isn't persisted.
+        :param query_id: the SHA-256 digest of the query
+        :type query_id: str
+        :return: the document linked to the query identifier
+        :rtype: Optional[DocumentNode]
+        """
+        document = await super().get(query_id)
+        if document is not None:
+            return document
+
+        path = self._get_path(query_id)
+        if path is None or not os.path.isfile(path):
+            return None
+
+        query = await asyncio.get_event_loop().run_in_executor(
+            None, _read_file, path
+        )
+        document, _ = await super().set(query_id, query)
+        return document
+
+    async def set(
+        self, query_id: str, query: Union[str, bytes], validate: bool = True
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates the query and persists it into the directory if
+        it's valid.
+        :param query_id: the SHA-256 digest of the query
+        :param query: the GraphQL request / query
+        :param validate: whether or not the query should be validated
+        :type query_id: str
+        :type query: Union[str, bytes]
+        :type validate: bool
+        :return: a DocumentNode representing the query or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        document, errors = await super().set(query_id, query, validate)
+        path = self._get_path(query_id)
+        if (
+            document is not None
+            and path is not None
+            and not os.path.isfile(path)
+        ):
+            if self.max_files is not None:
+                if self._files_count is None:
+                    self._files_count = await asyncio.get_event_loop().run_in_executor(
+                        None, _count_files, self.directory
+                    )
+                if self._files_count >= self.max_files:
+                    return document, errors
+                self._files_count += 1
+
+            if isinstance(query, bytes):
+                query = query.decode("utf-8")
+            await asyncio.get_event_loop().run_in_executor(
+                None, _write_file, path, query
+            )
+        return document, errors
@@ -0,0 +1,300 @@
+import asyncio
+
+from typing import Dict, Iterator, List, Set, Tuple
+
+from tartiflette.execution.collect import (
+    collect_fields,
+    has_only_builtin_inclusion_directives,
+)
+from tartiflette.execution.helpers import get_field_definition
+from tartiflette.language.ast import FragmentSpreadNode, InlineFragmentNode
+from tartiflette.types.helpers.get_directive_instances import (
+    has_variable_arguments,
+)
+
+__all__ = (
+    "build_execution_plan",
+    "get_operation_execution_plan",
+    "get_subfields_execution_plan",
+)
+
+
+# An execution plan is the ordered list of the fields to execute on a runtime
+# type, each entry being a (entry_key, field_nodes, field_definition) tuple.
+ExecutionPlan = List[Tuple[str, List["FieldNode"], "GraphQLField"]]
+
+# Marks the selection sets whose collection depends on the variables of the
+# request and thus can't be planned ahead.
+_DYNAMIC_PLAN = object()
+
+# Marks the selection sets carrying directives whose collection hooks have to
+# be called for each collected object.
+_UNPLANNED = object()
+
+
+def _iter_selection_directives(
+    fragments: Dict[str, "FragmentDefinitionNode"],
+    selection_set: "SelectionSetNode",
+    visited_fragment_names: Set[str],
+) -> Iterator[List["DirectiveNode"]]:
+    """
+    Yields the directive nodes of each selection of a selection set, including
+    those of the selections of the traversed fragments.
+    :param fragments: the dictionary of fragment definition AST node
+    contained in the request
+    :param selection_set: selection set node to traverse
+    :param visited_fragment_names: the set of fragment names already visited
+    :type fragments: Dict[str, FragmentDefinitionNode]
+    :type selection_set: SelectionSetNode
+    :type visited_fragment_names: Set[str]
+    :return: an iterator over the directive nodes of the selections
+    :rtype: Iterator[List[DirectiveNode]]
+    """
+    for selection in selection_set.selections:
+        yield selection.directives or []
+
+        if isinstance(selection, InlineFragmentNode):
+            yield from _iter_selection_directives(
+                fragments, selection.selection_set, visited_fragment_names
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment_name = selection.name.value
+            if fragment_name in visited_fragment_names:
+                continue
+
+            visited_fragment_names.add(fragment_name)
+
+            fragment_definition = fragments.get(fragment_name)
+            if fragment_definition:
+                yield from _iter_selection_directives(
+                    fragments,
+                    fragment_definition.selection_set,
+                    visited_fragment_names,
+                )
+
+
+def is_static_selection_set(
+    schema: "GraphQLSchema",
+    fragments: Dict[str, "FragmentDefinitionNode"],
+    selection_set: "SelectionSetNode",
+) -> bool:
+    """
+    Determines whether or not the collection of the fields of a selection set
+    is the same for every request, which is the case when the selections
+    (including those of the traversed fragments) carry no directives other
+    than built-in @skip & @include ones with literal arguments, which are
+    thus evaluated once when computing the execution plan.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param fragments: the dictionary of fragment definition AST node
+    contained in the request
+    :param selection_set: selection set node to check
+    :type schema: GraphQLSchema
+    :type fragments: Dict[str, FragmentDefinitionNode]
+    :type selection_set: SelectionSetNode
+    :return: whether or not the collection of the selection set is static
+    :rtype: bool
+    """
+    return all(
+        not directives
+        or (
+            not has_variable_arguments(directives)
+            and has_only_builtin_inclusion_directives(schema, directives)
+        )
+        for directives in _iter_selection_directives(
+            fragments, selection_set, set()
+        )
+    )
+
+
+def is_request_scoped_selection_set(
+    schema: "GraphQLSchema",
+    fragments: Dict[str, "FragmentDefinitionNode"],
+    selection_set: "SelectionSetNode",
+) -> bool:
+    """
+    Determines whether or not the collection of the fields of a selection set
+    only depends on the variables of the request, which is the case when the
+    selections (including those of the traversed fragments) carry no
+    directives other than built-in @skip & @include ones. The collection hooks
+    of the other directives are called for each collected object.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param fragments: the dictionary of fragment definition AST node
+    contained in the request
+    :param selection_set: selection set node to check
+    :type schema: GraphQLSchema
+    :type fragments: Dict[str, FragmentDefinitionNode]
+    :type selection_set: SelectionSetNode
+    :return: whether or not the collection of the selection set only depends
+    on the request
+    :rtype: bool
+    """
+    return all(
+        not directives
+        or has_only_builtin_inclusion_directives(schema, directives)
+        for directives in _iter_selection_directives(
+            fragments, selection_set, set()
+        )
+    )
+
+
+async def build_execution_plan(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    selection_sets: List["SelectionSetNode"],
+) -> ExecutionPlan:
+    """
+    Collects the fields of the selection sets and computes the execution plan
+    of the runtime type from them.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: current runtime type of the selection sets
+    :param selection_sets: selection set nodes to collect
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type selection_sets: List[SelectionSetNode]
+    :return: the execution plan of the runtime type
+    :rtype: ExecutionPlan
+    """
+    fields: Dict[str, List["FieldNode"]] = {}
+    visited_fragment_names: Set[str] = set()
+    for selection_set in selection_sets:
+        fields = await collect_fields(
+            execution_context,
+            runtime_type,
+            selection_set,
+            fields,
+            visited_fragment_names,
+        )
+
+    execution_plan: ExecutionPlan = []
+    for entry_key, field_nodes in fields.items():
+        field_definition = get_field_definition(
+            execution_context.schema, runtime_type, field_nodes[0].name.value
+        )
+        if field_definition is not None:
+            execution_plan.append((entry_key, field_nodes, field_definition))
+    return execution_plan
+
+
+async def _get_execution_plan(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    selection_sets: List["SelectionSetNode"],
+) -> ExecutionPlan:
+    """
+    Returns the pre-computed execution plan of the selection sets for the
+    runtime type or computes it. Execution plans of static selection sets are
+    stored on the document in order to be reused by the next requests, the
+    ones depending on the variables of the request are stored on its
+    execution context and the ones carrying other directives are computed
+    for each object, so that their collection hooks are called for each
+    object.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: current runtime type of the selection sets
+    :param selection_sets: selection set nodes to collect
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type selection_sets: List[SelectionSetNode]
+    :return: the execution plan of the runtime type
+    :rtype: ExecutionPlan
+    """
+    # Nodes are owned by the document which owns the execution plans, their
+    # identities are thus stable for the lifetime of the execution plans
+    key = (
+        runtime_type.name,
+        tuple(id(selection_set) for selection_set in selection_sets),
+    )
+
+    execution_plans = execution_context.execution_plans
+    execution_plan = execution_plans.get(key)
+    if execution_plan is None:
+        schema = execution_context.schema
+        fragments = execution_context.fragments
+        if all(
+            is_static_selection_set(schema, fragments, selection_set)
+            for selection_set in selection_sets
+        ):
+            execution_plan = await build_execution_plan(
+                execution_context, runtime_type, selection_sets
+            )
+            execution_plans[key] = execution_plan
+            return execution_plan
+
+        execution_plan = execution_plans[key] = (
+            _DYNAMIC_PLAN
+            if all(
+                is_request_scoped_selection_set(
+                    schema, fragments, selection_set
+                )
+                for selection_set in selection_sets
+            )
+            else _UNPLANNED
+        )
+
+    if execution_plan is _UNPLANNED:
+        return await build_execution_plan(
+            execution_context, runtime_type, selection_sets
+        )
+
+    if execution_plan is not _DYNAMIC_PLAN:
+        return execution_plan
+
+    # Dynamic execution plans only depend on the variables of the request,
+    # they are computed once per request and shared by all the objects (e.g.
+    # the items of a list) having the same runtime type
+    dynamic_execution_plans = execution_context.dynamic_execution_plans
+    execution_plan = dynamic_execution_plans.get(key)
+    if execution_plan is None:
+        execution_plan = dynamic_execution_plans[key] = asyncio.ensure_future(
+            build_execution_plan(
+                execution_context, runtime_type, selection_sets
+            )
+        )
+    return await execution_plan
+
+
+async def get_operation_execution_plan(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    operation: "OperationDefinitionNode",
+) -> ExecutionPlan:
+    """
+    Returns the execution plan of the root fields of the operation.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: root type of the operation
+    :param operation: AST operation definition node to execute
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type operation: OperationDefinitionNode
+    :return: the execution plan of the root fields
+    :rtype: ExecutionPlan
+    """
+    return await _get_execution_plan(
+        execution_context, runtime_type, [operation.selection_set]
+    )
+
+
+async def get_subfields_execution_plan(
+    execution_context: "ExecutionContext",
+    return_type: "GraphQLObjectType",
+    field_nodes: List["FieldNode"],
+) -> ExecutionPlan:
+    """
+    Returns the execution plan of the subfields of each field nodes.
+    :param execution_context: instance of the query execution context
+    :param return_type: GraphQLObjectType of the parent field
+    :param field_nodes: AST nodes related to the parent field
+    :type execution_context: ExecutionContext
+    :type return_type: GraphQLObjectType
+    :type field_nodes: List[FieldNode]
+    :return: the execution plan of the subfields
+    :rtype: ExecutionPlan
+    """
+    return await _get_execution_plan(
+        execution_context,
+        return_type,
+        [
+            field_node.selection_set
+            for field_node in field_nodes
+            if field_node.selection_set
+        ],
+    )
@@ -0,0 +1,73 @@
+import os
+import pickle
+
+from typing import List, Optional, Tuple, Union
+
+__all__ = ("dump_document_snapshot", "load_document_snapshot")
+
+# Bumped each time the layout of the AST nodes changes
+_SNAPSHOT_FORMAT_VERSION = 1
+
+# Readable by all the supported Python versions
+_PICKLE_PROTOCOL = 4
+
+
+def dump_document_snapshot(
+    path: str,
+    documents: List[Tuple[Union[str, bytes], "DocumentNode"]],
+    schema_fingerprint: str,
+) -> None:
+    """
+    Writes a snapshot of parsed & validated documents into a file. The file is
+    written atomically, so that engines loading it concurrently either read
+    the previous snapshot or the new one.
+    :param path: path of the snapshot file
+    :param documents: the queries and their validated documents
+    :param schema_fingerprint: fingerprint of the schema the documents have
+    been validated against
+    :type path: str
+    :type documents: List[Tuple[Union[str, bytes], DocumentNode]]
+    :type schema_fingerprint: str
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as snapshot_file:
+        pickle.dump(
+            (_SNAPSHOT_FORMAT_VERSION, schema_fingerprint),
+            snapshot_file,
+            protocol=_PICKLE_PROTOCOL,
+        )
+        pickle.dump(documents, snapshot_file, protocol=_PICKLE_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_document_snapshot(
+    path: str, schema_fingerprint: str
+) -> Optional[List[Tuple[Union[str, bytes], "DocumentNode"]]]:
+    """
+    Reads a snapshot of parsed & validated documents from a file. The
+    documents are only read if they have been validated against a schema
+    sharing the fingerprint of the schema of the engine, they are thus ready
+    to be executed without being parsed nor validated again. Since the
+    snapshot is unpickled, it should only be read from a trusted location.
+    :param path: path of the snapshot file
+    :param schema_fingerprint: fingerprint of the schema of the engine
+    :type path: str
+    :type schema_fingerprint: str
+    :return: the queries and their validated documents or None if the file
+    doesn't exist or isn't compatible with the schema of the engine
+    :rtype: Optional[List[Tuple[Union[str, bytes], DocumentNode]]]
+    """
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, "rb") as snapshot_file:
+        if pickle.load(snapshot_file) != (
+            _SNAPSHOT_FORMAT_VERSION,
+            schema_fingerprint,
+        ):
+            return None
+        return pickle.load(snapshot_file)
@@ -0,0 +1,174 @@
+import asyncio
+
+from typing import Any, Coroutine, Generator, List, Tuple
+
+__all__ = ("gather_strategy", "eager_strategy")
+
+
+async def gather_strategy(coroutines: List[Coroutine]) -> List[Any]:
+    """
+    Executes the coroutines concurrently, each one into its own task, and
+    returns their results (or the exceptions they raised) in the same order.
+    :param coroutines: list of coroutines to execute
+    :type coroutines: List[Coroutine]
+    :return: the results of the coroutines
+    :rtype: List[Any]
+    """
+    return await asyncio.gather(*coroutines, return_exceptions=True)
+
+
+class _SuspendedCoroutine:
+    """
+    Awaitable resuming a coroutine which has been stepped until its first
+    suspension, by yielding the value on which it suspended to the task in
+    charge of awaiting it and then driving the coroutine until its end.
+    """
+
+    __slots__ = ("coroutine", "yielded", "resumed")
+
+    def __init__(self, coroutine: Coroutine, yielded: Any) -> None:
+        """
+        :param coroutine: the suspended coroutine
+        :param yielded: the value on which the coroutine suspended
+        :type coroutine: Coroutine
+        :type yielded: Any
+        """
+        self.coroutine = coroutine
+        self.yielded = yielded
+        self.resumed = False
+
+    def cancel(self) -> None:
+        """
+        Throws a CancelledError into the coroutine if it hasn't been resumed,
+        which happens when the task in charge of awaiting it is cancelled
+        before being started.
+        """
+        if self.resumed:
+            return
+
+        self.resumed = True
+        try:
+            self.coroutine.throw(asyncio.CancelledError())
+        except BaseException:  # pylint: disable=broad-except
+            return
+        self.coroutine.close()
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """
+        Drives the suspended coroutine until its end.
+        :return: the result of the coroutine
+        :rtype: Generator[Any, Any, Any]
+        """
+        # pylint: disable=protected-access
+        self.resumed = True
+        coroutine = self.coroutine
+        yielded = self.yielded
+        if asyncio.isfuture(yielded):
+            # Blocks the future again since it has been released once yielded
+            # by the eager step
+            yielded._asyncio_future_blocking = True
+        while True:
+            try:
+                value = yield yielded
+            except BaseException as e:  # pylint: disable=broad-except
+                try:
+                    yielded = coroutine.throw(e)
+                except StopIteration as stop:
+                    return stop.value
+            else:
+                try:
+                    yielded = coroutine.send(value)
+                except StopIteration as stop:
+                    return stop.value
+
+
+def _close_coroutines(
+    suspended_coroutines: List[_SuspendedCoroutine],
+    remaining_coroutines: List[Coroutine],
+) -> None:
+    """
+    Cancels the suspended coroutines and closes the ones which haven't been
+    stepped yet.
+    :param suspended_coroutines: the suspended coroutines to cancel
+    :param remaining_coroutines: the coroutines to close
+    :type suspended_coroutines: List[_SuspendedCoroutine]
+    :type remaining_coroutines: List[Coroutine]
+    """
+    for suspended_coroutine in suspended_coroutines:
+        suspended_coroutine.cancel()
+    for coroutine in remaining_coroutines:
+        coroutine.close()
+
+
+def _step_coroutines(
+    coroutines: List[Coroutine],
+) -> Tuple[List[Any], List[int], List[_SuspendedCoroutine]]:
+    """
+    Steps each coroutine until it completes or suspends. The exceptions
+    raised by the coroutines are returned as their results, except the ones
+    which aren't an Exception (e.g. CancelledError or KeyboardInterrupt),
+    which are raised once the suspended coroutines have been cancelled and
+    the remaining ones closed.
+    :param coroutines: list of coroutines to step
+    :type coroutines: List[Coroutine]
+    :return: the results of the coroutines (None for the suspended ones),
+    the indexes of the suspended coroutines & the suspended coroutines
+    :rtype: Tuple[List[Any], List[int], List[_SuspendedCoroutine]]
+    """
+    # pylint: disable=protected-access
+    results = []
+    suspended_indexes = []
+    suspended_coroutines = []
+    for index, coroutine in enumerate(coroutines):
+        try:
+            yielded = coroutine.send(None)
+        except StopIteration as stop:
+            results.append(stop.value)
+            continue
+        except Exception as e:  # pylint: disable=broad-except
+            results.append(e)
+            continue
+        except BaseException:
+            _close_coroutines(suspended_coroutines, coroutines[index + 1 :])
+            raise
+
+        if asyncio.isfuture(yielded):
+            # Releases the future as a task would do in order for the other
+            # coroutines to be able to await it
+            yielded._asyncio_future_blocking = False
+
+        suspended_indexes.append(index)
+        suspended_coroutines.append(_SuspendedCoroutine(coroutine, yielded))
+        results.append(None)
+    return results, suspended_indexes, suspended_coroutines
+
+
+async def eager_strategy(coroutines: List[Coroutine]) -> List[Any]:
+    """
+    Steps each coroutine eagerly until it completes or suspends and only
+    executes the suspended ones concurrently into their own task, which saves
+    the scheduling of a task for coroutines completing without suspending
+    (e.g. the fields & items of cheap objects). Coroutines stepped eagerly run
+    into the context of the current task. Returns the results of the
+    coroutines (or the exceptions they raised) in the same order.
+    :param coroutines: list of coroutines to execute
+    :type coroutines: List[Coroutine]
+    :return: the results of the coroutines
+    :rtype: List[Any]
+    """
+    results, suspended_indexes, suspended_coroutines = _step_coroutines(
+        coroutines
+    )
+
+    if suspended_coroutines:
+        try:
+            suspended_results = await asyncio.gather(
+                *suspended_coroutines, return_exceptions=True
+            )
+        except asyncio.CancelledError:
+            _close_coroutines(suspended_coroutines, [])
+            raise
+
+        for index, result in zip(suspended_indexes, suspended_results):
+            results[index] = result
+    return results
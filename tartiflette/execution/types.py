@@ -1,80 +1,152 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+from tartiflette.coercers.common import Path
 
 __all__ = ("build_resolve_info",)
 
 
 class ResolveInfo:
     """
-    Class containing the information related to a resolved field.
+    Class containing the information related to a resolved field. Only the
+    information specific to the resolved field are stored on the instance,
+    the ones related to the field definition & to the request are read on
+    demand from the field definition & the execution context. The path of
+    the resolved field is only allocated once read.
     """
 
     __slots__ = (
-        "field_name",
         "field_nodes",
-        "return_type",
         "parent_type",
-        "path",
-        "schema",
-        "fragments",
-        "root_value",
-        "operation",
-        "variable_values",
         "is_introspection",
+        "_parent_path",
+        "_key",
+        "_path",
+        "_field_definition",
+        "_execution_context",
     )
 
     def __init__(
         self,
-        field_name: str,
+        field_definition: "GraphQLField",
         field_nodes: List["FieldNodes"],
-        return_type: "GraphQLOutputType",
         parent_type: "GraphQLObjectType",
-        path: "Path",
-        schema: "GraphQLSchema",
-        fragments: Dict[str, "FragmentDefinitionNode"],
-        root_value: Optional[Any],
-        operation: "OperationDefinitionNode",
-        variable_values: Optional[Dict[str, Any]],
+        parent_path: Optional["Path"],
+        key: Union[str, int],
+        execution_context: "ExecutionContext",
         is_introspection_context: bool,
     ):
         """
-        :param field_name: name of the resolved field
+        :param field_definition: GraphQLField instance of the resolved field
         :param field_nodes: AST nodes related to the resolved field
-        :param return_type: GraphQLOutputType instance of the resolved field
         :param parent_type: GraphQLObjectType of the field's parent
-        :param path: the path traveled until this field
-        :param schema: the GraphQLSchema instance linked to the engine
-        :param fragments: a dictionary of fragment definition AST nodes
-        contained in the request
-        :param root_value: the initial value corresponding to the root type
-        being executed
-        :param operation: the AST operation definition node to execute
-        :param variable_values: the variables provided in the GraphQL request
+        :param parent_path: the path traveled until the field's parent
+        :param key: the response key of the field
+        :param execution_context: instance of the query execution context
         :param is_introspection_context: determines whether or not the resolved
         field is in a context of an introspection query
-        :type field_name: str
+        :type field_definition: GraphQLField
         :type field_nodes: List[FieldNodes]
-        :type return_type: GraphQLOutputType
         :type parent_type: GraphQLObjectType
-        :type path: Path
-        :type schema: GraphQLSchema
-        :type fragments: Dict[str, FragmentDefinitionNode]
-        :type root_value: Optional[Any]
-        :type operation: OperationDefinitionNode
-        :type variable_values: Optional[Dict[str, Any]]
+        :type parent_path: Optional[Path]
+        :type key: Union[str, int]
+        :type execution_context: ExecutionContext
         :type is_introspection_context: bool
         """
-        # pylint: disable=too-many-arguments,too-many-locals
-        self.field_name = field_name
+        # pylint: disable=too-many-arguments
         self.field_nodes = field_nodes
-        self.return_type = return_type
         self.parent_type = parent_type
-        self.path = path
-        self.schema = schema
-        self.fragments = fragments
-        self.root_value = root_value
-        self.operation = operation
-        self.variable_values = variable_values
         self.is_introspection: bool = is_introspection_context
+        self._parent_path = parent_path
+        self._key = key
+        self._path: Optional["Path"] = None
+        self._field_definition = field_definition
+        self._execution_context = execution_context
+
+    @property
+    def path(self) -> "Path":
+        """
+        Returns the path traveled until this field, which is computed from
+        the path of the field's parent the first time it's read.
+        :return: the path traveled until this field
+        :rtype: Path
+        """
+        if self._path is None:
+            self._path = Path(self._parent_path, self._key)
+        return self._path
+
+    @property
+    def field_name(self) -> str:
+        """
+        Returns the name of the resolved field.
+        :return: the name of the resolved field
+        :rtype: str
+        """
+        return self._field_definition.name
+
+    @property
+    def return_type(self) -> "GraphQLOutputType":
+        """
+        Returns the GraphQLOutputType instance of the resolved field.
+        :return: the GraphQLOutputType instance of the resolved field
+        :rtype: GraphQLOutputType
+        """
+        return self._field_definition.graphql_type
+
+    @property
+    def schema(self) -> "GraphQLSchema":
+        """
+        Returns the GraphQLSchema instance linked to the engine.
+        :return: the GraphQLSchema instance linked to the engine
+        :rtype: GraphQLSchema
+        """
+        return self._execution_context.schema
+
+    @property
+    def fragments(self) -> Dict[str, "FragmentDefinitionNode"]:
+        """
+        Returns the dictionary of fragment definition AST nodes contained in
+        the request.
+        :return: the dictionary of fragment definition AST nodes
+        :rtype: Dict[str, FragmentDefinitionNode]
+        """
+        return self._execution_context.fragments
+
+    @property
+    def root_value(self) -> Optional[Any]:
+        """
+        Returns the initial value corresponding to the root type being
+        executed.
+        :return: the initial value corresponding to the root type
+        :rtype: Optional[Any]
+        """
+        return self._execution_context.root_value
+
+    @property
+    def operation(self) -> "OperationDefinitionNode":
+        """
+        Returns the AST operation definition node to execute.
+        :return: the AST operation definition node to execute
+        :rtype: OperationDefinitionNode
+        """
+        return self._execution_context.operation
+
+    @property
+    def variable_values(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the variables provided in the GraphQL request.
+        :return: the variables provided in the GraphQL request
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return self._execution_context.variable_values
+
+    @property
+    def loaders(self) -> "DataLoaderRegistry":
+        """
+        Returns the DataLoader instances of the request.
+        :return: the DataLoader instances of the request
+        :rtype: DataLoaderRegistry
+        """
+        return self._execution_context.loaders
 
 
 def build_resolve_info(
@@ -82,7 +154,8 @@ def build_resolve_info(
     field_definition: "GraphQLField",
     field_nodes: List["FieldNode"],
     parent_type: "GraphQLObjectType",
-    path: "Path",
+    parent_path: Optional["Path"],
+    key: Union[str, int],
     is_introspection_context: bool = False,
 ) -> "ResolveInfo":
     """
@@ -91,28 +164,27 @@ def build_resolve_info(
     :param field_definition: GraphQLField instance of the resolved field
     :param field_nodes: AST nodes related to the resolved field
     :param parent_type: GraphQLObjectType of the field's parent
-    :param path: the path traveled until this resolver
+    :param parent_path: the path traveled until the field's parent
+    :param key: the response key of the field
     :param is_introspection_context: determines whether or not the resolved
     field is in a context of an introspection query
     :type execution_context: ExecutionContext
     :type field_definition: GraphQLField
     :type field_nodes: List[FieldNode]
     :type parent_type: GraphQLObjectType
-    :type path: Path
+    :type parent_path: Optional[Path]
+    :type key: Union[str, int]
     :type is_introspection_context: bool
     :return: a ResolveInfo instance
     :rtype: ResolveInfo
     """
+    # pylint: disable=too-many-arguments
     return ResolveInfo(
-        field_definition.name,
+        field_definition,
         field_nodes,
-        field_definition.graphql_type,
         parent_type,
-        path,
-        execution_context.schema,
-        execution_context.fragments,
-        execution_context.root_value,
-        execution_context.operation,
-        execution_context.variable_values,
+        parent_path,
+        key,
+        execution_context,
         is_introspection_context,
     )
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from tartiflette.language.ast.base import Node
 
@@ -10,7 +10,17 @@ class DocumentNode(Node):
     AST node representing a GraphQL document.
     """
 
-    __slots__ = ("definitions", "location", "_hash_id", "validators")
+    __slots__ = (
+        "definitions",
+        "location",
+        "_hash_id",
+        "validators",
+        "execution_plans",
+        "directive_resolvers",
+        "variable_definitions",
+        "costs",
+        "schema_fingerprint",
+    )
 
     def __init__(
         self,
@@ -18,21 +28,36 @@ class DocumentNode(Node):
         validators: Optional["Validators"] = None,
         location: Optional["Location"] = None,
         hash_id: Optional[int] = None,
+        costs: Optional[Dict[Optional[str], "QueryCost"]] = None,
+        schema_fingerprint: Optional[str] = None,
     ) -> None:
         """
         :param definitions: definitions of the document
         :param location: location of the document in the query/SDL
         :param hash_id: hash of the DocumentNode
         :param validators: a validators object that will be used to validate the document
+        :param costs: costs of the operations of the document computed during
+        its validation
+        :param schema_fingerprint: fingerprint of the schema the document has
+        been validated against (None if it hasn't been validated)
         :type definitions: List[DefinitionNode]
         :type location: Optional[Location]
         :type hash_id: Optional[int]
         :type validators: Optional["Validators"]
+        :type costs: Optional[Dict[Optional[str], QueryCost]]
+        :type schema_fingerprint: Optional[str]
         """
         self.definitions = definitions
         self.location = location
         self._hash_id = hash_id
         self.validators = validators
+        self.execution_plans: Dict[Any, Any] = {}
+        self.directive_resolvers: Dict[Any, Callable] = {}
+        self.variable_definitions: Dict[
+            int, List["ExecutableVariableDefinition"]
+        ] = {}
+        self.costs: Dict[Optional[str], "QueryCost"] = costs or {}
+        self.schema_fingerprint = schema_fingerprint
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -59,6 +84,30 @@ class DocumentNode(Node):
             self.location,
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns the state of the DocumentNode to pickle, without its
+        validators nor its caches bound to the GraphQLSchema instance it has
+        been executed against.
+        :return: the state of the DocumentNode
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "definitions": self.definitions,
+            "location": self.location,
+            "hash_id": self._hash_id,
+            "costs": self.costs,
+            "schema_fingerprint": self.schema_fingerprint,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores the state of a pickled DocumentNode.
+        :param state: the state of the DocumentNode
+        :type state: Dict[str, Any]
+        """
+        self.__init__(**state)
+
     def __hash__(self):
         """
         Returns the hash as a unique representation of a DocumentNode.
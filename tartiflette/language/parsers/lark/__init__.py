@@ -1,3 +1,3 @@
-from .parser import parse_to_document
+from .parser import get_lark_parser, parse_to_document
 
-__all__ = ("parse_to_document",)
+__all__ = ("get_lark_parser", "parse_to_document")
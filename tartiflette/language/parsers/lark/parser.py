@@ -1,31 +1,152 @@
+import hashlib
 import os
+import pickle
+import sys
 
-from typing import Union
+from typing import Optional, Union
+
+import lark
 
 from lark import Lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
 
 from tartiflette.language.parsers.lark.transformers import (
     NodeTransformer,
     TokenTransformer,
 )
 
-__all__ = ("parse_to_document",)
+__all__ = ("get_lark_parser", "parse_to_document")
 
-_LARK_PARSER = Lark.open(
-    os.path.join(os.path.dirname(__file__), "graphql_sdl_grammar.lark"),
-    start="document",
-    parser="lalr",
-    lexer="contextual",
-    propagate_positions=True,
+_GRAMMAR_PATH = os.path.join(
+    os.path.dirname(__file__), "graphql_sdl_grammar.lark"
 )
 
+_LARK_OPTIONS = {
+    "start": "document",
+    "parser": "lalr",
+    "lexer": "contextual",
+    "propagate_positions": True,
+}
+
+# Bumped each time the layout of the cached parser changes
+_CACHE_FORMAT_VERSION = 1
+
+# Readable by all the supported Python versions
+_PICKLE_PROTOCOL = 4
+
+# Built on the first parse rather than at import time, since the SDL is only
+# parsed while cooking an engine
+_LARK_PARSER: Optional[Lark] = None
+
+
+def _get_cache_path(directory: str) -> str:
+    """
+    Returns the path of the cached parser, which is keyed by the SHA-256
+    digest of the grammar, of the parser options and of the versions of lark
+    & Python which built it.
+    :param directory: path to the directory containing the cached parser
+    :type directory: str
+    :return: the path of the cached parser
+    :rtype: str
+    """
+    with open(_GRAMMAR_PATH, "rb") as grammar_file:
+        key = hashlib.sha256(grammar_file.read())
+    key.update(
+        "\n{}\n{}\n{}\n{}".format(
+            sorted(_LARK_OPTIONS.items()),
+            _CACHE_FORMAT_VERSION,
+            lark.__version__,
+            sys.version,
+        ).encode("utf-8")
+    )
+    return os.path.join(directory, f"lark_{key.hexdigest()}.pickle")
+
+
+def _load_lark_parser(directory: str) -> Optional[Lark]:
+    """
+    Returns the parser cached into the directory or None if there is no
+    (readable) cached parser. Since the cached parser is unpickled, the
+    directory should be a trusted location.
+    :param directory: path to the directory containing the cached parser
+    :type directory: str
+    :return: the cached parser
+    :rtype: Optional[Lark]
+    """
+    path = _get_cache_path(directory)
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, "rb") as cache_file:
+            data, memo = pickle.load(cache_file)
+        return Lark.deserialize(
+            data, {"Rule": Rule, "TerminalDef": TerminalDef}, memo
+        )
+    except Exception:  # pylint: disable=broad-except
+        # A corrupted cached parser is built again from the grammar
+        return None
+
+
+def _dump_lark_parser(directory: str, parser: Lark) -> None:
+    """
+    Stores the parse tables of the parser into the directory. The file is
+    written atomically, so that processes building the parser concurrently
+    either read a complete cached parser or none.
+    :param directory: path to the directory containing the cached parser
+    :param parser: the parser to cache
+    :type directory: str
+    :type parser: Lark
+    """
+    path = _get_cache_path(directory)
+    os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as cache_file:
+        pickle.dump(
+            parser.memo_serialize([TerminalDef, Rule]),
+            cache_file,
+            protocol=_PICKLE_PROTOCOL,
+        )
+    os.replace(tmp_path, path)
+
+
+def get_lark_parser(cache_directory: Optional[str] = None) -> Lark:
+    """
+    Returns the Lark parser of the SDL, which is built from the grammar (or
+    read from the cache directory when provided) the first time it's needed.
+    :param cache_directory: path to a directory caching the parser
+    :type cache_directory: Optional[str]
+    :return: the Lark parser of the SDL
+    :rtype: Lark
+    """
+    global _LARK_PARSER  # pylint: disable=global-statement
+    if _LARK_PARSER is not None:
+        return _LARK_PARSER
+
+    parser = None
+    if cache_directory:
+        parser = _load_lark_parser(cache_directory)
+
+    if parser is None:
+        parser = Lark.open(_GRAMMAR_PATH, **_LARK_OPTIONS)
+        if cache_directory:
+            _dump_lark_parser(cache_directory, parser)
+
+    _LARK_PARSER = parser
+    return parser
+
 
-def parse_to_document(sdl: Union[str, bytes]) -> "DocumentNode":
+def parse_to_document(
+    sdl: Union[str, bytes], cache_directory: Optional[str] = None
+) -> "DocumentNode":
     """
     Returns a DocumentNode instance which represents the SDL after being
     parsed.
     :param sdl: sdl to parse and transform into a DocumentNode
+    :param cache_directory: path to a directory caching the Lark parser
     :type sdl: Union[str, bytes]
+    :type cache_directory: Optional[str]
     :return: a DocumentNode representing the sdl
     :rtype: DocumentNode
 
@@ -38,7 +159,7 @@ def parse_to_document(sdl: Union[str, bytes]) -> "DocumentNode":
     >>>   hello(name: String!): String!
     >>> }''')
     """
-    parsed = _LARK_PARSER.parse(sdl)
+    parsed = get_lark_parser(cache_directory).parse(sdl)
     node_transformer = NodeTransformer()
     transformer = TokenTransformer() * node_transformer
     transformer.transform(parsed)
@@ -9,9 +9,13 @@ from cffi import FFI
 from tartiflette.language.parsers.libgraphqlparser.transformers import (
     document_from_ast_json,
 )
+from tartiflette.language.parsers.libgraphqlparser.walker import (
+    VISITOR_CDEF,
+    AstWalker,
+)
 from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
 
-__all__ = ("parse_to_document",)
+__all__ = ("parse_to_document", "parse_to_document_from_json")
 
 # TODO: automatize read from headers files
 _FFI = FFI()
@@ -27,6 +31,7 @@ void graphql_node_free(struct GraphQLAstNode *node);
 const char *graphql_ast_to_json(const struct GraphQLAstNode *node);
 """
 )
+_FFI.cdef(VISITOR_CDEF)
 
 # TODO: use importlib.resource in Python 3.7
 _LIBGRAPHQLPARSER_DIR = os.path.join(os.path.dirname(__file__), "cffi")
@@ -35,6 +40,8 @@ try:
 except OSError:
     _LIB = _FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.dylib")
 
+_AST_WALKER = AstWalker(_FFI, _LIB)
+
 
 class ParsedData:
     """
@@ -124,16 +131,32 @@ def _parse_to_json_ast(query: Union[str, bytes]) -> bytes:
         return _FFI.string(_LIB.graphql_ast_to_json(parsed))
 
 
+def _parse_to_ast(query: Union[str, bytes]) -> dict:
+    """
+    Parses the query and returns its AST representation built directly from
+    the libgraphqlparser C AST, without any JSON round-trip.
+    :param query: query to parse
+    :type query: Union[str, bytes]
+    :return: AST representation of the query
+    :rtype: dict
+    """
+    with _parse_context_manager(query) as parsed:
+        return _AST_WALKER.walk(parsed)
+
+
 def parse_to_document(
-    query: Union[str, bytes], schema: "GraphQLSchema"
+    query: Union[str, bytes], schema: "GraphQLSchema", validate: bool = True
 ) -> "DocumentNode":
     """
     Returns a DocumentNode instance which represents the query after being
-    parsed.
+    parsed & validated. The validation can be skipped for queries coming from
+    a trusted source (e.g. an allow-list of persisted queries).
     :param query: query to parse and transform into a DocumentNode
     :type query: Union[str, bytes]
     :param schema: the GraphQLSchema instance linked to the engine
     :type schema: GraphQLSchema
+    :param validate: whether or not the document should be validated
+    :type validate: bool
     :return: a DocumentNode representing the query
     :rtype: DocumentNode
 
@@ -152,5 +175,27 @@ def parse_to_document(
     >>> }''')
     """
     return document_from_ast_json(
-        json.loads(_parse_to_json_ast(query)), query, schema
+        _parse_to_ast(query), query, schema, validate
+    )
+
+
+def parse_to_document_from_json(
+    query: Union[str, bytes], schema: "GraphQLSchema", validate: bool = True
+) -> "DocumentNode":
+    """
+    Returns a DocumentNode instance which represents the query after being
+    parsed, using the libgraphqlparser JSON serialization of the AST. Behaves
+    exactly like `parse_to_document` but is slower since the AST has to be
+    serialized to JSON then deserialized.
+    :param query: query to parse and transform into a DocumentNode
+    :type query: Union[str, bytes]
+    :param schema: the GraphQLSchema instance linked to the engine
+    :type schema: GraphQLSchema
+    :param validate: whether or not the document should be validated
+    :type validate: bool
+    :return: a DocumentNode representing the query
+    :rtype: DocumentNode
+    """
+    return document_from_ast_json(
+        json.loads(_parse_to_json_ast(query)), query, schema, validate
     )
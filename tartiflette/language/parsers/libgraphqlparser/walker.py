@@ -0,0 +1,556 @@
+from typing import List, Optional
+
+from tartiflette.language.ast import Location
+
+__all__ = ("CONCRETE_TYPES", "VISITOR_CDEF", "AstWalker")
+
+# Same order as the `FOR_EACH_CONCRETE_TYPE` macro of libgraphqlparser since
+# it defines the layout of the `GraphQLAstVisitorCallbacks` structure.
+CONCRETE_TYPES = (
+    ("Document", "document"),
+    ("OperationDefinition", "operation_definition"),
+    ("VariableDefinition", "variable_definition"),
+    ("SelectionSet", "selection_set"),
+    ("Field", "field"),
+    ("Argument", "argument"),
+    ("FragmentSpread", "fragment_spread"),
+    ("InlineFragment", "inline_fragment"),
+    ("FragmentDefinition", "fragment_definition"),
+    ("Variable", "variable"),
+    ("IntValue", "int_value"),
+    ("FloatValue", "float_value"),
+    ("StringValue", "string_value"),
+    ("BooleanValue", "boolean_value"),
+    ("NullValue", "null_value"),
+    ("EnumValue", "enum_value"),
+    ("ListValue", "list_value"),
+    ("ObjectValue", "object_value"),
+    ("ObjectField", "object_field"),
+    ("Directive", "directive"),
+    ("NamedType", "named_type"),
+    ("ListType", "list_type"),
+    ("NonNullType", "non_null_type"),
+    ("Name", "name"),
+    ("SchemaDefinition", "schema_definition"),
+    ("OperationTypeDefinition", "operation_type_definition"),
+    ("ScalarTypeDefinition", "scalar_type_definition"),
+    ("ObjectTypeDefinition", "object_type_definition"),
+    ("FieldDefinition", "field_definition"),
+    ("InputValueDefinition", "input_value_definition"),
+    ("InterfaceTypeDefinition", "interface_type_definition"),
+    ("UnionTypeDefinition", "union_type_definition"),
+    ("EnumTypeDefinition", "enum_type_definition"),
+    ("EnumValueDefinition", "enum_value_definition"),
+    ("InputObjectTypeDefinition", "input_object_type_definition"),
+    ("TypeExtensionDefinition", "type_extension_definition"),
+    ("DirectiveDefinition", "directive_definition"),
+)
+
+# Every AST node is handled as an opaque `struct GraphQLAstNode *` in order to
+# avoid casting pointers from one node type to another on each call.
+VISITOR_CDEF = """
+struct GraphQLAstLocation {
+    unsigned int beginLine;
+    unsigned int beginColumn;
+    unsigned int endLine;
+    unsigned int endColumn;
+};
+
+void graphql_node_get_location(
+    const struct GraphQLAstNode *node, struct GraphQLAstLocation *location);
+
+struct GraphQLAstVisitorCallbacks {
+%(callbacks)s
+};
+
+void graphql_node_visit(
+    const struct GraphQLAstNode *node,
+    const struct GraphQLAstVisitorCallbacks *callbacks,
+    void *userData);
+
+int GraphQLAstDocument_get_definitions_size(const struct GraphQLAstNode *);
+const char *GraphQLAstOperationDefinition_get_operation(
+    const struct GraphQLAstNode *);
+const struct GraphQLAstNode *GraphQLAstOperationDefinition_get_name(
+    const struct GraphQLAstNode *);
+int GraphQLAstOperationDefinition_get_variable_definitions_size(
+    const struct GraphQLAstNode *);
+int GraphQLAstOperationDefinition_get_directives_size(
+    const struct GraphQLAstNode *);
+const struct GraphQLAstNode *GraphQLAstVariableDefinition_get_default_value(
+    const struct GraphQLAstNode *);
+int GraphQLAstSelectionSet_get_selections_size(const struct GraphQLAstNode *);
+const struct GraphQLAstNode *GraphQLAstField_get_alias(
+    const struct GraphQLAstNode *);
+int GraphQLAstField_get_arguments_size(const struct GraphQLAstNode *);
+int GraphQLAstField_get_directives_size(const struct GraphQLAstNode *);
+const struct GraphQLAstNode *GraphQLAstField_get_selection_set(
+    const struct GraphQLAstNode *);
+int GraphQLAstFragmentSpread_get_directives_size(
+    const struct GraphQLAstNode *);
+const struct GraphQLAstNode *GraphQLAstInlineFragment_get_type_condition(
+    const struct GraphQLAstNode *);
+int GraphQLAstInlineFragment_get_directives_size(
+    const struct GraphQLAstNode *);
+int GraphQLAstFragmentDefinition_get_directives_size(
+    const struct GraphQLAstNode *);
+const char *GraphQLAstIntValue_get_value(const struct GraphQLAstNode *);
+const char *GraphQLAstFloatValue_get_value(const struct GraphQLAstNode *);
+const char *GraphQLAstStringValue_get_value(const struct GraphQLAstNode *);
+int GraphQLAstBooleanValue_get_value(const struct GraphQLAstNode *);
+const char *GraphQLAstEnumValue_get_value(const struct GraphQLAstNode *);
+int GraphQLAstListValue_get_values_size(const struct GraphQLAstNode *);
+int GraphQLAstObjectValue_get_fields_size(const struct GraphQLAstNode *);
+int GraphQLAstDirective_get_arguments_size(const struct GraphQLAstNode *);
+const char *GraphQLAstName_get_value(const struct GraphQLAstNode *);
+""" % {
+    "callbacks": "\n".join(
+        "    int (*visit_{0})(const struct GraphQLAstNode *, void *);\n"
+        "    void (*end_visit_{0})(const struct GraphQLAstNode *, void *);".format(
+            snake_type
+        )
+        for _, snake_type in CONCRETE_TYPES
+    )
+}
+
+
+def _pop_many(stack: List[dict], size: int) -> Optional[List[dict]]:
+    """
+    Pops and returns the `size` last nodes of the stack in the visit order.
+    :param stack: stack of already visited nodes
+    :param size: number of nodes to pop
+    :type stack: List[dict]
+    :type size: int
+    :return: the popped nodes or None if `size` is 0
+    :rtype: Optional[List[dict]]
+    """
+    if not size:
+        return None
+    nodes = stack[-size:]
+    del stack[-size:]
+    return nodes
+
+
+class _WalkStack(list):
+    """
+    Stack of the nodes visited during a walk, which also holds the buffer used
+    to read node locations so that concurrent walks don't share it.
+    """
+
+    __slots__ = ("location", "location_array")
+
+    def __init__(self, ffi: "FFI") -> None:
+        """
+        :param ffi: FFI instance which has loaded the `VISITOR_CDEF`
+        :type ffi: FFI
+        """
+        super().__init__()
+        self.location = ffi.new("struct GraphQLAstLocation *")
+        self.location_array = ffi.cast("unsigned int *", self.location)
+
+
+class AstWalker:
+    """
+    Walks through a libgraphqlparser C AST using the libgraphqlparser C
+    visitor API and builds the same representation as the one returned by
+    `json.loads` on the libgraphqlparser JSON output, except that the `loc`
+    values are directly Location instances. This avoids the serialization of
+    the AST into a JSON string and its deserialization on the Python side.
+    """
+
+    def __init__(self, ffi: "FFI", lib: "Lib") -> None:
+        """
+        :param ffi: FFI instance which has loaded the `VISITOR_CDEF`
+        :param lib: the libgraphqlparser library opened by the `ffi`
+        :type ffi: FFI
+        :type lib: Lib
+        """
+        self._ffi = ffi
+        self._lib = lib
+        # C callbacks have to be kept alive as long as they are used. Type
+        # system definitions don't need any since `graphql_parse_string` has
+        # its schema support disabled.
+        self._c_callbacks = []
+        self._callbacks = ffi.new("struct GraphQLAstVisitorCallbacks *")
+        for _, snake_type in CONCRETE_TYPES[:24]:
+            c_callback = ffi.callback(
+                "void(const struct GraphQLAstNode *, void *)",
+                getattr(self, f"_end_visit_{snake_type}"),
+            )
+            self._c_callbacks.append(c_callback)
+            setattr(self._callbacks, f"end_visit_{snake_type}", c_callback)
+
+    def walk(self, c_document: "CData") -> dict:
+        """
+        Walks through the C AST document and returns its representation.
+        :param c_document: struct GraphQLAstNode * of the parsed document
+        :type c_document: CData
+        :return: the representation of the document
+        :rtype: dict
+        """
+        stack = _WalkStack(self._ffi)
+        self._lib.graphql_node_visit(
+            c_document, self._callbacks, self._ffi.new_handle(stack)
+        )
+        return stack.pop()
+
+    def _stack(self, user_data: "CData") -> "_WalkStack":
+        return self._ffi.from_handle(user_data)
+
+    def _loc(self, node: "CData", stack: "_WalkStack") -> "Location":
+        """
+        Returns the Location of the C AST node.
+        :param node: struct GraphQLAstNode *
+        :param stack: stack of the current walk
+        :type node: CData
+        :type stack: _WalkStack
+        :return: the location of the node
+        :rtype: Location
+        """
+        self._lib.graphql_node_get_location(node, stack.location)
+        return Location(*self._ffi.unpack(stack.location_array, 4))
+
+    def _string(self, c_string: "CData") -> str:
+        return self._ffi.string(c_string).decode("UTF-8")
+
+    def _end_visit_document(self, node, user_data):
+        stack = self._stack(user_data)
+        definitions = _pop_many(
+            stack, self._lib.GraphQLAstDocument_get_definitions_size(node)
+        )
+        stack.append(
+            {
+                "kind": "Document",
+                "loc": self._loc(node, stack),
+                "definitions": definitions or [],
+            }
+        )
+
+    def _end_visit_operation_definition(self, node, user_data):
+        lib = self._lib
+        stack = self._stack(user_data)
+        selection_set = stack.pop()
+        directives = _pop_many(
+            stack, lib.GraphQLAstOperationDefinition_get_directives_size(node)
+        )
+        variable_definitions = _pop_many(
+            stack,
+            lib.GraphQLAstOperationDefinition_get_variable_definitions_size(
+                node
+            ),
+        )
+        name = (
+            stack.pop()
+            if lib.GraphQLAstOperationDefinition_get_name(node)
+            else None
+        )
+        stack.append(
+            {
+                "kind": "OperationDefinition",
+                "loc": self._loc(node, stack),
+                "operation": self._string(
+                    lib.GraphQLAstOperationDefinition_get_operation(node)
+                ),
+                "name": name,
+                "variableDefinitions": variable_definitions,
+                "directives": directives,
+                "selectionSet": selection_set,
+            }
+        )
+
+    def _end_visit_variable_definition(self, node, user_data):
+        stack = self._stack(user_data)
+        default_value = (
+            stack.pop()
+            if self._lib.GraphQLAstVariableDefinition_get_default_value(node)
+            else None
+        )
+        type_ = stack.pop()
+        stack.append(
+            {
+                "kind": "VariableDefinition",
+                "loc": self._loc(node, stack),
+                "variable": stack.pop(),
+                "type": type_,
+                "defaultValue": default_value,
+            }
+        )
+
+    def _end_visit_selection_set(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "SelectionSet",
+                "loc": self._loc(node, stack),
+                "selections": _pop_many(
+                    stack,
+                    self._lib.GraphQLAstSelectionSet_get_selections_size(node),
+                ),
+            }
+        )
+
+    def _end_visit_field(self, node, user_data):
+        lib = self._lib
+        stack = self._stack(user_data)
+        selection_set = (
+            stack.pop()
+            if lib.GraphQLAstField_get_selection_set(node)
+            else None
+        )
+        directives = _pop_many(
+            stack, lib.GraphQLAstField_get_directives_size(node)
+        )
+        arguments = _pop_many(
+            stack, lib.GraphQLAstField_get_arguments_size(node)
+        )
+        name = stack.pop()
+        stack.append(
+            {
+                "kind": "Field",
+                "loc": self._loc(node, stack),
+                "alias": (
+                    stack.pop()
+                    if lib.GraphQLAstField_get_alias(node)
+                    else None
+                ),
+                "name": name,
+                "arguments": arguments,
+                "directives": directives,
+                "selectionSet": selection_set,
+            }
+        )
+
+    def _end_visit_argument(self, node, user_data):
+        stack = self._stack(user_data)
+        value = stack.pop()
+        stack.append(
+            {
+                "kind": "Argument",
+                "loc": self._loc(node, stack),
+                "name": stack.pop(),
+                "value": value,
+            }
+        )
+
+    def _end_visit_fragment_spread(self, node, user_data):
+        stack = self._stack(user_data)
+        directives = _pop_many(
+            stack, self._lib.GraphQLAstFragmentSpread_get_directives_size(node)
+        )
+        stack.append(
+            {
+                "kind": "FragmentSpread",
+                "loc": self._loc(node, stack),
+                "name": stack.pop(),
+                "directives": directives,
+            }
+        )
+
+    def _end_visit_inline_fragment(self, node, user_data):
+        lib = self._lib
+        stack = self._stack(user_data)
+        selection_set = stack.pop()
+        directives = _pop_many(
+            stack, lib.GraphQLAstInlineFragment_get_directives_size(node)
+        )
+        stack.append(
+            {
+                "kind": "InlineFragment",
+                "loc": self._loc(node, stack),
+                "typeCondition": (
+                    stack.pop()
+                    if lib.GraphQLAstInlineFragment_get_type_condition(node)
+                    else None
+                ),
+                "directives": directives,
+                "selectionSet": selection_set,
+            }
+        )
+
+    def _end_visit_fragment_definition(self, node, user_data):
+        stack = self._stack(user_data)
+        selection_set = stack.pop()
+        directives = _pop_many(
+            stack,
+            self._lib.GraphQLAstFragmentDefinition_get_directives_size(node),
+        )
+        type_condition = stack.pop()
+        stack.append(
+            {
+                "kind": "FragmentDefinition",
+                "loc": self._loc(node, stack),
+                "name": stack.pop(),
+                "typeCondition": type_condition,
+                "directives": directives,
+                "selectionSet": selection_set,
+            }
+        )
+
+    def _end_visit_variable(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "Variable",
+                "loc": self._loc(node, stack),
+                "name": stack.pop(),
+            }
+        )
+
+    def _end_visit_int_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "IntValue",
+                "loc": self._loc(node, stack),
+                "value": self._string(
+                    self._lib.GraphQLAstIntValue_get_value(node)
+                ),
+            }
+        )
+
+    def _end_visit_float_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "FloatValue",
+                "loc": self._loc(node, stack),
+                "value": self._string(
+                    self._lib.GraphQLAstFloatValue_get_value(node)
+                ),
+            }
+        )
+
+    def _end_visit_string_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "StringValue",
+                "loc": self._loc(node, stack),
+                "value": self._string(
+                    self._lib.GraphQLAstStringValue_get_value(node)
+                ),
+            }
+        )
+
+    def _end_visit_boolean_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "BooleanValue",
+                "loc": self._loc(node, stack),
+                "value": bool(
+                    self._lib.GraphQLAstBooleanValue_get_value(node)
+                ),
+            }
+        )
+
+    def _end_visit_null_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append({"kind": "NullValue", "loc": self._loc(node, stack)})
+
+    def _end_visit_enum_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "EnumValue",
+                "loc": self._loc(node, stack),
+                "value": self._string(
+                    self._lib.GraphQLAstEnumValue_get_value(node)
+                ),
+            }
+        )
+
+    def _end_visit_list_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "ListValue",
+                "loc": self._loc(node, stack),
+                "values": _pop_many(
+                    stack, self._lib.GraphQLAstListValue_get_values_size(node)
+                )
+                or [],
+            }
+        )
+
+    def _end_visit_object_value(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "ObjectValue",
+                "loc": self._loc(node, stack),
+                "fields": _pop_many(
+                    stack,
+                    self._lib.GraphQLAstObjectValue_get_fields_size(node),
+                )
+                or [],
+            }
+        )
+
+    def _end_visit_object_field(self, node, user_data):
+        stack = self._stack(user_data)
+        value = stack.pop()
+        stack.append(
+            {
+                "kind": "ObjectField",
+                "loc": self._loc(node, stack),
+                "name": stack.pop(),
+                "value": value,
+            }
+        )
+
+    def _end_visit_directive(self, node, user_data):
+        stack = self._stack(user_data)
+        arguments = _pop_many(
+            stack, self._lib.GraphQLAstDirective_get_arguments_size(node)
+        )
+        stack.append(
+            {
+                "kind": "Directive",
+                "loc": self._loc(node, stack),
+                "name": stack.pop(),
+                "arguments": arguments,
+            }
+        )
+
+    def _end_visit_named_type(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "NamedType",
+                "loc": self._loc(node, stack),
+                "name": stack.pop(),
+            }
+        )
+
+    def _end_visit_list_type(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "ListType",
+                "loc": self._loc(node, stack),
+                "type": stack.pop(),
+            }
+        )
+
+    def _end_visit_non_null_type(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "NonNullType",
+                "loc": self._loc(node, stack),
+                "type": stack.pop(),
+            }
+        )
+
+    def _end_visit_name(self, node, user_data):
+        stack = self._stack(user_data)
+        stack.append(
+            {
+                "kind": "Name",
+                "loc": self._loc(node, stack),
+                "value": self._string(
+                    self._lib.GraphQLAstName_get_value(node)
+                ),
+            }
+        )
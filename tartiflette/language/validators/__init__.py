@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Any, Dict, List
 
 
 class Validators:
@@ -40,11 +40,34 @@ class Validators:
         """
 
         if not self._abort:
-            rule_errors = self.rules[rule].validate(
-                path=path, schema=self.schema, **kwargs, **self.ctx
+            self.report(
+                self.rules[rule],
+                self.rules[rule].validate(
+                    path=path, schema=self.schema, **kwargs, **self.ctx
+                ),
             )
 
-            if self.rules[rule].abort and rule_errors:
-                self._abort = True
+    @property
+    def aborted(self) -> bool:
+        """
+        Whether or not a rule aborted the validation.
+        :rtype: bool
+        """
+        return self._abort
+
+    def report(
+        self, rule: "ValidationRule", rule_errors: List["TartifletteError"]
+    ) -> None:
+        """
+        Collects the errors returned by a rule, aborting the validation if the
+        rule requires it.
+
+        :param rule: The rule which returned the errors
+        :type rule: ValidationRule
+        :param rule_errors: The errors returned by the rule
+        :type rule_errors: List[TartifletteError]
+        """
+        if rule.abort and rule_errors:
+            self._abort = True
 
-            self.errors.extend(rule_errors)
+        self.errors.extend(rule_errors)
@@ -22,7 +22,12 @@ from .fragments_on_composite_types import FragmentsOnCompositeTypes
 from .input_object_field_uniqueness import InputObjectFieldUniqueness
 from .leaf_field_selections import LeafFieldSelections
 from .lone_anonymous_operation import LoneAnonymousOperation
+from .max_aliases import MaxAliases
+from .max_field_nodes import MaxFieldNodes
+from .max_fragment_spreads import MaxFragmentSpreads
+from .max_selection_depth import MaxSelectionDepth
 from .operation_name_uniqueness import OperationNameUniqueness
+from .query_cost import QueryCostLimits
 from .required_arguments import RequiredArguments
 from .single_root_field import SingleRootField
 from .values_of_correct_type import ValuesOfCorrectType
@@ -31,33 +36,40 @@ from .variables_are_input_types import VariablesAreInputTypes
 
 # TODO make this automatically via reflection
 
+# The callbacks registered by the rules on a node are called in the order of
+# the rule set, which determines the order of the validation errors
 RULE_SET = {
-    AllVariableUsagesAreAllowed.RULE_NAME: AllVariableUsagesAreAllowed(),
-    AllVariablesUsed.RULE_NAME: AllVariablesUsed(),
-    AllVariableUsesDefined.RULE_NAME: AllVariableUsesDefined(),
-    ArgumentNames.RULE_NAME: ArgumentNames(),
+    InputObjectFieldUniqueness.RULE_NAME: InputObjectFieldUniqueness(),
     ArgumentUniqueness.RULE_NAME: ArgumentUniqueness(),
-    DirectivesAreDefined.RULE_NAME: DirectivesAreDefined(),
-    DirectivesAreInValidLocations.RULE_NAME: DirectivesAreInValidLocations(),
+    VariablesAreInputTypes.RULE_NAME: VariablesAreInputTypes(),
+    VariableUniqueness.RULE_NAME: VariableUniqueness(),
     DirectivesAreUniquePerLocation.RULE_NAME: DirectivesAreUniquePerLocation(),
-    ExecutableDefinition.RULE_NAME: ExecutableDefinition(),
+    DirectivesAreInValidLocations.RULE_NAME: DirectivesAreInValidLocations(),
     FieldSelectionsOnObjectsInterfacesAndUnionsTypes.RULE_NAME: FieldSelectionsOnObjectsInterfacesAndUnionsTypes(),
-    FragmentMustBeUsed.RULE_NAME: FragmentMustBeUsed(),
-    FragmentNameUniqueness.RULE_NAME: FragmentNameUniqueness(),
+    LeafFieldSelections.RULE_NAME: LeafFieldSelections(),
+    ValuesOfCorrectType.RULE_NAME: ValuesOfCorrectType(),
+    ArgumentNames.RULE_NAME: ArgumentNames(),
+    RequiredArguments.RULE_NAME: RequiredArguments(),
+    DirectivesAreDefined.RULE_NAME: DirectivesAreDefined(),
+    FragmentSpreadTypeExistence.RULE_NAME: FragmentSpreadTypeExistence(),
     FragmentsOnCompositeTypes.RULE_NAME: FragmentsOnCompositeTypes(),
-    FragmentSpreadIsPossible.RULE_NAME: FragmentSpreadIsPossible(),
+    MaxSelectionDepth.RULE_NAME: MaxSelectionDepth(),
+    MaxAliases.RULE_NAME: MaxAliases(),
+    MaxFieldNodes.RULE_NAME: MaxFieldNodes(),
+    MaxFragmentSpreads.RULE_NAME: MaxFragmentSpreads(),
     FragmentSpreadsMustNotFormCycles.RULE_NAME: FragmentSpreadsMustNotFormCycles(
         True
     ),
-    FragmentSpreadTargetDefined.RULE_NAME: FragmentSpreadTargetDefined(),
-    FragmentSpreadTypeExistence.RULE_NAME: FragmentSpreadTypeExistence(),
-    InputObjectFieldUniqueness.RULE_NAME: InputObjectFieldUniqueness(),
-    LeafFieldSelections.RULE_NAME: LeafFieldSelections(),
+    OperationNameUniqueness.RULE_NAME: OperationNameUniqueness(),
     LoneAnonymousOperation.RULE_NAME: LoneAnonymousOperation(),
-    RequiredArguments.RULE_NAME: RequiredArguments(),
     SingleRootField.RULE_NAME: SingleRootField(),
-    OperationNameUniqueness.RULE_NAME: OperationNameUniqueness(),
-    ValuesOfCorrectType.RULE_NAME: ValuesOfCorrectType(),
-    VariablesAreInputTypes.RULE_NAME: VariablesAreInputTypes(),
-    VariableUniqueness.RULE_NAME: VariableUniqueness(),
+    FragmentNameUniqueness.RULE_NAME: FragmentNameUniqueness(),
+    FragmentSpreadTargetDefined.RULE_NAME: FragmentSpreadTargetDefined(),
+    FragmentMustBeUsed.RULE_NAME: FragmentMustBeUsed(),
+    FragmentSpreadIsPossible.RULE_NAME: FragmentSpreadIsPossible(),
+    AllVariableUsesDefined.RULE_NAME: AllVariableUsesDefined(),
+    AllVariablesUsed.RULE_NAME: AllVariablesUsed(),
+    AllVariableUsagesAreAllowed.RULE_NAME: AllVariableUsagesAreAllowed(),
+    QueryCostLimits.RULE_NAME: QueryCostLimits(),
+    ExecutableDefinition.RULE_NAME: ExecutableDefinition(),
 }
@@ -182,3 +182,11 @@ class AllVariableUsagesAreAllowed(June2018ReleaseValidationRule):
             )
 
         return errors
+
+    def leave_document(self, _document, _path, schema, ctx):
+        return self.validate(
+            schema,
+            operations=ctx["operation_definitions"],
+            per_operation=ctx["per_operation"],
+            per_fragment=ctx["per_fragment"],
+        )
@@ -72,3 +72,10 @@ class AllVariablesUsed(June2018ReleaseValidationRule):
             )
 
         return errors
+
+    def leave_document(self, _document, _path, _schema, ctx):
+        return self.validate(
+            operations=ctx["operation_definitions"],
+            per_operation=ctx["per_operation"],
+            per_fragment=ctx["per_fragment"],
+        )
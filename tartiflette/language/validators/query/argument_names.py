@@ -71,3 +71,8 @@ class ArgumentNames(June2018ReleaseValidationRule):
         return self._validate_field_arguments(
             node, path, schema, parent_type_name
         )
+
+    def leave_field(self, node, path, schema, ctx):
+        return self.validate(node, path, schema, ctx["parent_type_name"])
+
+    leave_directive = leave_field
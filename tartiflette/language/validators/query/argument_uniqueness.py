@@ -38,3 +38,6 @@ class ArgumentUniqueness(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_arguments(self, arguments, path, *_):
+        return self.validate(arguments, path)
@@ -27,3 +27,6 @@ class DirectivesAreDefined(June2018ReleaseValidationRule):
             ]
 
         return []
+
+    def leave_directive(self, directive, path, schema, *_):
+        return self.validate(directive, schema, path)
@@ -59,3 +59,11 @@ class DirectivesAreInValidLocations(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_field(self, node, path, schema, *_):
+        return self.validate(node, path, schema)
+
+    leave_fragment_spread = leave_field
+    leave_inline_fragment = leave_field
+    leave_fragment_definition = leave_field
+    leave_operation_definition = leave_field
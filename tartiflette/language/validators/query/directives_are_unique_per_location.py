@@ -39,3 +39,6 @@ class DirectivesAreUniquePerLocation(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_directives(self, directives, path, *_):
+        return self.validate(directives, path)
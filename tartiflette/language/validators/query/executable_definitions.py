@@ -35,3 +35,6 @@ class ExecutableDefinition(June2018ReleaseValidationRule):
             ]
 
         return []
+
+    def leave_document(self, document, path, *_):
+        return self.validate(document.definitions, path)
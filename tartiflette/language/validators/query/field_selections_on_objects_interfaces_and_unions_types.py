@@ -38,3 +38,6 @@ class FieldSelectionsOnObjectsInterfacesAndUnionsTypes(
             ]
 
         return []
+
+    def leave_field(self, field, path, schema, ctx):
+        return self.validate(path, schema, field, ctx["parent_type_name"])
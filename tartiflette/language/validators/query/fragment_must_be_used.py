@@ -34,3 +34,8 @@ class FragmentMustBeUsed(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_document(self, _document, path, _schema, ctx):
+        return self.validate(
+            path, ctx["fragment_definitions"], ctx.get("fragment_spreads")
+        )
@@ -38,3 +38,6 @@ class FragmentNameUniqueness(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_document(self, _document, path, _schema, ctx):
+        return self.validate(path, ctx["fragment_definitions"])
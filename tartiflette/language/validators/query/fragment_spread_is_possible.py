@@ -124,3 +124,12 @@ class FragmentSpreadIsPossible(June2018ReleaseValidationRule):
         return self._validate_inlines(
             inlined_in, path, schema
         ) + self._validate_spreads(fragments, spreaded_in, path, schema)
+
+    def leave_document(self, _document, path, schema, ctx):
+        return self.validate(
+            path,
+            schema,
+            ctx["fragment_definitions"],
+            inlined_in=ctx.get("inlined_in"),
+            spreaded_in=ctx.get("spreaded_in"),
+        )
@@ -44,3 +44,8 @@ class FragmentSpreadTargetDefined(June2018ReleaseValidationRule):
                 )
 
         return self._to_errors(erronous_speads, path)
+
+    def leave_document(self, _document, path, _schema, ctx):
+        return self.validate(
+            path, ctx["fragment_definitions"], ctx.get("fragment_spreads")
+        )
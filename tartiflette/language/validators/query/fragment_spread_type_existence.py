@@ -32,3 +32,8 @@ class FragmentSpreadTypeExistence(June2018ReleaseValidationRule):
             )
 
         return errors
+
+    def leave_inline_fragment(self, fragment, path, schema, *_):
+        return self.validate(path, schema, fragment)
+
+    leave_fragment_definition = leave_inline_fragment
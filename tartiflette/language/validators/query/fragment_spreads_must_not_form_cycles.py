@@ -59,3 +59,6 @@ class FragmentSpreadsMustNotFormCycles(June2018ReleaseValidationRule):
                 return e.tartiflette_errors
 
         return []
+
+    def leave_document(self, _document, _path, _schema, ctx):
+        return self.validate(ctx["fragment_definitions"])
@@ -41,3 +41,6 @@ class InputObjectFieldUniqueness(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_object_fields(self, input_fields, path, *_):
+        return self.validate(path, input_fields)
@@ -52,3 +52,6 @@ class LeafFieldSelections(June2018ReleaseValidationRule):
             ]
 
         return []
+
+    def leave_field(self, field, path, schema, ctx):
+        return self.validate(path, schema, field, ctx["parent_type_name"])
@@ -36,3 +36,6 @@ class LoneAnonymousOperation(June2018ReleaseValidationRule):
             )
 
         return errors
+
+    def leave_document(self, _document, path, _schema, ctx):
+        return self.validate(path, ctx["operation_definitions"])
@@ -0,0 +1,48 @@
+from tartiflette.language.ast import FragmentSpreadNode
+from tartiflette.language.validators.query.rule import ValidationRule
+from tartiflette.language.validators.query.selection_metrics import (
+    get_selection_sets_walk,
+)
+from tartiflette.utils.errors import graphql_error_from_nodes
+
+
+class MaxAliases(ValidationRule):
+    """
+    This validator validates that selection sets don't contain more aliased
+    fields than the `max_aliases` of the query limits of the schema, which
+    prevents the same field from being resolved many times (e.g.
+    `a1: expensive a2: expensive ...`). The fragment spreads are expanded:
+    the aliased fields of a fragment are counted in each selection set in
+    which it is spread.
+    """
+
+    RULE_NAME = "max-aliases"
+
+    def validate(self, schema, selection_sets_walk, **__):
+        max_aliases = schema.query_limits.max_aliases
+        if max_aliases is None:
+            return []
+
+        errors = []
+        for path, node, _depth in selection_sets_walk.steps:
+            if isinstance(node, FragmentSpreadNode):
+                continue
+
+            aliases_count = selection_sets_walk.selection_set_metrics(
+                node
+            ).aliases
+            if aliases_count > max_aliases:
+                errors.append(
+                    graphql_error_from_nodes(
+                        message=f"Selection set contains < {aliases_count} > aliases which exceeds the maximum of < {max_aliases} > aliases.",
+                        path=path,
+                        nodes=node,
+                        extensions=self._extensions,
+                    )
+                )
+        return errors
+
+    def leave_document(self, _document, _path, schema, ctx):
+        if schema.query_limits is None:
+            return []
+        return self.validate(schema, get_selection_sets_walk(ctx))
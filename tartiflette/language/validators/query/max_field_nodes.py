@@ -0,0 +1,45 @@
+from tartiflette.language.validators.query.rule import ValidationRule
+from tartiflette.language.validators.query.selection_metrics import (
+    get_selection_sets_walk,
+)
+from tartiflette.utils.errors import graphql_error_from_nodes
+
+
+class MaxFieldNodes(ValidationRule):
+    """
+    This validator validates that the operations of the document don't
+    contain more field nodes than the `max_field_nodes` of the query limits
+    of the schema. The fragment spreads are expanded: the field nodes of a
+    fragment are counted each time it is spread.
+    """
+
+    RULE_NAME = "max-field-nodes"
+
+    def validate(self, schema, operations, selection_sets_walk, **__):
+        max_field_nodes = schema.query_limits.max_field_nodes
+        if max_field_nodes is None:
+            return []
+
+        total_field_nodes = 0
+        for operation in operations:
+            total_field_nodes += selection_sets_walk.selection_set_metrics(
+                operation.selection_set
+            ).field_nodes
+            # Only the operation crossing the limit is reported
+            if total_field_nodes > max_field_nodes:
+                return [
+                    graphql_error_from_nodes(
+                        message=f"Document contains more than < {max_field_nodes} > field nodes.",
+                        path=None,
+                        nodes=operation.selection_set,
+                        extensions=self._extensions,
+                    )
+                ]
+        return []
+
+    def leave_document(self, _document, _path, schema, ctx):
+        if schema.query_limits is None:
+            return []
+        return self.validate(
+            schema, ctx["operation_definitions"], get_selection_sets_walk(ctx)
+        )
@@ -0,0 +1,60 @@
+from tartiflette.language.ast import FragmentSpreadNode
+from tartiflette.language.validators.query.rule import ValidationRule
+from tartiflette.utils.errors import graphql_error_from_nodes
+
+
+class MaxFragmentSpreads(ValidationRule):
+    """
+    This validator validates that the document doesn't contain more fragment
+    spreads than the `max_fragment_spreads` of the query limits of the schema.
+    """
+
+    RULE_NAME = "max-fragment-spreads"
+
+    def validate(
+        self,
+        path,
+        schema,
+        selection_set,
+        fragment_spreads_count,
+        total_fragment_spreads,
+        **__,
+    ):
+        max_fragment_spreads = schema.query_limits.max_fragment_spreads
+        # Only the selection set crossing the limit is reported
+        if (
+            max_fragment_spreads is None
+            or total_fragment_spreads <= max_fragment_spreads
+            or total_fragment_spreads - fragment_spreads_count
+            > max_fragment_spreads
+        ):
+            return []
+
+        return [
+            graphql_error_from_nodes(
+                message=f"Document contains more than < {max_fragment_spreads} > fragment spreads.",
+                path=path,
+                nodes=selection_set,
+                extensions=self._extensions,
+            )
+        ]
+
+    def leave_selection_set(self, selection_set, path, schema, ctx):
+        if schema.query_limits is None:
+            return []
+
+        fragment_spreads_count = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FragmentSpreadNode):
+                fragment_spreads_count += 1
+
+        total_fragment_spreads = ctx["total_fragment_spreads"] = (
+            ctx.get("total_fragment_spreads", 0) + fragment_spreads_count
+        )
+        return self.validate(
+            path,
+            schema,
+            selection_set,
+            fragment_spreads_count,
+            total_fragment_spreads,
+        )
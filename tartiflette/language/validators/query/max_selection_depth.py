@@ -0,0 +1,58 @@
+from tartiflette.language.ast import FragmentSpreadNode
+from tartiflette.language.validators.query.rule import ValidationRule
+from tartiflette.language.validators.query.selection_metrics import (
+    get_selection_sets_walk,
+)
+from tartiflette.utils.errors import graphql_error_from_nodes
+
+
+class MaxSelectionDepth(ValidationRule):
+    """
+    This validator validates that selection sets aren't nested deeper than
+    the `max_depth` of the query limits of the schema. The fragment spreads
+    are expanded: the depth of a fragment is added to the depth of the
+    selection set in which it is spread.
+    """
+
+    RULE_NAME = "max-selection-depth"
+
+    @staticmethod
+    def _crosses_max_depth(selection_sets_walk, node, depth, max_depth):
+        """
+        Whether or not a selection set or a fragment spread nested at a depth
+        of its operation is the one crossing the maximum depth, the nodes
+        nested deeper being left unreported.
+        """
+        if not isinstance(node, FragmentSpreadNode):
+            return depth == max(max_depth, 0) + 1
+
+        fragment_depth = selection_sets_walk.fragment_metrics(
+            node.name.value
+        ).depth
+        return depth <= max_depth < depth - 1 + fragment_depth
+
+    def validate(self, schema, selection_sets_walk, **__):
+        max_depth = schema.query_limits.max_depth
+        if max_depth is None:
+            return []
+
+        # The nodes of the fragments have no depth, they are validated where
+        # the fragments are spread
+        return [
+            graphql_error_from_nodes(
+                message=f"Selection set exceeds the maximum depth of < {max_depth} >.",
+                path=path,
+                nodes=node,
+                extensions=self._extensions,
+            )
+            for path, node, depth in selection_sets_walk.steps
+            if depth is not None
+            and self._crosses_max_depth(
+                selection_sets_walk, node, depth, max_depth
+            )
+        ]
+
+    def leave_document(self, _document, _path, schema, ctx):
+        if schema.query_limits is None:
+            return []
+        return self.validate(schema, get_selection_sets_walk(ctx))
@@ -0,0 +1,36 @@
+from tartiflette.language.validators.query.rule import ValidationRule
+
+
+class QueryCostLimits(ValidationRule):
+    """
+    This validator computes the cost of each operation of the document with
+    the QueryCostAnalyzer of the schema (if any) and validates that it doesn't
+    exceed the configured limits.
+    """
+
+    RULE_NAME = "query-cost"
+
+    def validate(self, schema, operations, fragments, operation_costs, **__):
+        # pylint: disable=no-self-use
+        cost_analyzer = schema.cost_analyzer
+        if cost_analyzer is None:
+            return []
+
+        fragments = {fragment.name.value: fragment for fragment in fragments}
+
+        errors = []
+        for operation in operations:
+            query_cost = cost_analyzer.analyze(schema, operation, fragments)
+            operation_costs[
+                operation.name.value if operation.name else None
+            ] = query_cost
+            errors.extend(cost_analyzer.validate(operation, query_cost))
+        return errors
+
+    def leave_document(self, _document, _path, schema, ctx):
+        return self.validate(
+            schema,
+            ctx["operation_definitions"],
+            ctx["fragment_definitions"],
+            ctx["operation_costs"],
+        )
@@ -73,3 +73,8 @@ class RequiredArguments(June2018ReleaseValidationRule):
         if isinstance(node, DirectiveNode):
             return self._validate_directive(path, schema, node)
         return self._validate_field(path, schema, node, parent_type_name)
+
+    def leave_field(self, node, path, schema, ctx):
+        return self.validate(path, schema, node, ctx["parent_type_name"])
+
+    leave_directive = leave_field
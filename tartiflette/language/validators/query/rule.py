@@ -4,6 +4,11 @@ from typing import Optional
 class ValidationRule:
     """
     Base class for a Validation Rule.
+
+    A rule registers its callbacks on the nodes it validates by implementing
+    `enter_<kind>` and/or `leave_<kind>` methods (e.g. `leave_field`), which
+    are called by the ValidationVisitor with the visited node, the current
+    path, the schema and the validation context, and return a list of errors.
     """
 
     RULE_NAME: Optional[str] = None
@@ -0,0 +1,192 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from tartiflette.coercers.common import Path
+from tartiflette.language.ast import FieldNode, InlineFragmentNode
+
+__all__ = ("SelectionMetrics", "SelectionSetsWalk", "get_selection_sets_walk")
+
+
+class SelectionMetrics(NamedTuple):
+    """
+    Metrics of a selection set (or of a fragment) checked against the query
+    limits of the schema.
+    """
+
+    depth: int
+    field_nodes: int
+    aliases: int
+
+
+_NO_METRICS = SelectionMetrics(0, 0, 0)
+
+
+def _merge_metrics(
+    metrics: "SelectionMetrics", other_metrics: "SelectionMetrics"
+) -> "SelectionMetrics":
+    """
+    Merges the metrics of selections of the same selection set.
+    :param metrics: the metrics of the previous selections
+    :param other_metrics: the metrics of the next selection
+    :type metrics: SelectionMetrics
+    :type other_metrics: SelectionMetrics
+    :return: the metrics of all the selections
+    :rtype: SelectionMetrics
+    """
+    return SelectionMetrics(
+        max(metrics.depth, other_metrics.depth),
+        metrics.field_nodes + other_metrics.field_nodes,
+        metrics.aliases + other_metrics.aliases,
+    )
+
+
+class SelectionSetsWalk:
+    """
+    Walks once through the selection sets of the operations of a document,
+    expanding the fragment spreads, to compute the metrics (depth, field
+    nodes & aliases) of each selection set & fragment shared by the
+    validators of the query limits.
+
+    The walk records the visited selection sets & fragment spreads in
+    document order as `(path, node, depth)` steps, the depth being the one
+    at which the node is nested in its operation. The selection set of a
+    fragment is walked from its first spread only, since its metrics don't
+    depend on where it is spread, its nodes have no depth.
+    """
+
+    __slots__ = ("_fragments", "_fragment_metrics", "_metrics", "steps")
+
+    def __init__(
+        self,
+        operations: List["OperationDefinitionNode"],
+        fragments: List["FragmentDefinitionNode"],
+    ) -> None:
+        """
+        :param operations: the operation definitions of the document
+        :param fragments: the fragment definitions of the document
+        :type operations: List[OperationDefinitionNode]
+        :type fragments: List[FragmentDefinitionNode]
+        """
+        self._fragments: Dict[str, "FragmentDefinitionNode"] = {
+            fragment.name.value: fragment for fragment in fragments
+        }
+        self._fragment_metrics: Dict[str, Optional["SelectionMetrics"]] = {}
+        self._metrics: Dict[int, "SelectionMetrics"] = {}
+        self.steps: List[
+            Tuple[
+                Optional["Path"],
+                Union["SelectionSetNode", "FragmentSpreadNode"],
+                Optional[int],
+            ]
+        ] = []
+        for operation in operations:
+            self._walk_selection_set(operation.selection_set, None, 1)
+
+    def selection_set_metrics(
+        self, selection_set: "SelectionSetNode"
+    ) -> "SelectionMetrics":
+        """
+        Returns the metrics of a walked selection set, the fragments (inline
+        or spread) being part of the selection set in which they are used.
+        :param selection_set: the walked selection set
+        :type selection_set: SelectionSetNode
+        :return: the metrics of the selection set
+        :rtype: SelectionMetrics
+        """
+        return self._metrics[id(selection_set)]
+
+    def fragment_metrics(self, fragment_name: str) -> "SelectionMetrics":
+        """
+        Returns the metrics of the selection set of a spread fragment, an
+        undefined fragment or a fragment spread within itself (cycle) having
+        no metrics.
+        :param fragment_name: name of the spread fragment
+        :type fragment_name: str
+        :return: the metrics of the selection set of the fragment
+        :rtype: SelectionMetrics
+        """
+        return self._fragment_metrics.get(fragment_name) or _NO_METRICS
+
+    def _walk_selection_set(
+        self,
+        selection_set: "SelectionSetNode",
+        path: Optional["Path"],
+        depth: Optional[int],
+    ) -> "SelectionMetrics":
+        self.steps.append((path, selection_set, depth))
+        metrics = self._metrics[id(selection_set)] = self._walk_selections(
+            selection_set, path, depth
+        )
+        return metrics
+
+    def _walk_selections(
+        self,
+        selection_set: "SelectionSetNode",
+        path: Optional["Path"],
+        depth: Optional[int],
+    ) -> "SelectionMetrics":
+        metrics = SelectionMetrics(1, 0, 0)
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                selection_metrics = self._walk_field(selection, path, depth)
+            elif isinstance(selection, InlineFragmentNode):
+                selection_metrics = self._walk_selections(
+                    selection.selection_set, path, depth
+                )
+            else:
+                selection_metrics = self._walk_fragment_spread(
+                    selection, path, depth
+                )
+            metrics = _merge_metrics(metrics, selection_metrics)
+        return metrics
+
+    def _walk_field(
+        self, field: "FieldNode", path: Optional["Path"], depth: Optional[int],
+    ) -> "SelectionMetrics":
+        aliases = 1 if field.alias else 0
+        if not field.selection_set:
+            return SelectionMetrics(1, 1, aliases)
+
+        # The aliases of the selection set of the field aren't part of the
+        # selection set of the field itself
+        nested_metrics = self._walk_selection_set(
+            field.selection_set,
+            Path(path, field.name.value),
+            None if depth is None else depth + 1,
+        )
+        return SelectionMetrics(
+            nested_metrics.depth + 1, nested_metrics.field_nodes + 1, aliases
+        )
+
+    def _walk_fragment_spread(
+        self,
+        fragment_spread: "FragmentSpreadNode",
+        path: Optional["Path"],
+        depth: Optional[int],
+    ) -> "SelectionMetrics":
+        self.steps.append((path, fragment_spread, depth))
+        fragment_name = fragment_spread.name.value
+        fragment = self._fragments.get(fragment_name)
+        if fragment is None or fragment_name in self._fragment_metrics:
+            return self.fragment_metrics(fragment_name)
+
+        self._fragment_metrics[fragment_name] = None
+        metrics = self._fragment_metrics[
+            fragment_name
+        ] = self._walk_selections(fragment.selection_set, path, None)
+        return metrics
+
+
+def get_selection_sets_walk(ctx: Dict[str, Any]) -> "SelectionSetsWalk":
+    """
+    Returns the walk through the selection sets of the validated document,
+    walking through them on the first call only.
+    :param ctx: the validation context of the document
+    :type ctx: Dict[str, Any]
+    :return: the walk through the selection sets of the document
+    :rtype: SelectionSetsWalk
+    """
+    if "selection_sets_walk" not in ctx:
+        ctx["selection_sets_walk"] = SelectionSetsWalk(
+            ctx["operation_definitions"], ctx["fragment_definitions"]
+        )
+    return ctx["selection_sets_walk"]
@@ -69,3 +69,12 @@ class SingleRootField(June2018ReleaseValidationRule):
                 )
 
         return []
+
+    def leave_document(self, _document, path, _schema, ctx):
+        return self.validate(
+            path,
+            {
+                "FragmentDefinition": ctx["fragment_definitions"],
+                "OperationDefinition": ctx["operation_definitions"],
+            },
+        )
@@ -289,3 +289,8 @@ class ValuesOfCorrectType(June2018ReleaseValidationRule):
         return self._validate_field_arguments(
             path, schema, node, parent_type_name
         )
+
+    def leave_field(self, node, path, schema, ctx):
+        return self.validate(path, schema, node, ctx["parent_type_name"])
+
+    leave_directive = leave_field
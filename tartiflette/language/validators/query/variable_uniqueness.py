@@ -41,3 +41,6 @@ class VariableUniqueness(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_variable_definitions(self, variable_definitions, path, *_):
+        return self.validate(path, variable_definitions)
@@ -33,3 +33,6 @@ class VariablesAreInputTypes(June2018ReleaseValidationRule):
             ]
 
         return []
+
+    def leave_variable_definition(self, variable, path, schema, *_):
+        return self.validate(variable, path, schema)
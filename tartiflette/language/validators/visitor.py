@@ -0,0 +1,562 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tartiflette.coercers.common import Path
+from tartiflette.language.ast import (
+    FragmentDefinitionNode,
+    ListValueNode,
+    ObjectValueNode,
+    VariableNode,
+)
+from tartiflette.language.validators.query.utils import (
+    get_schema_field_type_name,
+)
+
+__all__ = ("ValidationVisitor",)
+
+# Kinds of the events emitted while visiting a document, a rule registers a
+# callback on an event by implementing an `enter_<kind>` or a
+# `leave_<kind>` method
+_NODE_KINDS = (
+    "object_fields",
+    "arguments",
+    "directive",
+    "directives",
+    "field",
+    "fragment_spread",
+    "inline_fragment",
+    "selection_set",
+    "fragment_definition",
+    "variable_definition",
+    "variable_definitions",
+    "operation_definition",
+    "document",
+)
+
+
+def _source_order(definition: "DefinitionNode") -> Tuple[int, int]:
+    """
+    Returns the position of the definition into the query, used to visit the
+    definitions of a document in the order they were written.
+    :param definition: the definition to locate
+    :type definition: DefinitionNode
+    :return: the line & column of the definition into the query
+    :rtype: Tuple[int, int]
+    """
+    location = definition.location
+    return (location.line, location.column) if location else (0, 0)
+
+
+class ValidationVisitor:
+    """
+    Validates a DocumentNode against a set of validation rules in a single
+    traversal of the document. Each rule registers its callbacks on the kinds
+    of nodes it validates by implementing `enter_<kind>` and `leave_<kind>`
+    methods, which are called with the visited node, the current path, the
+    schema and the validation context. The callbacks of a kind are called in
+    the order of the rule set.
+    """
+
+    __slots__ = ("_enter_callbacks", "_leave_callbacks")
+
+    def __init__(self, rules: Dict[str, "ValidationRule"]) -> None:
+        """
+        :param rules: the validation rules to apply, indexed by name
+        :type rules: Dict[str, ValidationRule]
+        """
+        self._enter_callbacks: Dict[
+            str, List[Tuple["ValidationRule", Callable]]
+        ] = {}
+        self._leave_callbacks: Dict[
+            str, List[Tuple["ValidationRule", Callable]]
+        ] = {}
+
+        for kind in _NODE_KINDS:
+            self._enter_callbacks[kind] = [
+                (rule, getattr(rule, f"enter_{kind}"))
+                for rule in rules.values()
+                if hasattr(rule, f"enter_{kind}")
+            ]
+            self._leave_callbacks[kind] = [
+                (rule, getattr(rule, f"leave_{kind}"))
+                for rule in rules.values()
+                if hasattr(rule, f"leave_{kind}")
+            ]
+
+    @staticmethod
+    def _apply(
+        callbacks: List[Tuple["ValidationRule", Callable]],
+        node: Any,
+        path: Optional["Path"],
+        validators: "Validators",
+    ) -> None:
+        """
+        Calls the callbacks registered by the rules on the visited node and
+        reports their errors to the validators.
+        :param callbacks: the callbacks to call
+        :param node: the visited node
+        :param path: the path of the visited node
+        :param validators: the validators collecting the errors
+        :type callbacks: List[Tuple[ValidationRule, Callable]]
+        :type node: Any
+        :type path: Optional[Path]
+        :type validators: Validators
+        """
+        for rule, callback in callbacks:
+            if validators.aborted:
+                return
+            validators.report(
+                rule, callback(node, path, validators.schema, validators.ctx)
+            )
+
+    def _visit_value(
+        self, value: "ValueNode", validators: "Validators", path: "Path"
+    ) -> None:
+        """
+        Visits a value node, collecting the variables it uses.
+        :param value: the value node to visit
+        :param validators: the validators collecting the errors
+        :param path: the path of the field using the value
+        :type value: ValueNode
+        :type validators: Validators
+        :type path: Path
+        """
+        if isinstance(value, VariableNode):
+            ctx = validators.ctx
+            if not ctx["in_variable_definitions"]:
+                if ctx["in_operation"]:
+                    ctx["per_operation"][
+                        ctx["current_operation_name"]
+                    ].setdefault("used_vars", []).append(value)
+                else:
+                    ctx["per_fragment"][
+                        ctx["current_fragment_name"]
+                    ].setdefault("used_vars", []).append(value)
+        elif isinstance(value, ListValueNode):
+            for item in value.values:
+                self._visit_value(item, validators, path)
+        elif isinstance(value, ObjectValueNode) and value.fields:
+            self._apply(
+                self._enter_callbacks["object_fields"],
+                value.fields,
+                path,
+                validators,
+            )
+            for object_field in value.fields:
+                self._visit_value(object_field.value, validators, path)
+            self._apply(
+                self._leave_callbacks["object_fields"],
+                value.fields,
+                path,
+                validators,
+            )
+
+    def _visit_arguments(
+        self,
+        arguments: List["ArgumentNode"],
+        validators: "Validators",
+        path: Optional["Path"],
+    ) -> None:
+        """
+        Visits the arguments of a field or a directive, collecting the
+        arguments using variables.
+        :param arguments: the argument nodes to visit
+        :param validators: the validators collecting the errors
+        :param path: the path of the field owning the arguments
+        :type arguments: List[ArgumentNode]
+        :type validators: Validators
+        :type path: Optional[Path]
+        """
+        if not arguments:
+            return
+
+        ctx = validators.ctx
+        self._apply(
+            self._enter_callbacks["arguments"], arguments, path, validators
+        )
+        for argument in arguments:
+            self._visit_value(argument.value, validators, path)
+            if isinstance(argument.value, VariableNode):
+                if ctx["in_operation"]:
+                    args_using_var = ctx["per_operation"][
+                        ctx["current_operation_name"]
+                    ].setdefault("args_using_var", [])
+                else:
+                    args_using_var = ctx["per_fragment"][
+                        ctx["current_fragment_name"]
+                    ].setdefault("args_using_var", [])
+
+                args_using_var.append(
+                    {
+                        "arg": argument,
+                        "node_location": (
+                            ctx["current_directive_name"]
+                            if ctx["in_directive"]
+                            else ctx["current_field_name"]
+                        ),
+                        "is_directive": ctx["in_directive"],
+                        "path": path,
+                    }
+                )
+        self._apply(
+            self._leave_callbacks["arguments"], arguments, path, validators
+        )
+
+    def _visit_directives(
+        self,
+        directives: List["DirectiveNode"],
+        validators: "Validators",
+        path: Optional["Path"],
+    ) -> None:
+        """
+        Visits the directives of a node.
+        :param directives: the directive nodes to visit
+        :param validators: the validators collecting the errors
+        :param path: the path of the node owning the directives
+        :type directives: List[DirectiveNode]
+        :type validators: Validators
+        :type path: Optional[Path]
+        """
+        if not directives:
+            return
+
+        ctx = validators.ctx
+        self._apply(
+            self._enter_callbacks["directives"], directives, path, validators
+        )
+        for directive in directives:
+            ctx["in_directive"] = True
+            ctx["current_directive_name"] = directive.name.value
+            self._apply(
+                self._enter_callbacks["directive"], directive, path, validators
+            )
+            self._visit_arguments(directive.arguments, validators, path)
+            ctx["in_directive"] = False
+            self._apply(
+                self._leave_callbacks["directive"], directive, path, validators
+            )
+        self._apply(
+            self._leave_callbacks["directives"], directives, path, validators
+        )
+
+    def _visit_field(
+        self,
+        field: "FieldNode",
+        validators: "Validators",
+        path: Optional["Path"],
+    ) -> None:
+        """
+        Visits a field node and its selection set.
+        :param field: the field node to visit
+        :param validators: the validators collecting the errors
+        :param path: the path of the parent field
+        :type field: FieldNode
+        :type validators: Validators
+        :type path: Optional[Path]
+        """
+        ctx = validators.ctx
+        path = Path(path, field.name.value)
+        parent_type_name = ctx["parent_type_name"]
+
+        ctx["parent_type_name"] = get_schema_field_type_name(
+            parent_type_name, field.name.value, validators.schema
+        )
+        ctx["in_directive"] = False
+        ctx["current_field_name"] = f"{parent_type_name}.{field.name}"
+
+        self._apply(self._enter_callbacks["field"], field, path, validators)
+        self._visit_arguments(field.arguments, validators, path)
+        self._visit_directives(field.directives, validators, path)
+        self._visit_selection_set(field.selection_set, validators, path)
+
+        ctx["parent_type_name"] = parent_type_name
+        self._apply(self._leave_callbacks["field"], field, path, validators)
+
+    def _visit_fragment_spread(
+        self,
+        fragment_spread: "FragmentSpreadNode",
+        validators: "Validators",
+        path: Optional["Path"],
+    ) -> None:
+        """
+        Visits a fragment spread node, collecting the spreads of the document.
+        :param fragment_spread: the fragment spread node to visit
+        :param validators: the validators collecting the errors
+        :param path: the path of the parent field
+        :type fragment_spread: FragmentSpreadNode
+        :type validators: Validators
+        :type path: Optional[Path]
+        """
+        ctx = validators.ctx
+        self._apply(
+            self._enter_callbacks["fragment_spread"],
+            fragment_spread,
+            path,
+            validators,
+        )
+        self._visit_directives(fragment_spread.directives, validators, path)
+        self._apply(
+            self._leave_callbacks["fragment_spread"],
+            fragment_spread,
+            path,
+            validators,
+        )
+
+        ctx.setdefault("fragment_spreads", []).append(fragment_spread)
+        ctx.setdefault("spreaded_in", {}).setdefault(
+            ctx["parent_type_name"], []
+        ).append({"spread": fragment_spread, "path": path})
+
+        if ctx["in_operation"]:
+            ctx["per_operation"][ctx["current_operation_name"]].setdefault(
+                "spreads", []
+            ).append(fragment_spread)
+        else:
+            ctx["per_fragment"][ctx["current_fragment_name"]].setdefault(
+                "spreads", []
+            ).append(fragment_spread)
+
+    def _visit_inline_fragment(
+        self,
+        inline_fragment: "InlineFragmentNode",
+        validators: "Validators",
+        path: Optional["Path"],
+    ) -> None:
+        """
+        Visits an inline fragment node and its selection set.
+        :param inline_fragment: the inline fragment node to visit
+        :param validators: the validators collecting the errors
+        :param path: the path of the parent field
+        :type inline_fragment: InlineFragmentNode
+        :type validators: Validators
+        :type path: Optional[Path]
+        """
+        ctx = validators.ctx
+        parent_type_name = ctx["parent_type_name"]
+        if inline_fragment.type_condition:
+            ctx["parent_type_name"] = inline_fragment.type_condition.name.value
+
+        self._apply(
+            self._enter_callbacks["inline_fragment"],
+            inline_fragment,
+            path,
+            validators,
+        )
+        self._visit_directives(inline_fragment.directives, validators, path)
+        self._visit_selection_set(
+            inline_fragment.selection_set, validators, path
+        )
+        self._apply(
+            self._leave_callbacks["inline_fragment"],
+            inline_fragment,
+            path,
+            validators,
+        )
+
+        ctx.setdefault("inlined_in", {}).setdefault(
+            ctx["parent_type_name"], []
+        ).append(inline_fragment)
+        ctx["parent_type_name"] = parent_type_name
+
+    def _visit_selection_set(
+        self,
+        selection_set: Optional["SelectionSetNode"],
+        validators: "Validators",
+        path: Optional["Path"],
+    ) -> None:
+        """
+        Visits a selection set node and its selections.
+        :param selection_set: the selection set node to visit
+        :param validators: the validators collecting the errors
+        :param path: the path of the field owning the selection set
+        :type selection_set: Optional[SelectionSetNode]
+        :type validators: Validators
+        :type path: Optional[Path]
+        """
+        if not selection_set:
+            return
+
+        self._apply(
+            self._enter_callbacks["selection_set"],
+            selection_set,
+            path,
+            validators,
+        )
+        for selection in selection_set.selections:
+            self._SELECTION_VISITORS[type(selection).__name__](
+                self, selection, validators, path
+            )
+        self._apply(
+            self._leave_callbacks["selection_set"],
+            selection_set,
+            path,
+            validators,
+        )
+
+    _SELECTION_VISITORS = {
+        "FieldNode": _visit_field,
+        "FragmentSpreadNode": _visit_fragment_spread,
+        "InlineFragmentNode": _visit_inline_fragment,
+    }
+
+    def _visit_fragment_definition(
+        self, fragment: "FragmentDefinitionNode", validators: "Validators"
+    ) -> None:
+        """
+        Visits a fragment definition node and its selection set.
+        :param fragment: the fragment definition node to visit
+        :param validators: the validators collecting the errors
+        :type fragment: FragmentDefinitionNode
+        :type validators: Validators
+        """
+        ctx = validators.ctx
+        parent_type_name = ctx["parent_type_name"]
+        ctx["parent_type_name"] = fragment.type_condition.name.value
+        ctx["in_operation"] = False
+        ctx["current_fragment_name"] = fragment.name.value
+        ctx["per_fragment"].setdefault(fragment.name.value, {})
+        ctx["fragment_definitions"].append(fragment)
+
+        self._apply(
+            self._enter_callbacks["fragment_definition"],
+            fragment,
+            None,
+            validators,
+        )
+        self._visit_directives(fragment.directives, validators, None)
+        self._visit_selection_set(fragment.selection_set, validators, None)
+        self._apply(
+            self._leave_callbacks["fragment_definition"],
+            fragment,
+            None,
+            validators,
+        )
+
+        ctx["parent_type_name"] = parent_type_name
+
+    def _visit_variable_definitions(
+        self,
+        variable_definitions: List["VariableDefinitionNode"],
+        validators: "Validators",
+    ) -> None:
+        """
+        Visits the variable definitions of an operation.
+        :param variable_definitions: the variable definition nodes to visit
+        :param validators: the validators collecting the errors
+        :type variable_definitions: List[VariableDefinitionNode]
+        :type validators: Validators
+        """
+        if not variable_definitions:
+            return
+
+        ctx = validators.ctx
+        ctx["in_variable_definitions"] = True
+        self._apply(
+            self._enter_callbacks["variable_definitions"],
+            variable_definitions,
+            None,
+            validators,
+        )
+        for variable_definition in variable_definitions:
+            self._apply(
+                self._enter_callbacks["variable_definition"],
+                variable_definition,
+                None,
+                validators,
+            )
+            self._visit_value(
+                variable_definition.default_value, validators, None
+            )
+            self._apply(
+                self._leave_callbacks["variable_definition"],
+                variable_definition,
+                None,
+                validators,
+            )
+        ctx["in_variable_definitions"] = False
+        self._apply(
+            self._leave_callbacks["variable_definitions"],
+            variable_definitions,
+            None,
+            validators,
+        )
+
+    def _visit_operation_definition(
+        self, operation: "OperationDefinitionNode", validators: "Validators"
+    ) -> None:
+        """
+        Visits an operation definition node and its selection set.
+        :param operation: the operation definition node to visit
+        :param validators: the validators collecting the errors
+        :type operation: OperationDefinitionNode
+        :type validators: Validators
+        """
+        ctx = validators.ctx
+        operation_name = operation.name.value if operation.name else "None"
+        ctx["parent_type_name"] = getattr(
+            validators.schema,
+            f"{operation.operation_type.lower()}_operation_name",
+        )
+        ctx["in_operation"] = True
+        ctx["current_operation_name"] = operation_name
+        ctx["per_operation"].setdefault(operation_name, {})
+        ctx["operation_definitions"].append(operation)
+
+        self._apply(
+            self._enter_callbacks["operation_definition"],
+            operation,
+            None,
+            validators,
+        )
+        self._visit_variable_definitions(
+            operation.variable_definitions, validators
+        )
+        self._visit_directives(operation.directives, validators, None)
+        self._visit_selection_set(operation.selection_set, validators, None)
+        self._apply(
+            self._leave_callbacks["operation_definition"],
+            operation,
+            None,
+            validators,
+        )
+
+    def visit(
+        self, document: "DocumentNode", validators: "Validators"
+    ) -> None:
+        """
+        Validates the document by visiting its definitions in the order they
+        were written, then applies the rules validating the whole document.
+        The errors are collected into the validators.
+        :param document: the document to validate
+        :param validators: the validators collecting the errors
+        :type document: DocumentNode
+        :type validators: Validators
+        """
+        validators.ctx.update(
+            {
+                "parent_type_name": None,
+                "in_operation": False,
+                "in_directive": False,
+                "in_variable_definitions": False,
+                "current_field_name": None,
+                "current_directive_name": None,
+                "current_operation_name": None,
+                "current_fragment_name": None,
+                "per_operation": {},
+                "per_fragment": {},
+                "operation_definitions": [],
+                "fragment_definitions": [],
+                "operation_costs": document.costs,
+            }
+        )
+
+        self._apply(
+            self._enter_callbacks["document"], document, None, validators
+        )
+        for definition in sorted(document.definitions, key=_source_order):
+            if isinstance(definition, FragmentDefinitionNode):
+                self._visit_fragment_definition(definition, validators)
+            else:
+                self._visit_operation_definition(definition, validators)
+        self._apply(
+            self._leave_callbacks["document"], document, None, validators
+        )
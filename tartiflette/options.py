@@ -0,0 +1,123 @@
+from typing import Any, Callable, Optional
+
+__all__ = ("EngineOptions",)
+
+
+class EngineOptions:
+    """
+    Options of an engine tuning how its schema is cooked (schema cache,
+    built-ins, base engine) and how its queries are stored (query cache,
+    persisted queries & snapshot), validated (cost analyzer & query limits)
+    and executed (execution strategy).
+    """
+
+    __slots__ = (
+        "query_cache",
+        "persisted_query_store",
+        "persisted_queries_directory",
+        "trust_persisted_queries",
+        "document_snapshot",
+        "schema_cache_directory",
+        "lazy_builtins",
+        "base_engine",
+        "execution_strategy",
+        "cost_analyzer",
+        "query_limits",
+    )
+
+    def __init__(
+        self,
+        query_cache: Optional["DocumentCache"] = None,
+        persisted_query_store: Optional["PersistedQueryStore"] = None,
+        persisted_queries_directory: Optional[str] = None,
+        trust_persisted_queries: bool = False,
+        document_snapshot: Optional[str] = None,
+        schema_cache_directory: Optional[str] = None,
+        lazy_builtins: bool = False,
+        base_engine: Optional["Engine"] = None,
+        execution_strategy: Optional[Callable] = None,
+        cost_analyzer: Optional["QueryCostAnalyzer"] = None,
+        query_limits: Optional["QueryLimits"] = None,
+    ) -> None:
+        """
+        :param query_cache: cache instance in charge of storing the parsed &
+        validated queries of the engine (defaults to an LRUDocumentCache
+        storing up to 512 documents)
+        :param persisted_query_store: store in charge of holding the documents
+        of the persisted queries (defaults to an InMemoryPersistedQueryStore)
+        :param persisted_queries_directory: path to a directory containing
+        `.graphql` files to persist into the store at cook time
+        :param trust_persisted_queries: whether or not the queries of the
+        `persisted_queries_directory` are a trusted allow-list, persisted
+        without being validated
+        :param document_snapshot: path to a snapshot of parsed & validated
+        documents to load into the query cache at cook time
+        :param schema_cache_directory: path to a directory caching the schemas
+        converted from their SDL, so that an unchanged SDL isn't lexed, parsed
+        & transformed again at cook time
+        :param lazy_builtins: whether or not the optional built-ins (`Date`,
+        `DateTime` & `Time` scalars and `@nonIntrospectable` directive) should
+        only be imported & baked when referenced by the SDL
+        :param base_engine: cooked engine whose schema is extended by the SDL,
+        the types & directives of its schema which aren't extended by the SDL
+        are shared rather than built & baked again
+        :param execution_strategy: coroutine in charge of executing the
+        coroutines of the fields & list items (defaults to `gather_strategy`,
+        `eager_strategy` is available in `tartiflette.execution.strategies`)
+        :param cost_analyzer: analyzer in charge of computing the cost of the
+        operations and of rejecting the ones exceeding its limits while
+        validating them
+        :param query_limits: limits enforced on the selection sets of the
+        queries while validating them (depth, aliases, field nodes & fragment
+        spreads)
+        :type query_cache: Optional[DocumentCache]
+        :type persisted_query_store: Optional[PersistedQueryStore]
+        :type persisted_queries_directory: Optional[str]
+        :type trust_persisted_queries: bool
+        :type document_snapshot: Optional[str]
+        :type schema_cache_directory: Optional[str]
+        :type lazy_builtins: bool
+        :type base_engine: Optional[Engine]
+        :type execution_strategy: Optional[Callable]
+        :type cost_analyzer: Optional[QueryCostAnalyzer]
+        :type query_limits: Optional[QueryLimits]
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        self.query_cache = query_cache
+        self.persisted_query_store = persisted_query_store
+        self.persisted_queries_directory = persisted_queries_directory
+        self.trust_persisted_queries = trust_persisted_queries
+        self.document_snapshot = document_snapshot
+        self.schema_cache_directory = schema_cache_directory
+        self.lazy_builtins = lazy_builtins
+        self.base_engine = base_engine
+        self.execution_strategy = execution_strategy
+        self.cost_analyzer = cost_analyzer
+        self.query_limits = query_limits
+
+    def replace(self, **changes: Any) -> "EngineOptions":
+        """
+        Returns a copy of the options with some of them replaced.
+        :param changes: options to replace
+        :type changes: Any
+        :return: a copy of the options with some of them replaced
+        :rtype: EngineOptions
+        """
+        return EngineOptions(
+            **{
+                **{name: getattr(self, name) for name in self.__slots__},
+                **changes,
+            }
+        )
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of an EngineOptions instance.
+        :return: the representation of an EngineOptions instance
+        :rtype: str
+        """
+        return "EngineOptions({})".format(
+            ", ".join(
+                f"{name}={getattr(self, name)!r}" for name in self.__slots__
+            )
+        )
@@ -0,0 +1,105 @@
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from tartiflette.engine import Engine
+from tartiflette.options import EngineOptions
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+__all__ = ("EnginePool",)
+
+
+class EnginePool:
+    """
+    Pool of engines whose schemas extend the schema of a cooked base engine
+    (e.g. the schemas of several tenants sharing a core SDL). The types &
+    directives of the base schema which aren't extended by the SDL of an
+    engine are shared by its schema instead of being built & baked again, so
+    that the cooking time & memory of each engine grow with its own SDL
+    rather than with the size of the base schema.
+    """
+
+    def __init__(self, base_engine: "Engine") -> None:
+        """
+        :param base_engine: cooked engine whose schema is extended by the
+        engines of the pool
+        :type base_engine: Engine
+        """
+        self.base_engine = base_engine
+        self._engines: Dict[str, "Engine"] = {}
+
+    async def add_engine(
+        self,
+        schema_name: str,
+        sdl: Optional[Union[str, List[str]]] = None,
+        options: Optional["EngineOptions"] = None,
+        **kwargs: Any,
+    ) -> "Engine":
+        """
+        Cooks an engine whose schema extends the base schema with the SDL and
+        adds it to the pool.
+        :param schema_name: name of the schema of the engine
+        :param sdl: SDL extending the base schema (new types and extensions
+        of the base types)
+        :param options: options of the engine, whose `base_engine` is the
+        base engine of the pool
+        :param kwargs: other parameters to cook the engine with (see
+        `Engine.cook`)
+        :type schema_name: str
+        :type sdl: Optional[Union[str, List[str]]]
+        :type options: Optional[EngineOptions]
+        :type kwargs: Any
+        :return: the cooked engine
+        :rtype: Engine
+        """
+        if schema_name in self._engines:
+            raise ImproperlyConfigured(
+                f"Engine < {schema_name} > is already part of the pool."
+            )
+
+        engine = Engine()
+        await engine.cook(
+            sdl=sdl,
+            schema_name=schema_name,
+            options=(options or EngineOptions()).replace(
+                base_engine=self.base_engine
+            ),
+            **kwargs,
+        )
+        self._engines[schema_name] = engine
+        return engine
+
+    def __getitem__(self, schema_name: str) -> "Engine":
+        """
+        Returns the engine of the pool linked to the schema name.
+        :param schema_name: name of the schema of the engine
+        :type schema_name: str
+        :return: the engine linked to the schema name
+        :rtype: Engine
+        """
+        return self._engines[schema_name]
+
+    def __contains__(self, schema_name: str) -> bool:
+        """
+        Determines whether or not an engine of the pool is linked to the
+        schema name.
+        :param schema_name: name of the schema of the engine
+        :type schema_name: str
+        :return: whether or not an engine is linked to the schema name
+        :rtype: bool
+        """
+        return schema_name in self._engines
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the schema names of the engines of the pool.
+        :return: an iterator over the schema names
+        :rtype: Iterator[str]
+        """
+        return iter(self._engines)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of engines of the pool.
+        :return: the number of engines of the pool
+        :rtype: int
+        """
+        return len(self._engines)
@@ -1,6 +1,32 @@
 from typing import Any, Dict, Optional, Union
 
-__all__ = ("default_field_resolver", "default_type_resolver")
+__all__ = (
+    "default_field_resolver",
+    "default_type_resolver",
+    "resolve_default_field_value",
+)
+
+
+def resolve_default_field_value(parent: Optional[Any], field_name: str) -> Any:
+    """
+    Returns the attribute or the key of the parent named after the field.
+    :param parent: default root value or field parent value
+    :param field_name: name of the resolved field
+    :type parent: Optional[Any]
+    :type field_name: str
+    :return: the computed field value
+    :rtype: Any
+    """
+    try:
+        return getattr(parent, field_name)
+    except AttributeError:
+        pass
+
+    try:
+        return parent[field_name]
+    except (KeyError, TypeError):
+        pass
+    return None
 
 
 async def default_field_resolver(
@@ -24,16 +50,7 @@ async def default_field_resolver(
     :rtype: Any
     """
     # pylint: disable=unused-argument
-    try:
-        return getattr(parent, info.field_name)
-    except AttributeError:
-        pass
-
-    try:
-        return parent[info.field_name]
-    except (KeyError, TypeError):
-        pass
-    return None
+    return resolve_default_field_value(parent, info.field_name)
 
 
 def default_type_resolver(
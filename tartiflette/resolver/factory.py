@@ -1,17 +1,80 @@
-from typing import Any, Callable, List, Union
+from typing import Any, Callable, List, Optional, Union
 
 from tartiflette.coercers.arguments import coerce_arguments
-from tartiflette.coercers.outputs.common import complete_value_catching_error
+from tartiflette.coercers.outputs.common import (
+    complete_scalar_value_catching_error,
+    complete_value_catching_error,
+)
 from tartiflette.execution.types import build_resolve_info
+from tartiflette.resolver.default import resolve_default_field_value
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
+    has_variable_arguments,
 )
 from tartiflette.utils.directives import (
     introspection_directives_executor,
     wraps_with_directives,
 )
 
-__all__ = ("resolve_field",)
+__all__ = ("resolve_field", "resolve_trivial_field")
+
+
+def wrap_resolver_with_field_directives(
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    resolver: Callable,
+) -> Callable:
+    """
+    Wraps the resolver with the `on_field_execution` hooks of the directives
+    of the field nodes. When none of the directives depends on the variables
+    of the request, the wrapped resolver is stored on the document in order to
+    be reused by the next requests.
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param resolver: callable to use to resolve the field
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type resolver: Callable
+    :return: the resolver wrapped with the directives of the field nodes
+    :rtype: Callable
+    """
+    directive_nodes = [
+        directive_node
+        for field_node in field_nodes
+        for directive_node in field_node.directives or []
+    ]
+    if not directive_nodes:
+        return resolver
+
+    if has_variable_arguments(directive_nodes):
+        return wraps_with_directives(
+            directives_definition=compute_directive_nodes(
+                execution_context.schema,
+                directive_nodes,
+                execution_context.variable_values,
+            ),
+            directive_hook="on_field_execution",
+            func=resolver,
+            is_resolver=True,
+            with_default=True,
+        )
+
+    # Nodes are owned by the document which owns the wrapped resolvers, their
+    # identities are thus stable for the lifetime of the wrapped resolvers
+    key = (tuple(id(field_node) for field_node in field_nodes), resolver)
+    directive_resolvers = execution_context.directive_resolvers
+    wrapped_resolver = directive_resolvers.get(key)
+    if wrapped_resolver is None:
+        wrapped_resolver = directive_resolvers[key] = wraps_with_directives(
+            directives_definition=compute_directive_nodes(
+                execution_context.schema, directive_nodes
+            ),
+            directive_hook="on_field_execution",
+            func=resolver,
+            is_resolver=True,
+            with_default=True,
+        )
+    return wrapped_resolver
 
 
 async def resolve_field_value_or_error(
@@ -41,22 +104,8 @@ async def resolve_field_value_or_error(
     """
     # pylint: disable=too-many-locals
     try:
-        computed_directives = []
-        for field_node in field_nodes:
-            computed_directives.extend(
-                compute_directive_nodes(
-                    execution_context.schema,
-                    field_node.directives,
-                    execution_context.variable_values,
-                )
-            )
-
-        resolver = wraps_with_directives(
-            directives_definition=computed_directives,
-            directive_hook="on_field_execution",
-            func=resolver,
-            is_resolver=True,
-            with_default=True,
+        resolver = wrap_resolver_with_field_directives(
+            execution_context, field_nodes, resolver
         )
 
         result = await resolver(
@@ -88,59 +137,122 @@ async def resolve_field(
     parent_type: "GraphQLObjectType",
     source: Any,
     field_nodes: List["FieldNode"],
-    path: "Path",
+    parent_path: Optional["Path"],
+    key: str,
     is_introspection_context: bool,
     field_definition: "GraphQLField",
     resolver: Callable,
-    output_coercer: Callable,
 ) -> Any:
     """
-    Resolves the field value and coerce it before returning it.
+    Resolves the field value and coerce it before returning it. The path of
+    scalar fields is only allocated when read by the resolver or when an
+    error has to be located.
     :param execution_context: instance of the query execution context
     :param parent_type: GraphQLObjectType of the field's parent
     :param source: default root value or field parent value
     :param field_nodes: AST nodes related to the resolved field
-    :param path: the path traveled until this resolver
+    :param parent_path: the path traveled until the field's parent
+    :param key: the response key of the field
     :param field_definition: GraphQLField instance of the resolved field
     :param resolver: callable to use to resolve the field
-    :param output_coercer: callable to use to coerce the resolved field value
     :param is_introspection_context: determines whether or not the resolved
     field is in a context of an introspection query
     :type execution_context: ExecutionContext
     :type parent_type: GraphQLObjectType
     :type source: Any
     :type field_nodes: List[FieldNode]
-    :type path: Path
+    :type parent_path: Optional[Path]
+    :type key: str
     :type field_definition: GraphQLField
     :type resolver: Callable
-    :type output_coercer: Callable
     :type is_introspection_context: bool
     :return: the coerced resolved field value
     :rtype: Any
     """
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments,too-many-locals
     info = build_resolve_info(
         execution_context,
         field_definition,
         field_nodes,
         parent_type,
-        path,
+        parent_path,
+        key,
         is_introspection_context,
     )
 
-    return await complete_value_catching_error(
-        await resolve_field_value_or_error(
+    result = await resolve_field_value_or_error(
+        execution_context,
+        field_definition,
+        field_nodes,
+        resolver,
+        source,
+        info,
+    )
+
+    if field_definition.sync_output_coercer is not None:
+        return complete_scalar_value_catching_error(
+            result,
             execution_context,
+            parent_type,
             field_definition,
             field_nodes,
-            resolver,
-            source,
-            info,
-        ),
+            parent_path,
+            key,
+        )
+
+    return await complete_value_catching_error(
+        result,
         info,
         execution_context,
         field_nodes,
-        path,
+        info.path,
         field_definition.graphql_type,
-        output_coercer,
+        field_definition.output_coercer,
+    )
+
+
+def resolve_trivial_field(
+    execution_context: "ExecutionContext",
+    parent_type: "GraphQLObjectType",
+    source: Any,
+    field_nodes: List["FieldNode"],
+    parent_path: Optional["Path"],
+    key: str,
+    field_definition: "GraphQLField",
+) -> Any:
+    """
+    Synchronously resolves the value of a field without custom resolver,
+    arguments nor directives returning a (non-null) scalar and coerce it
+    before returning it.
+    :param execution_context: instance of the query execution context
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param source: default root value or field parent value
+    :param field_nodes: AST nodes related to the resolved field
+    :param parent_path: the path traveled until the field's parent
+    :param key: the response key of the field
+    :param field_definition: GraphQLField instance of the resolved field
+    :type execution_context: ExecutionContext
+    :type parent_type: GraphQLObjectType
+    :type source: Any
+    :type field_nodes: List[FieldNode]
+    :type parent_path: Optional[Path]
+    :type key: str
+    :type field_definition: GraphQLField
+    :return: the coerced resolved field value
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        result = resolve_default_field_value(source, field_definition.name)
+    except Exception as e:  # pylint: disable=broad-except
+        result = e
+
+    return complete_scalar_value_catching_error(
+        result,
+        execution_context,
+        parent_type,
+        field_definition,
+        field_nodes,
+        parent_path,
+        key,
     )
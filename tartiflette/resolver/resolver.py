@@ -1,5 +1,6 @@
 from typing import Callable, Optional
 
+from tartiflette.execution.loader import create_batch_resolver
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
     MissingImplementation,
@@ -30,6 +31,15 @@ class Resolver:
         async def field_resolver(parent, args, ctx, info):
             # do your stuff
             return 42
+
+    Resolvers declared with `batch=True` are called once per field node with
+    the list of all the parents to resolve (instead of once per parent) and
+    must return the list of the resolved values in the same order:
+
+        @Resolver("SomeObject.field", batch=True)
+        async def field_batch_resolver(parents, args, ctx, info):
+            # do your stuff
+            return [42 for _ in parents]
     """
 
     def __init__(
@@ -37,20 +47,25 @@ class Resolver:
         name: str,
         schema_name: str = "default",
         type_resolver: Optional[Callable] = None,
+        batch: bool = False,
     ) -> None:
         """
         :param name: name of the field to wrap
         :param schema_name: name of the schema to which link the resolver
         :param type_resolver: the callable to use to resolve the type of an
         abstract type
+        :param batch: determines whether or not the resolver should be called
+        with the list of the parents to resolve
         :type name: str
         :type schema_name: str
         :type type_resolver: Optional[Callable]
+        :type batch: bool
         """
         self.name = name
         self._type_resolver = type_resolver
         self._implementation = None
         self._schema_name = schema_name
+        self._batch = batch
 
     def bake(self, schema: "GraphQLSchema") -> None:
         """
@@ -65,7 +80,11 @@ class Resolver:
 
         try:
             field = schema.get_field_by_name(self.name)
-            field.raw_resolver = self._implementation
+            field.raw_resolver = (
+                create_batch_resolver(self._implementation)
+                if self._batch
+                else self._implementation
+            )
 
             field_wrapped_type = get_wrapped_type(
                 get_graphql_type(schema, field.gql_type)
@@ -1,6 +1,10 @@
+import asyncio
+
 from typing import Callable, Optional
 
+from tartiflette.schema.cache import dump_schema_snapshot, load_schema_snapshot
 from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.schema.sharing import SharedSchema
 from tartiflette.schema.transformer import schema_from_sdl
 
 __all__ = ("SchemaBakery",)
@@ -12,18 +16,46 @@ class SchemaBakery:
     """
 
     @staticmethod
-    def _preheat(schema_name: str) -> "GraphQLSchema":
+    def _preheat(
+        schema_name: str,
+        cache_directory: Optional[str] = None,
+        shared_schema: Optional[SharedSchema] = None,
+    ) -> "GraphQLSchema":
         """
         Loads the SDL and converts it to a GraphQLSchema instance before baking
-        each registered objects of this schema.
+        each registered objects of this schema. The converted GraphQLSchema
+        instance (and the SDL parser) is read from (or stored into) the cache
+        directory if any. When the schema extends a shared schema, only its
+        own SDL is converted.
         :param schema_name: name of the schema to treat
+        :param cache_directory: path to the directory containing the
+        snapshots of the converted schemas
+        :param shared_schema: the baked schema extended by the schema
         :type schema_name: str
+        :type cache_directory: Optional[str]
+        :type shared_schema: Optional[SharedSchema]
         :return: a pre-baked GraphQLSchema instance
         :rtype: GraphQLSchema
         """
         schema_info = SchemaRegistry.find_schema_info(schema_name)
         sdl = schema_info["sdl"]
-        schema = schema_from_sdl(sdl, schema_name=schema_name)
+
+        if shared_schema is not None:
+            schema = shared_schema.build_schema(schema_name, sdl)
+            schema_info["inst"] = schema
+            return schema
+
+        schema = None
+        if cache_directory:
+            schema = load_schema_snapshot(cache_directory, sdl, schema_name)
+
+        if schema is None:
+            schema = schema_from_sdl(
+                sdl, schema_name=schema_name, cache_directory=cache_directory
+            )
+            if cache_directory:
+                dump_schema_snapshot(cache_directory, sdl, schema)
+
         schema_info["inst"] = schema
         return schema
 
@@ -32,6 +64,9 @@ class SchemaBakery:
         schema_name: str,
         custom_default_resolver: Optional[Callable] = None,
         custom_default_type_resolver: Optional[Callable] = None,
+        cache_directory: Optional[str] = None,
+        shared_schema: Optional[SharedSchema] = None,
+        background: bool = False,
     ) -> "GraphQLSchema":
         """
         Bakes and returns a GraphQLSchema instance.
@@ -41,13 +76,33 @@ class SchemaBakery:
         :param custom_default_type_resolver: callable that will replace the
         tartiflette `default_type_resolver` (will be called on abstract types
         to deduct the type of a result)
+        :param cache_directory: path to the directory containing the
+        snapshots of the converted schemas
+        :param shared_schema: the baked schema extended by the schema
+        :param background: whether or not the SDL should be converted in the
+        default executor, so that the event loop keeps executing the requests
+        in the meantime
         :type schema_name: str
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
+        :type cache_directory: Optional[str]
+        :type shared_schema: Optional[SharedSchema]
+        :type background: bool
         :return: a baked GraphQLSchema instance
         :rtype: GraphQLSchema
         """
-        schema = SchemaBakery._preheat(schema_name)
+        if background:
+            schema = await asyncio.get_event_loop().run_in_executor(
+                None,
+                SchemaBakery._preheat,
+                schema_name,
+                cache_directory,
+                shared_schema,
+            )
+        else:
+            schema = SchemaBakery._preheat(
+                schema_name, cache_directory, shared_schema
+            )
         await schema.bake(
             custom_default_resolver, custom_default_type_resolver
         )
@@ -0,0 +1,120 @@
+import hashlib
+import os
+import pickle
+import sys
+
+from typing import Optional
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # pragma: no cover (Python < 3.8)
+    from pkg_resources import DistributionNotFound as PackageNotFoundError
+    from pkg_resources import get_distribution
+
+    def version(distribution_name: str) -> str:
+        return get_distribution(distribution_name).version
+
+
+__all__ = ("load_schema_snapshot", "dump_schema_snapshot")
+
+# Bumped each time the layout of the schema & of its types changes
+_SNAPSHOT_FORMAT_VERSION = 2
+
+# Readable by all the supported Python versions
+_PICKLE_PROTOCOL = 4
+
+
+def _get_distribution_version(distribution_name: str) -> str:
+    """
+    Returns the version of an installed distribution.
+    :param distribution_name: name of the distribution
+    :type distribution_name: str
+    :return: the version of the distribution
+    :rtype: str
+    """
+    try:
+        return version(distribution_name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _get_snapshot_path(directory: str, sdl: str) -> str:
+    """
+    Returns the path of the snapshot of a schema, which is keyed by the
+    SHA-256 digest of its full SDL and of the versions of tartiflette, lark &
+    Python which produced it.
+    :param directory: path to the directory containing the snapshots
+    :param sdl: the full SDL of the schema
+    :type directory: str
+    :type sdl: str
+    :return: the path of the snapshot of the schema
+    :rtype: str
+    """
+    key = hashlib.sha256(sdl.encode("utf-8"))
+    key.update(
+        "\n{}\n{}\n{}\n{}".format(
+            _SNAPSHOT_FORMAT_VERSION,
+            _get_distribution_version("tartiflette"),
+            _get_distribution_version("lark-parser"),
+            sys.version,
+        ).encode("utf-8")
+    )
+    return os.path.join(directory, f"{key.hexdigest()}.pickle")
+
+
+def load_schema_snapshot(
+    directory: str, sdl: str, schema_name: str
+) -> Optional["GraphQLSchema"]:
+    """
+    Returns the GraphQLSchema instance built from the SDL before being baked,
+    as stored into the snapshot directory, so that the SDL doesn't have to be
+    lexed, parsed & transformed again. Since the snapshots are unpickled, the
+    directory should be a trusted location.
+    :param directory: path to the directory containing the snapshots
+    :param sdl: the full SDL of the schema
+    :param schema_name: name of the schema
+    :type directory: str
+    :type sdl: str
+    :type schema_name: str
+    :return: the GraphQLSchema instance or None if there is no (readable)
+    snapshot for the SDL
+    :rtype: Optional[GraphQLSchema]
+    """
+    path = _get_snapshot_path(directory, sdl)
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, "rb") as snapshot_file:
+            schema = pickle.load(snapshot_file)
+    except Exception:  # pylint: disable=broad-except
+        # A corrupted snapshot is built again from the SDL
+        return None
+
+    # The snapshot may have been stored by a schema with another name
+    schema.name = schema_name
+    return schema
+
+
+def dump_schema_snapshot(
+    directory: str, sdl: str, schema: "GraphQLSchema"
+) -> None:
+    """
+    Stores the GraphQLSchema instance built from the SDL, before it's baked,
+    into the snapshot directory. The snapshot is written atomically, so that
+    processes cooking the same schema concurrently either read a complete
+    snapshot or none.
+    :param directory: path to the directory containing the snapshots
+    :param sdl: the full SDL of the schema
+    :param schema: the GraphQLSchema instance built from the SDL
+    :type directory: str
+    :type sdl: str
+    :type schema: GraphQLSchema
+    """
+    path = _get_snapshot_path(directory, sdl)
+    os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as snapshot_file:
+        pickle.dump(schema, snapshot_file, protocol=_PICKLE_PROTOCOL)
+    os.replace(tmp_path, path)
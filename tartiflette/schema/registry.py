@@ -1,7 +1,7 @@
 import os
 
 from glob import glob
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
 
@@ -174,6 +174,22 @@ class SchemaRegistry:
         """
         SchemaRegistry._schemas.setdefault(schema_name, {})
 
+        full_sdl = SchemaRegistry.read_sdl(sdl)
+        if modules_sdl:
+            full_sdl = f"{full_sdl} {modules_sdl}"
+
+        SchemaRegistry._schemas[schema_name]["sdl"] = full_sdl
+
+    @staticmethod
+    def read_sdl(sdl: Union[str, List[str]]) -> str:
+        """
+        Returns the raw SDL from the path(s) to the SDL files / directories or
+        from the raw SDL itself.
+        :param sdl: path(s) to the SDL or raw string representing the SDL
+        :type sdl: Union[str, List[str]]
+        :return: the raw SDL
+        :rtype: str
+        """
         sdl_files_list = []
         full_sdl = ""
 
@@ -193,10 +209,7 @@ class SchemaRegistry:
             with open(filepath, mode="r") as sdl_file:
                 full_sdl += "\n" + sdl_file.read()
 
-        if modules_sdl:
-            full_sdl = f"{full_sdl} {modules_sdl}"
-
-        SchemaRegistry._schemas[schema_name]["sdl"] = full_sdl
+        return full_sdl
 
     @staticmethod
     def find_schema_info(schema_name: str = "default") -> Dict[str, Any]:
@@ -209,6 +222,65 @@ class SchemaRegistry:
         """
         return SchemaRegistry._schemas[schema_name]
 
+    @staticmethod
+    def replace_schema_info(
+        schema_name: str, schema_info: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Replaces the information registered for a schema, so that its objects
+        can be registered again (e.g. while reloading an engine) and restored
+        if the new registrations fail.
+        :param schema_name: name of the schema
+        :param schema_info: the information to register for the schema (no
+        information is registered if None)
+        :type schema_name: str
+        :type schema_info: Optional[Dict[str, Any]]
+        :return: the information previously registered for the schema
+        :rtype: Optional[Dict[str, Any]]
+        """
+        previous_schema_info = SchemaRegistry._schemas.pop(schema_name, None)
+        if schema_info is not None:
+            SchemaRegistry._schemas[schema_name] = schema_info
+        return previous_schema_info
+
+    @staticmethod
+    def carry_over_objects(
+        schema_name: str,
+        schema_info: Dict[str, Any],
+        should_carry_over: Callable[
+            [
+                Union[
+                    "Directive",
+                    "Resolver",
+                    "TypeResolver",
+                    "Scalar",
+                    "Subscription",
+                ]
+            ],
+            bool,
+        ],
+    ) -> None:
+        """
+        Registers again the objects of the information previously registered
+        for a schema which haven't been registered again (e.g. the objects
+        registered outside of the modules executed again while reloading an
+        engine).
+        :param schema_name: name of the schema
+        :param schema_info: the information previously registered for the
+        schema
+        :param should_carry_over: callable returning whether or not an object
+        which hasn't been registered again should be carried over
+        :type schema_name: str
+        :type schema_info: Dict[str, Any]
+        :type should_carry_over: Callable[[Union[Directive, Resolver, TypeResolver, Scalar, Subscription]], bool]
+        """
+        for object_id in _SCHEMA_OBJECT_IDS:
+            for name, obj in schema_info.get(object_id, {}).items():
+                if name not in SchemaRegistry._schemas.get(
+                    schema_name, {}
+                ).get(object_id, {}) and should_carry_over(obj):
+                    SchemaRegistry._register(schema_name, object_id, obj)
+
     @staticmethod
     def find_schema(schema_name: str = "default") -> "GraphQLSchema":
         """
@@ -221,11 +293,30 @@ class SchemaRegistry:
         return SchemaRegistry.find_schema_info(schema_name)["inst"]
 
     @staticmethod
-    def bake_registered_objects(schema: "GraphQLSchema"):
-        schema_info = SchemaRegistry._schemas[schema.name]
+    def bake_registered_objects(
+        schema: "GraphQLSchema", schema_info: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Bakes the objects registered for a schema name into the schema,
+        except the ones implementing a type (or a field of a type) or a
+        directive shared with the base schema of the schema, which are already
+        baked.
+        :param schema: the GraphQLSchema instance to bake the objects into
+        :param schema_info: the information registered for the schema the
+        objects are registered for (defaults to the one of the schema)
+        :type schema: GraphQLSchema
+        :type schema_info: Optional[Dict[str, Any]]
+        """
+        schema_info = schema_info or SchemaRegistry._schemas[schema.name]
         for object_id in _SCHEMA_OBJECT_IDS:
+            shared_names = (
+                schema.shared_directive_names
+                if object_id == "directives"
+                else schema.shared_type_names
+            )
             for obj in schema_info.get(object_id, {}).values():
-                obj.bake(schema)
+                if obj.name.split(".")[0] not in shared_names:
+                    obj.bake(schema)
 
     @classmethod
     def clean(cls) -> None:
@@ -1,4 +1,6 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+import hashlib
+
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from tartiflette.resolver.default import default_type_resolver
 from tartiflette.schema.introspection import (
@@ -143,6 +145,9 @@ class GraphQLSchema:
         ] = []
         self._operation_types: Dict[str, "GraphQLObjectType"] = {}
 
+        # Field definitions indexed by (parent type name, field name)
+        self.field_definitions: Dict[Tuple[str, str], "GraphQLField"] = {}
+
         # Introspection attributes
         self.types: List["GraphQLType"] = []
         self.queryType: Optional[  # pylint: disable=invalid-name
@@ -161,6 +166,19 @@ class GraphQLSchema:
         self.extensions: List["GraphQLExtension"] = []
         self._schema_directives: List["DirectiveNode"] = []
 
+        # Query cost analysis & limits
+        self.cost_analyzer: Optional["QueryCostAnalyzer"] = None
+        self.query_limits: Optional["QueryLimits"] = None
+
+        # Fingerprint of the SDL & of the validation configuration
+        self.fingerprint: Optional[str] = None
+
+        # Baked types & directives shared with the schema this one extends
+        self.base_schema: Optional["GraphQLSchema"] = None
+        self.base_schema_info: Optional[Dict[str, Any]] = None
+        self.shared_type_names: Set[str] = set()
+        self.shared_directive_names: Set[str] = set()
+
     def add_schema_directives(
         self, directives_instances: List["DirectiveNode"]
     ) -> None:
@@ -339,6 +357,43 @@ class GraphQLSchema:
         self._input_types.append(enum_definition.name)
         self.add_type_definition(enum_definition)
 
+    def add_shared_definitions(
+        self,
+        base_schema: "GraphQLSchema",
+        type_names: List[str],
+        directive_names: List[str],
+    ) -> None:
+        """
+        Adds the already baked types & directives of a base schema to the
+        schema. Those definitions are shared with the base schema rather than
+        copied, they are thus neither modified nor baked again when baking the
+        schema.
+        :param base_schema: the baked GraphQLSchema instance to share the
+        definitions of
+        :param type_names: names of the types to share
+        :param directive_names: names of the directives to share
+        :type base_schema: GraphQLSchema
+        :type type_names: List[str]
+        :type directive_names: List[str]
+        """
+        self.base_schema = base_schema
+        for type_name in type_names:
+            type_definition = base_schema.find_type(type_name)
+            if isinstance(type_definition, GraphQLScalarType):
+                self.add_scalar_definition(type_definition)
+            elif isinstance(type_definition, GraphQLEnumType):
+                self.add_enum_definition(type_definition)
+            else:
+                self.add_type_definition(type_definition)
+
+        for directive_name in directive_names:
+            self.add_directive_definition(
+                base_schema.find_directive(directive_name)
+            )
+
+        self.shared_type_names.update(type_names)
+        self.shared_directive_names.update(directive_names)
+
     def add_extension(self, extension: "GraphQLExtension") -> None:
         """TODO
         """
@@ -377,14 +432,19 @@ class GraphQLSchema:
         if not query_type:
             return
 
-        query_type.add_field(
-            SCHEMA_ROOT_FIELD_DEFINITION(
-                gql_type=GraphQLNonNull("__Schema", schema=self)
+        # Shared types already hold their introspection fields
+        if query_type.name not in self.shared_type_names:
+            query_type.add_field(
+                SCHEMA_ROOT_FIELD_DEFINITION(
+                    gql_type=GraphQLNonNull("__Schema", schema=self)
+                )
             )
-        )
-        query_type.add_field(prepare_type_root_field(self))
+            query_type.add_field(prepare_type_root_field(self))
+
+        for type_name, type_definition in self.type_definitions.items():
+            if type_name in self.shared_type_names:
+                continue
 
-        for type_definition in self.type_definitions.values():
             try:
                 type_definition.add_field(
                     TYPENAME_ROOT_FIELD_DEFINITION(
@@ -394,74 +454,72 @@ class GraphQLSchema:
             except AttributeError:
                 pass
 
-    def _validate_schema_named_types(self) -> List[str]:
+    def _validate_schema_named_types(
+        self, gql_type: Union["GraphQLObjectType", "GraphQLInterfaceType"]
+    ) -> List[str]:
         """
-        Validates that all type with fields refers to known GraphQL types.
+        Validates that the fields of the type refer to known GraphQL types.
+        :param gql_type: the type to validate
+        :type gql_type: Union[GraphQLObjectType, GraphQLInterfaceType]
         :return: a list of errors
         :rtype: List[str]
         """
         errors = []
-        for type_name, gql_type in self.type_definitions.items():
-            try:
-                for field in gql_type.implemented_fields.values():
-                    reduced_type = reduce_type(field.gql_type)
-                    if str(reduced_type) not in self.type_definitions:
-                        errors.append(
-                            f"Field < {type_name}.{field.name} > is Invalid: "
-                            f"the given Type < {reduced_type} > does not exist!"
-                        )
-            except AttributeError:
-                pass
+        for field in gql_type.implemented_fields.values():
+            reduced_type = reduce_type(field.gql_type)
+            if str(reduced_type) not in self.type_definitions:
+                errors.append(
+                    f"Field < {gql_type.name}.{field.name} > is Invalid: "
+                    f"the given Type < {reduced_type} > does not exist!"
+                )
         return errors
 
-    def _validate_object_follow_interfaces(self) -> List[str]:
+    def _validate_object_follow_interfaces(
+        self, gql_type: "GraphQLObjectType"
+    ) -> List[str]:
         """
-        Validates that object types which implements interfaces does follow
-        their implementations.
+        Validates that the object type does follow the implementations of the
+        interfaces it implements.
+        :param gql_type: the object type to validate
+        :type gql_type: GraphQLObjectType
         :return: a list of errors
         :rtype: List[str]
         """
         # pylint: disable=too-complex
         errors = []
-        for gql_type in self.type_definitions.values():
+        for iface_name in gql_type.interfaces_names:
             try:
-                ifaces_names = gql_type.interfaces_names
-            except AttributeError:
-                continue
-
-            for iface_name in ifaces_names:
-                try:
-                    iface_type = self.type_definitions[iface_name]
-                    if not isinstance(iface_type, GraphQLInterfaceType):
-                        errors.append(
-                            f"Type < {gql_type.name} > "
-                            f"implements < {iface_name} > "
-                            f"which is not an interface!"
-                        )
-                        continue
-                except KeyError:
+                iface_type = self.type_definitions[iface_name]
+                if not isinstance(iface_type, GraphQLInterfaceType):
                     errors.append(
                         f"Type < {gql_type.name} > "
                         f"implements < {iface_name} > "
-                        f"which does not exist!"
+                        f"which is not an interface!"
                     )
                     continue
+            except KeyError:
+                errors.append(
+                    f"Type < {gql_type.name} > "
+                    f"implements < {iface_name} > "
+                    f"which does not exist!"
+                )
+                continue
 
-                for iface_field in iface_type.implemented_fields.values():
-                    try:
-                        gql_type_field = gql_type.find_field(iface_field.name)
-                    except KeyError:
+            for iface_field in iface_type.implemented_fields.values():
+                try:
+                    gql_type_field = gql_type.find_field(iface_field.name)
+                except KeyError:
+                    errors.append(
+                        f"Field < {gql_type.name}.{iface_field.name} > is missing "
+                        f"as defined in the < {iface_name} > Interface."
+                    )
+                else:
+                    if gql_type_field.gql_type != iface_field.gql_type:
                         errors.append(
-                            f"Field < {gql_type.name}.{iface_field.name} > is missing "
+                            f"Field < {gql_type.name}.{iface_field.name} > "
+                            f"should be of Type < {iface_field.gql_type} > "
                             f"as defined in the < {iface_name} > Interface."
                         )
-                    else:
-                        if gql_type_field.gql_type != iface_field.gql_type:
-                            errors.append(
-                                f"Field < {gql_type.name}.{iface_field.name} > "
-                                f"should be of Type < {iface_field.gql_type} > "
-                                f"as defined in the < {iface_name} > Interface."
-                            )
         return errors
 
     def _validate_schema_root_types_exist(self) -> List[str]:
@@ -492,123 +550,100 @@ class GraphQLSchema:
             )
         return errors
 
-    def _validate_non_empty_object(self) -> List[str]:
+    @staticmethod
+    def _validate_non_empty_object(gql_type: "GraphQLObjectType") -> List[str]:
         """
-        Validates that object types implement at least one fields.
+        Validates that the object type implements at least one field.
+        :param gql_type: the object type to validate
+        :type gql_type: GraphQLObjectType
         :return: a list of errors
         :rtype: List[str]
         """
-        errors = []
-        for type_name, gql_type in self.type_definitions.items():
-            if isinstance(gql_type, GraphQLObjectType) and not [
-                field_name
-                for field_name in gql_type.implemented_fields
-                if not field_name.startswith("__")
-            ]:
-                errors.append(f"Type < {type_name} > has no fields.")
-        return errors
-
-    def _validate_union_is_acceptable(self) -> List[str]:
-        """
-        Validates that union types are valid.
-        :return: a list of errors
-        :rtype: List[str]
-        """
-        errors = []
-        for type_name, gql_type in self.type_definitions.items():
-            if isinstance(gql_type, GraphQLUnionType):
-                for contained_type_name in gql_type.types:
-                    if contained_type_name == type_name:
-                        errors.append(
-                            f"Union Type < {type_name} > contains itself."
-                        )
-                        # TODO: Are there other restrictions for `Union`s ?
-                        # can they contain interfaces ?
-                        # can they mix types: interface | object | scalar
-        return errors
-
-    def _validate_all_scalars_have_implementations(self) -> List[str]:
+        for field_name in gql_type.implemented_fields:
+            if not field_name.startswith("__"):
+                return []
+        return [f"Type < {gql_type.name} > has no fields."]
+
+    @staticmethod
+    def _validate_union_is_acceptable(
+        gql_type: "GraphQLUnionType",
+    ) -> List[str]:
         """
-        Validates that defined scalar types provide a proper implementation.
+        Validates that the union type is valid.
+        :param gql_type: the union type to validate
+        :type gql_type: GraphQLUnionType
         :return: a list of errors
         :rtype: List[str]
         """
         errors = []
-        for type_name, gql_type in self.type_definitions.items():
-            if isinstance(gql_type, GraphQLScalarType) and (
-                gql_type.coerce_output is None
-                or gql_type.coerce_input is None
-                or gql_type.parse_literal is None
-            ):
+        for contained_type_name in gql_type.types:
+            if contained_type_name == gql_type.name:
                 errors.append(
-                    f"Scalar < {type_name} > " f"is missing an implementation"
+                    f"Union Type < {gql_type.name} > contains itself."
                 )
+                # TODO: Are there other restrictions for `Union`s ?
+                # can they contain interfaces ?
+                # can they mix types: interface | object | scalar
         return errors
 
-    def _validate_enum_values_are_unique(self) -> List[str]:
+    @staticmethod
+    def _validate_scalar_has_implementation(
+        gql_type: "GraphQLScalarType",
+    ) -> List[str]:
         """
-        Validates that enum values are unique for each enum types.
+        Validates that the scalar type provides a proper implementation.
+        :param gql_type: the scalar type to validate
+        :type gql_type: GraphQLScalarType
         :return: a list of errors
         :rtype: List[str]
         """
-        errors = []
-        for type_name, gql_type in self.type_definitions.items():
-            if isinstance(gql_type, GraphQLEnumType):
-                for value in gql_type.values:
-                    if str(value.value) in self.type_definitions:
-                        errors.append(
-                            f"Enum < {type_name} > has a "
-                            f"value of < {str(value.value)} > which "
-                            f"is a Type"
-                        )
-        return errors
+        if (
+            gql_type.coerce_output is None
+            or gql_type.coerce_input is None
+            or gql_type.parse_literal is None
+        ):
+            return [
+                f"Scalar < {gql_type.name} > " f"is missing an implementation"
+            ]
+        return []
 
-    def _validate_arguments_have_valid_type(self) -> List[str]:
+    def _validate_enum_values_are_unique(
+        self, gql_type: "GraphQLEnumType"
+    ) -> List[str]:
         """
-        Validates that argument definitions of fields and directives refer to
-        an input type.
+        Validates that the values of the enum type aren't types.
+        :param gql_type: the enum type to validate
+        :type gql_type: GraphQLEnumType
         :return: a list of errors
         :rtype: List[str]
         """
         errors = []
-        for gqltype in self.type_definitions.values():
-            try:
-                for field in gqltype.implemented_fields.values():
-                    for arg in field.arguments.values():
-                        errors.extend(
-                            self._validate_type_is_an_input_types(
-                                arg,
-                                f"Argument < {arg.name} > of Field < {gqltype}.{field.name} >",
-                            )
-                        )
-            except AttributeError:
-                pass
-
-        for directive in self._directive_definitions.values():
-            for arg in directive.arguments.values():
-                errors.extend(
-                    self._validate_type_is_an_input_types(
-                        arg,
-                        f"Argument < {arg.name} > of Directive < {directive.name} >",
-                    )
+        for value in gql_type.values:
+            if str(value.value) in self.type_definitions:
+                errors.append(
+                    f"Enum < {gql_type.name} > has a "
+                    f"value of < {str(value.value)} > which "
+                    f"is a Type"
                 )
-
         return errors
 
+    @staticmethod
     def _validate_type_is_an_input_types(
-        self, obj: "GraphQLType", message_prefix: str
+        obj: "GraphQLType", message_prefix: str, input_types: Set[str]
     ) -> List[str]:
         """
         Validates that the object is a defined input types.
         :param obj: object to check
         :param message_prefix: prefix to append to the error message
+        :param input_types: names of the input types of the schema
         :type obj: GraphQLType
         :type message_prefix: str
+        :type input_types: Set[str]
         :return: a list of errors
         :rtype: List[str]
         """
         rtype = reduce_type(obj.gql_type)
-        if not rtype in self._input_types:
+        if rtype not in input_types:
             return [
                 f"{message_prefix} is of type "
                 f"< {rtype} > which is not a Scalar, "
@@ -616,23 +651,78 @@ class GraphQLSchema:
             ]
         return []
 
-    def _validate_input_type_composed_of_input_type(self) -> List[str]:
+    def _validate_fields_arguments_have_valid_type(
+        self,
+        gql_type: Union["GraphQLObjectType", "GraphQLInterfaceType"],
+        input_types: Set[str],
+    ) -> List[str]:
         """
-        Validates that each input fields of defined input object types refer to
-        an input type.
+        Validates that the argument definitions of the fields of the type
+        refer to an input type.
+        :param gql_type: the type to validate
+        :param input_types: names of the input types of the schema
+        :type gql_type: Union[GraphQLObjectType, GraphQLInterfaceType]
+        :type input_types: Set[str]
         :return: a list of errors
         :rtype: List[str]
         """
         errors = []
-        for typename in self._input_types:
-            gqltype = self.type_definitions[typename]
-            if isinstance(gqltype, GraphQLInputObjectType):
-                for field in gqltype.input_fields.values():
-                    errors.extend(
-                        self._validate_type_is_an_input_types(
-                            field, f"Field < {typename}.{field.name} >"
-                        )
+        for field in gql_type.implemented_fields.values():
+            for arg in field.arguments.values():
+                errors.extend(
+                    self._validate_type_is_an_input_types(
+                        arg,
+                        f"Argument < {arg.name} > of Field < {gql_type}.{field.name} >",
+                        input_types,
                     )
+                )
+        return errors
+
+    def _validate_directives_arguments_have_valid_type(
+        self, input_types: Set[str]
+    ) -> List[str]:
+        """
+        Validates that the argument definitions of the directives refer to an
+        input type.
+        :param input_types: names of the input types of the schema
+        :type input_types: Set[str]
+        :return: a list of errors
+        :rtype: List[str]
+        """
+        errors = []
+        for directive in self._directive_definitions.values():
+            for arg in directive.arguments.values():
+                errors.extend(
+                    self._validate_type_is_an_input_types(
+                        arg,
+                        f"Argument < {arg.name} > of Directive < {directive.name} >",
+                        input_types,
+                    )
+                )
+        return errors
+
+    def _validate_input_type_composed_of_input_type(
+        self, gql_type: "GraphQLInputObjectType", input_types: Set[str]
+    ) -> List[str]:
+        """
+        Validates that each input fields of the input object type refer to an
+        input type.
+        :param gql_type: the input object type to validate
+        :param input_types: names of the input types of the schema
+        :type gql_type: GraphQLInputObjectType
+        :type input_types: Set[str]
+        :return: a list of errors
+        :rtype: List[str]
+        """
+        errors = []
+        for field in gql_type.input_fields.values():
+            errors.extend(
+                self._validate_type_is_an_input_types(
+                    field,
+                    f"Field < {gql_type.name}.{field.name} >",
+                    input_types,
+                )
+            )
         return errors
 
     def _validate_directive_implementation(self) -> List[str]:
@@ -879,29 +969,78 @@ class GraphQLSchema:
 
     def _validate(self) -> bool:
         """
-        Check that the given schema is valid.
+        Check that the given schema is valid. The type definitions are
+        validated in a single traversal, their errors are then reported
+        grouped by validation, in the same order as the global validations.
         :return: a boolean which determines whether or not the schema is valid
         :rtype: bool
         """
-        # TODO: Optimization: most validation functions iterate over
-        # the schema types: it could be done in one loop.
-        validators = [
-            self._validate_schema_named_types,
-            self._validate_object_follow_interfaces,
-            self._validate_schema_root_types_exist,
-            self._validate_non_empty_object,
-            self._validate_union_is_acceptable,
-            self._validate_all_scalars_have_implementations,
-            self._validate_enum_values_are_unique,
-            self._validate_arguments_have_valid_type,
-            self._validate_input_type_composed_of_input_type,
-            self._validate_directive_implementation,
+        # pylint: disable=too-many-locals
+        input_types = set(self._input_types)
+
+        named_types_errors = []
+        interfaces_errors = []
+        non_empty_object_errors = []
+        union_errors = []
+        scalar_errors = []
+        enum_errors = []
+        arguments_errors = []
+        input_fields_errors = []
+        for type_name, gql_type in self.type_definitions.items():
+            # Shared types have already been validated by the base schema
+            if type_name in self.shared_type_names:
+                continue
+
+            if isinstance(gql_type, (GraphQLObjectType, GraphQLInterfaceType)):
+                named_types_errors.extend(
+                    self._validate_schema_named_types(gql_type)
+                )
+                arguments_errors.extend(
+                    self._validate_fields_arguments_have_valid_type(
+                        gql_type, input_types
+                    )
+                )
+                if isinstance(gql_type, GraphQLObjectType):
+                    interfaces_errors.extend(
+                        self._validate_object_follow_interfaces(gql_type)
+                    )
+                    non_empty_object_errors.extend(
+                        self._validate_non_empty_object(gql_type)
+                    )
+            elif isinstance(gql_type, GraphQLUnionType):
+                union_errors.extend(
+                    self._validate_union_is_acceptable(gql_type)
+                )
+            elif isinstance(gql_type, GraphQLScalarType):
+                scalar_errors.extend(
+                    self._validate_scalar_has_implementation(gql_type)
+                )
+            elif isinstance(gql_type, GraphQLEnumType):
+                enum_errors.extend(
+                    self._validate_enum_values_are_unique(gql_type)
+                )
+            elif isinstance(gql_type, GraphQLInputObjectType):
+                input_fields_errors.extend(
+                    self._validate_input_type_composed_of_input_type(
+                        gql_type, input_types
+                    )
+                )
+
+        errors = [
+            *named_types_errors,
+            *interfaces_errors,
+            *self._validate_schema_root_types_exist(),
+            *non_empty_object_errors,
+            *union_errors,
+            *scalar_errors,
+            *enum_errors,
+            *arguments_errors,
+            *self._validate_directives_arguments_have_valid_type(input_types),
+            *input_fields_errors,
+            *self._validate_directive_implementation(),
             # TODO: Validate Field: default value must be of given type
             # TODO: Check all objects have resolvers (at least in parent)
         ]
-        errors = []
-        for validator in validators:
-            errors.extend(validator())
 
         if errors:
             raise GraphQLSchemaError(
@@ -937,29 +1076,58 @@ class GraphQLSchema:
         default_resolver (called as resolver for each UNDECORATED field)
         :type custom_default_resolver: Optional[Callable]
         """
-        for scalar_definition in self._scalar_definitions.values():
-            scalar_definition.bake(self)
+        # Shared types & directives have already been baked by the base schema
+        type_definitions = [
+            type_definition
+            for type_name, type_definition in self.type_definitions.items()
+            if type_name not in self.shared_type_names
+        ]
+
+        for scalar_name, scalar_definition in self._scalar_definitions.items():
+            if scalar_name not in self.shared_type_names:
+                scalar_definition.bake(self)
 
-        for type_definition in self.type_definitions.values():
+        for type_definition in type_definitions:
             # Scalar types are already baked
             if not isinstance(type_definition, GraphQLScalarType):
                 type_definition.bake(self)
 
-        for directive_definition in self._directive_definitions.values():
-            directive_definition.bake(self)
+        for (
+            directive_name,
+            directive_definition,
+        ) in self._directive_definitions.items():
+            if directive_name not in self.shared_directive_names:
+                directive_definition.bake(self)
 
-        for type_definition in self.type_definitions.values():
-            if isinstance(
-                type_definition,
-                (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType),
-            ):
-                await type_definition.bake_fields(
-                    self, custom_default_resolver
-                )
-            elif isinstance(type_definition, GraphQLEnumType):
-                await type_definition.bake_enum_values(self)
-            elif isinstance(type_definition, GraphQLInputObjectType):
-                await type_definition.bake_input_fields(self)
+        for type_definition in type_definitions:
+            await self._bake_type_members(
+                type_definition, custom_default_resolver
+            )
+
+    async def _bake_type_members(
+        self,
+        type_definition: "GraphQLType",
+        custom_default_resolver: Optional[Callable] = None,
+    ) -> None:
+        """
+        Bakes the members of a type linked to the schema (the fields of the
+        object, interface & union types, the values of the enum types and the
+        input fields of the input object types).
+        :param type_definition: the type whose members should be baked
+        :param custom_default_resolver: callable that will replace the builtin
+        default_resolver (called as resolver for each UNDECORATED field)
+        :type type_definition: GraphQLType
+        :type custom_default_resolver: Optional[Callable]
+        """
+        if isinstance(
+            type_definition,
+            (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType),
+        ):
+            await type_definition.bake_fields(self, custom_default_resolver)
+        elif isinstance(type_definition, GraphQLEnumType):
+            await type_definition.bake_enum_values(self)
+        elif isinstance(type_definition, GraphQLInputObjectType):
+            await type_definition.bake_input_fields(self)
 
     def get_operation_root_type(
         self, operation: "OperationDefinitionNode"
@@ -1000,6 +1168,23 @@ class GraphQLSchema:
 
         return func_query, func_subscription
 
+    def compute_fingerprint(self, sdl: str) -> str:
+        """
+        Computes the fingerprint of the schema from its full SDL and from the
+        configuration used to validate the documents (cost analyzer & query
+        limits). A document validated against a schema is valid against any
+        schema sharing its fingerprint and thus doesn't need to be validated
+        again.
+        :param sdl: the full SDL of the schema
+        :type sdl: str
+        :return: the SHA-256 hexadecimal digest of the schema
+        :rtype: str
+        """
+        fingerprint = hashlib.sha256(sdl.encode("utf-8"))
+        fingerprint.update(repr(self.cost_analyzer).encode("utf-8"))
+        fingerprint.update(repr(self.query_limits).encode("utf-8"))
+        return fingerprint.hexdigest()
+
     async def bake(
         self,
         custom_default_resolver: Optional[Callable] = None,
@@ -1030,6 +1215,10 @@ class GraphQLSchema:
             # Exceptions should be collected at validation time
             pass
 
+        if self.base_schema_info is not None:
+            # Implementations registered for the base schema are baked into
+            # the definitions which aren't shared with it
+            SchemaRegistry.bake_registered_objects(self, self.base_schema_info)
         SchemaRegistry.bake_registered_objects(self)
 
         try:
@@ -1058,3 +1247,36 @@ class GraphQLSchema:
         for type_name, type_definition in self.type_definitions.items():
             if not type_name.startswith("__"):
                 self.types.append(type_definition)
+
+        self._bake_field_definitions()
+
+    def _bake_field_definitions(self) -> None:
+        """
+        Indexes the fields of each type by their parent type name and their
+        name in order to retrieve them with a single lookup at execution time.
+        """
+        self.field_definitions = {}
+        if self.base_schema is not None:
+            self.field_definitions.update(
+                (key, field)
+                for key, field in self.base_schema.field_definitions.items()
+                if key[0] in self.shared_type_names
+            )
+
+        for type_name, type_definition in self.type_definitions.items():
+            if type_name in self.shared_type_names:
+                continue
+
+            if isinstance(type_definition, GraphQLUnionType):
+                try:
+                    self.field_definitions[
+                        (type_name, "__typename")
+                    ] = type_definition.find_field("__typename")
+                except KeyError:
+                    pass
+                continue
+
+            for field_name, field in getattr(
+                type_definition, "implemented_fields", {}
+            ).items():
+                self.field_definitions[(type_name, field_name)] = field
@@ -0,0 +1,298 @@
+from typing import Dict, List, Optional, Set, Union
+
+from tartiflette.language.ast import (
+    DirectiveDefinitionNode,
+    DirectiveNode,
+    InterfaceTypeDefinitionNode,
+    InterfaceTypeExtensionNode,
+    NamedTypeNode,
+    ObjectTypeDefinitionNode,
+    ObjectTypeExtensionNode,
+    SchemaDefinitionNode,
+    SchemaExtensionNode,
+)
+from tartiflette.language.ast.base import Node, TypeDefinitionNode
+from tartiflette.language.parsers.lark import parse_to_document
+from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.schema.schema import GraphQLSchema
+from tartiflette.schema.transformer import parse_definition
+from tartiflette.types.interface import GraphQLInterfaceType
+from tartiflette.types.union import GraphQLUnionType
+
+__all__ = ("SharedSchema",)
+
+# Directives & types don't share the same namespace, directives are thus
+# indexed with their name prefixed by an "@"
+_DIRECTIVE_PREFIX = "@"
+
+# AST node attributes which can't reference a type or a directive
+_IGNORED_NODE_ATTRIBUTES = ("name", "description", "location")
+
+
+def _collect_references(
+    node: Union[Optional["Node"], List["Node"]], references: Set[str]
+) -> None:
+    """
+    Collects the names of the types & directives referenced by an AST node
+    and by its children.
+    :param node: the AST node to collect the references of
+    :param references: set to collect the references into
+    :type node: Union[Optional[Node], List[Node]]
+    :type references: Set[str]
+    """
+    if isinstance(node, list):
+        for child in node:
+            _collect_references(child, references)
+    elif isinstance(node, NamedTypeNode):
+        references.add(node.name.value)
+    elif isinstance(node, DirectiveNode):
+        references.add(_DIRECTIVE_PREFIX + node.name.value)
+    elif isinstance(node, Node):
+        for attribute in node.__slots__:
+            if attribute not in _IGNORED_NODE_ATTRIBUTES:
+                _collect_references(getattr(node, attribute, None), references)
+
+
+def _get_definition_key(definition_node: "DefinitionNode") -> Optional[str]:
+    """
+    Returns the key under which a type or directive definition (or
+    extension) is indexed, or None for schema definitions & extensions.
+    :param definition_node: the AST definition node to index
+    :type definition_node: DefinitionNode
+    :return: the name of the type or the prefixed name of the directive
+    :rtype: Optional[str]
+    """
+    if isinstance(
+        definition_node, (SchemaDefinitionNode, SchemaExtensionNode)
+    ):
+        return None
+    if isinstance(definition_node, DirectiveDefinitionNode):
+        return _DIRECTIVE_PREFIX + definition_node.name.value
+    return definition_node.name.value
+
+
+def _get_named_type_name(type_node: "TypeNode") -> str:
+    """
+    Returns the name of the type wrapped by a list or non-null AST type node.
+    :param type_node: the AST type node to unwrap
+    :type type_node: TypeNode
+    :return: the name of the wrapped type
+    :rtype: str
+    """
+    while not isinstance(type_node, NamedTypeNode):
+        type_node = type_node.type
+    return type_node.name.value
+
+
+def _find_field_type_name(
+    definition_nodes: List["DefinitionNode"], field_name: str
+) -> Optional[str]:
+    """
+    Returns the name of the type of a field from the definitions of its
+    parent type.
+    :param definition_nodes: AST definition nodes of the parent type
+    :param field_name: name of the field
+    :type definition_nodes: List[DefinitionNode]
+    :type field_name: str
+    :return: the name of the type of the field
+    :rtype: Optional[str]
+    """
+    for definition_node in definition_nodes:
+        for field_node in getattr(definition_node, "fields", None) or []:
+            if field_node.name.value == field_name:
+                return _get_named_type_name(field_node.type)
+    return None
+
+
+class SharedSchema:
+    """
+    Baked schema whose types & directives are shared by the schemas extending
+    it. A schema extending the base schema is built from its own SDL only:
+    the base definitions it extends, redefines or provides implementations
+    for (and the ones depending on them) are built & baked again from the AST
+    of the base schema, the others are shared as is, without being copied nor
+    baked again.
+    """
+
+    def __init__(self, schema: "GraphQLSchema") -> None:
+        """
+        :param schema: the baked GraphQLSchema instance to share
+        :type schema: GraphQLSchema
+        """
+        self.schema = schema
+        # The information registered for the schema is replaced (and missing
+        # while the new schema is baked) when the base engine is reloaded
+        self.schema_info = SchemaRegistry.find_schema_info(schema.name)
+        self._sdl = self.schema_info["sdl"]
+        self._definitions: Optional[Dict[str, List["DefinitionNode"]]] = None
+        self._definition_nodes: List["DefinitionNode"] = []
+        self._dependents: Dict[str, Set[str]] = {}
+
+    def _index(self) -> Dict[str, List["DefinitionNode"]]:
+        """
+        Parses the SDL of the base schema, the first time it's needed, in
+        order to index its definitions and the definitions depending on each
+        type & directive.
+        :return: the AST definition nodes indexed by their key
+        :rtype: Dict[str, List[DefinitionNode]]
+        """
+        if self._definitions is not None:
+            return self._definitions
+
+        document_node = parse_to_document(self._sdl)
+
+        definitions = {}
+        self._definition_nodes = document_node.definitions
+        for definition_node in document_node.definitions:
+            key = _get_definition_key(definition_node)
+            if key is None:
+                continue
+
+            definitions.setdefault(key, []).append(definition_node)
+
+            references = set()
+            _collect_references(definition_node, references)
+            for reference in references:
+                self._dependents.setdefault(reference, set()).add(key)
+
+            # Objects register themselves into the possible types of their
+            # interfaces when baked
+            if isinstance(
+                definition_node,
+                (ObjectTypeDefinitionNode, ObjectTypeExtensionNode),
+            ):
+                for interface_node in definition_node.interfaces or []:
+                    self._dependents.setdefault(key, set()).add(
+                        interface_node.name.value
+                    )
+
+        self._definitions = definitions
+        return definitions
+
+    def _collect_registry_keys(
+        self,
+        schema_name: str,
+        definition_nodes: List["DefinitionNode"],
+        definitions: Dict[str, List["DefinitionNode"]],
+    ) -> Set[str]:
+        """
+        Collects the keys of the base definitions implemented by the objects
+        registered for the extending schema.
+        :param schema_name: name of the extending schema
+        :param definition_nodes: AST definition nodes of the extending schema
+        :param definitions: AST definition nodes of the base schema per key
+        :type schema_name: str
+        :type definition_nodes: List[DefinitionNode]
+        :type definitions: Dict[str, List[DefinitionNode]]
+        :return: the keys of the definitions implemented by the objects
+        :rtype: Set[str]
+        """
+        keys = set()
+        schema_info = SchemaRegistry.find_schema_info(schema_name)
+        for name in (
+            *schema_info.get("resolvers", {}),
+            *schema_info.get("subscriptions", {}),
+        ):
+            type_name, field_name = name.partition(".")[::2]
+            keys.add(type_name)
+            # Resolvers may register a type resolver into the abstract type
+            # of their field
+            field_type_name = _find_field_type_name(
+                definitions.get(type_name, []) + definition_nodes, field_name
+            )
+            if isinstance(
+                self.schema.type_definitions.get(field_type_name),
+                (GraphQLInterfaceType, GraphQLUnionType),
+            ):
+                keys.add(field_type_name)
+        keys.update(schema_info.get("type_resolvers", {}))
+        keys.update(schema_info.get("scalars", {}))
+        keys.update(
+            _DIRECTIVE_PREFIX + name
+            for name in schema_info.get("directives", {})
+        )
+        return keys
+
+    def _compute_rebuilt_keys(
+        self, schema_name: str, definition_nodes: List["DefinitionNode"]
+    ) -> Set[str]:
+        """
+        Computes the keys of the base definitions which can't be shared with
+        a schema extending the base schema. These definitions are extended,
+        redefined or implemented by the extending schema, or depend on such
+        definitions.
+        :param schema_name: name of the extending schema
+        :param definition_nodes: AST definition nodes of the extending schema
+        :type schema_name: str
+        :type definition_nodes: List[DefinitionNode]
+        :return: the keys of the definitions to build again
+        :rtype: Set[str]
+        """
+        definitions = self._index()
+
+        keys = self._collect_registry_keys(
+            schema_name, definition_nodes, definitions
+        )
+        for definition_node in definition_nodes:
+            keys.add(_get_definition_key(definition_node))
+            if isinstance(
+                definition_node,
+                (
+                    ObjectTypeDefinitionNode,
+                    ObjectTypeExtensionNode,
+                    InterfaceTypeDefinitionNode,
+                    InterfaceTypeExtensionNode,
+                ),
+            ):
+                # New possible types are registered into the interfaces
+                for interface_node in (
+                    getattr(definition_node, "interfaces", None) or []
+                ):
+                    keys.add(interface_node.name.value)
+
+        rebuilt_keys = set()
+        keys = [key for key in keys if key in definitions]
+        while keys:
+            key = keys.pop()
+            if key not in rebuilt_keys:
+                rebuilt_keys.add(key)
+                keys.extend(self._dependents.get(key, ()))
+        return rebuilt_keys
+
+    def build_schema(self, schema_name: str, sdl: str) -> "GraphQLSchema":
+        """
+        Builds the (unbaked) GraphQLSchema instance of a schema extending the
+        base schema with the SDL.
+        :param schema_name: name of the extending schema
+        :param sdl: SDL of the extending schema, which can extend the types
+        of the base schema
+        :type schema_name: str
+        :type sdl: str
+        :return: the GraphQLSchema instance to bake
+        :rtype: GraphQLSchema
+        """
+        definition_nodes = (
+            parse_to_document(sdl).definitions if sdl.strip() else []
+        )
+        rebuilt_keys = self._compute_rebuilt_keys(
+            schema_name, definition_nodes
+        )
+
+        # Base definitions are added in the order of the base SDL, so that
+        # the types are introspected in the same order as the base schema
+        schema = GraphQLSchema(name=schema_name)
+        schema.base_schema_info = self.schema_info
+        for definition_node in self._definition_nodes:
+            key = _get_definition_key(definition_node)
+            if key is None or key in rebuilt_keys:
+                parse_definition(definition_node, schema)
+            elif isinstance(definition_node, DirectiveDefinitionNode):
+                schema.add_shared_definitions(
+                    self.schema, [], [definition_node.name.value]
+                )
+            elif isinstance(definition_node, TypeDefinitionNode):
+                schema.add_shared_definitions(self.schema, [key], [])
+
+        for definition_node in definition_nodes:
+            parse_definition(definition_node, schema)
+        return schema
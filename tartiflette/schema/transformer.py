@@ -950,19 +950,23 @@ def schema_from_document(
 
 
 def schema_from_sdl(
-    sdl: Union[str, bytes], schema_name: str
+    sdl: Union[str, bytes],
+    schema_name: str,
+    cache_directory: Optional[str] = None,
 ) -> "GraphQLSchema":
     """
     Parse the SDL into an AST document node before validating it and building a
     GraphQL Schema instance upon it.
     :param sdl: sdl to parse
     :param schema_name: name of the schema to build
+    :param cache_directory: path to a directory caching the SDL parser
     :type sdl: Union[str, bytes]
     :type schema_name: str
+    :type cache_directory: Optional[str]
     :return: build GraphQLSchema
     :rtype: GraphQLSchema
     """
-    document_node = parse_to_document(sdl)
+    document_node = parse_to_document(sdl, cache_directory)
     # TODO: implements the `validate_document` function
     # errors = validate_document(document)
     # if errors:
@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from tartiflette.types.helpers.get_directive_instances import get_callables
 
 __all__ = ("GraphQLDirective",)
 
@@ -30,6 +32,7 @@ class GraphQLDirective:
         self.arguments = arguments or {}
         self.description = description
         self.implementation = None
+        self.callables: Optional[Dict[str, Callable]] = None
 
         # Introspection attributes
         self.args: List["GraphQLArgument"] = []
@@ -78,6 +81,8 @@ class GraphQLDirective:
         :param schema: the GraphQLSchema instance linked to the engine
         :type schema: GraphQLSchema
         """
+        self.callables = get_callables(self.implementation)
+
         for argument in self.arguments.values():
             argument.bake(schema)
             self.args.append(argument)
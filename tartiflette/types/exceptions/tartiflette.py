@@ -194,3 +194,11 @@ class RedefinedImplementation(TartifletteError):
 
 class CoercionError(TartifletteError):
     pass
+
+
+class PersistedQueryNotFound(TartifletteError):
+    pass
+
+
+class PersistedQueryMismatch(TartifletteError):
+    pass
@@ -1,9 +1,12 @@
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Union
 
-from tartiflette.coercers.outputs.compute import get_output_coercer
+from tartiflette.coercers.outputs.compute import (
+    get_output_coercer,
+    get_sync_output_coercer,
+)
 from tartiflette.resolver.default import default_field_resolver
-from tartiflette.resolver.factory import resolve_field
+from tartiflette.resolver.factory import resolve_field, resolve_trivial_field
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
 )
@@ -48,6 +51,8 @@ class GraphQLField:
         self.arguments = arguments or {}
         self.description = description
         self.graphql_type: Optional["GraphQLType"] = None
+        self.output_coercer: Optional[Callable] = None
+        self.sync_output_coercer: Optional[Callable] = None
 
         # Directives
         self.directives = directives
@@ -57,6 +62,7 @@ class GraphQLField:
         # Resolvers
         self.raw_resolver = resolver
         self.resolver: Optional[Callable] = None
+        self.sync_resolver: Optional[Callable] = None
         self.subscribe: Optional[Callable] = None
 
         # Introspection attributes
@@ -165,6 +171,10 @@ class GraphQLField:
             directive_hook="on_introspection",
         )
 
+        # Coercers
+        self.output_coercer = get_output_coercer(self.graphql_type)
+        self.sync_output_coercer = get_sync_output_coercer(self.graphql_type)
+
         # Resolvers
         self.resolver = partial(
             resolve_field,
@@ -180,7 +190,22 @@ class GraphQLField:
                 is_resolver=True,
                 with_default=True,
             ),
-            output_coercer=get_output_coercer(self.graphql_type),
+        )
+
+        # Scalar fields resolved by the default resolver, without arguments
+        # and `on_field_execution` hooks, can be resolved synchronously when
+        # their nodes have no query directives
+        self.sync_resolver = (
+            partial(resolve_trivial_field, field_definition=self)
+            if self.sync_output_coercer is not None
+            and self.raw_resolver is None
+            and custom_default_resolver is None
+            and not self.arguments
+            and not any(
+                "on_field_execution" in directive["callables"]
+                for directive in directives_definition
+            )
+            else None
         )
 
         for argument in self.arguments.values():
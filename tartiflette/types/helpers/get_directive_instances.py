@@ -2,12 +2,17 @@ from functools import partial
 from typing import Any, Callable, Dict, List, Optional
 
 from tartiflette.coercers.arguments import coerce_arguments
+from tartiflette.language.ast import (
+    ListValueNode,
+    ObjectValueNode,
+    VariableNode,
+)
 from tartiflette.utils.callables import (
     is_valid_async_generator,
     is_valid_coroutine,
 )
 
-__all__ = ("compute_directive_nodes",)
+__all__ = ("compute_directive_nodes", "has_variable_arguments")
 
 
 def get_callables(implementation: Any) -> Dict[str, Callable]:
@@ -43,10 +48,50 @@ def transform_directive(
     :return: the transformed directive definition
     :rtype: Dict[str, Any]
     """
-    return {
-        "callables": get_callables(directive.implementation),
-        "arguments_coercer": arguments_coercer,
-    }
+    callables = directive.callables
+    if callables is None:
+        # Directives used before being baked (e.g. by types baked before
+        # directives) compute their hooks once on first use
+        callables = directive.callables = get_callables(
+            directive.implementation
+        )
+
+    return {"callables": callables, "arguments_coercer": arguments_coercer}
+
+
+def _is_variable_value(value_node: "ValueNode") -> bool:
+    """
+    Determines whether or not a value node is or contains a variable node.
+    :param value_node: the value node to check
+    :type value_node: ValueNode
+    :return: whether or not the value node is or contains a variable node
+    :rtype: bool
+    """
+    if isinstance(value_node, VariableNode):
+        return True
+    if isinstance(value_node, ListValueNode):
+        return any(_is_variable_value(value) for value in value_node.values)
+    if isinstance(value_node, ObjectValueNode):
+        return any(
+            _is_variable_value(field.value) for field in value_node.fields
+        )
+    return False
+
+
+def has_variable_arguments(directive_nodes: List["DirectiveNode"]) -> bool:
+    """
+    Determines whether or not one of the directive nodes has an argument
+    depending on the variables of the request.
+    :param directive_nodes: list of AST directive node to check
+    :type directive_nodes: List[DirectiveNode]
+    :return: whether or not one of the directive nodes has a variable argument
+    :rtype: bool
+    """
+    return any(
+        _is_variable_value(argument.value)
+        for directive_node in directive_nodes
+        for argument in directive_node.arguments or []
+    )
 
 
 def compute_directive_nodes(
@@ -16,7 +16,10 @@ from tartiflette.coercers.literals.scalar_coercer import (
 from tartiflette.coercers.outputs.directives_coercer import (
     output_directives_coercer,
 )
-from tartiflette.coercers.outputs.scalar_coercer import scalar_coercer
+from tartiflette.coercers.outputs.scalar_coercer import (
+    scalar_coercer,
+    sync_scalar_coercer,
+)
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
 )
@@ -66,6 +69,7 @@ class GraphQLScalarType(GraphQLInputType, GraphQLType):
         self.input_coercer: Optional[Callable] = None
         self.literal_coercer: Optional[Callable] = None
         self.output_coercer: Optional[Callable] = None
+        self.sync_output_coercer: Optional[Callable] = None
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -144,6 +148,17 @@ class GraphQLScalarType(GraphQLInputType, GraphQLType):
             ),
         )
 
+        # Values of scalars without `on_pre_output_coercion` hooks can be
+        # coerced without going through the directives
+        self.sync_output_coercer = (
+            partial(sync_scalar_coercer, scalar_type=self)
+            if not any(
+                "on_pre_output_coercion" in directive["callables"]
+                for directive in directives_definition
+            )
+            else None
+        )
+
 
 class GraphQLScalarTypeExtension(GraphQLType, GraphQLExtension):
     def __init__(self, name, directives):
@@ -0,0 +1,130 @@
+import asyncio
+
+from types import SimpleNamespace
+
+import pytest
+
+from tartiflette import EngineOptions, Resolver, create_engine
+from tartiflette.execution.strategies import eager_strategy, gather_strategy
+
+pytest.importorskip("pytest_benchmark")
+
+_WIDE_SDL = """
+type Item {
+  id: Int
+  name: String
+  children(first: Int): [Item]
+%(fields)s
+}
+
+type Query {
+  items(first: Int): [Item]
+}
+""" % {
+    "fields": "\n".join(f"  field{index}: String" for index in range(100))
+}
+
+_LONG_LIST_SDL = """
+type Point {
+  x: Int
+  y: Int
+  norm: Float
+}
+
+type Query {
+  points: [Point]
+}
+"""
+
+# 5000 types: interfaces, enums, input objects & objects
+_LARGE_SDL = (
+    "\n".join(
+        f"""
+interface Node{index} {{ id: ID! }}
+enum Kind{index} {{ A{index} B{index} }}
+input Filter{index} {{ kind: Kind{index} first: Int }}
+type Object{index} implements Node{index} {{
+  id: ID!
+  name(filter: Filter{index}, first: Int = 10): String
+  kind: Kind{index}
+  next: Object{(index + 1) % 1250}
+}}
+"""
+        for index in range(1250)
+    )
+    + "type Query { object: Object0 }"
+)
+
+_EXECUTION_STRATEGIES = {
+    "gather_strategy": gather_strategy,
+    "eager_strategy": eager_strategy,
+}
+
+
+@pytest.fixture(scope="session")
+def wide_engine():
+    return asyncio.get_event_loop().run_until_complete(
+        create_engine(_WIDE_SDL, schema_name="benchmark_wide")
+    )
+
+
+@pytest.fixture(scope="session")
+def wide_query():
+    fields = " ".join(f"field{index}" for index in range(100))
+    return (
+        "query {"
+        + " ".join(
+            f"a{index}: items(first: {index}) {{ id name {fields} "
+            f"children(first: 2) {{ id name {fields} }} }}"
+            for index in range(10)
+        )
+        + "}"
+    )
+
+
+@pytest.fixture(scope="session")
+def wide_root_value():
+    def item(index):
+        return {
+            "id": index,
+            "name": f"item{index}",
+            **{f"field{field}": str(field) for field in range(100)},
+        }
+
+    return SimpleNamespace(
+        items=[
+            {**item(index), "children": [item(index), item(index)]}
+            for index in range(10)
+        ]
+    )
+
+
+@pytest.fixture(scope="session", params=list(_EXECUTION_STRATEGIES))
+def long_list_engine(request):
+    schema_name = f"benchmark_long_list_{request.param}"
+
+    @Resolver("Point.norm", schema_name=schema_name)
+    async def resolve_point_norm(parent, args, ctx, info):
+        return (parent["x"] ** 2 + parent["y"] ** 2) ** 0.5
+
+    return asyncio.get_event_loop().run_until_complete(
+        create_engine(
+            _LONG_LIST_SDL,
+            schema_name=schema_name,
+            options=EngineOptions(
+                execution_strategy=_EXECUTION_STRATEGIES[request.param]
+            ),
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def long_list_root_value():
+    return SimpleNamespace(
+        points=[{"x": index, "y": -index} for index in range(10000)]
+    )
+
+
+@pytest.fixture(scope="session")
+def large_sdl():
+    return _LARGE_SDL
@@ -0,0 +1,58 @@
+import asyncio
+
+from itertools import count
+
+import pytest
+
+from tartiflette import EngineOptions, create_engine
+from tartiflette.schema.registry import SchemaRegistry
+
+_SCHEMA_INDEXES = count()
+
+
+def _cook(sdl, options=None):
+    schema_name = f"benchmark_cook_{next(_SCHEMA_INDEXES)}"
+    engine = asyncio.get_event_loop().run_until_complete(
+        create_engine(sdl, schema_name=schema_name, options=options)
+    )
+    del SchemaRegistry._schemas[schema_name]
+    return engine
+
+
+@pytest.mark.benchmark(group="cook-large-schema")
+def test_cook_large_schema(benchmark, large_sdl):
+    engine = benchmark.pedantic(_cook, args=(large_sdl,), rounds=3)
+    # pylint: disable=protected-access
+    assert len(engine._schema.type_definitions) > 5000
+
+
+@pytest.mark.benchmark(group="cook-large-schema")
+def test_cook_large_schema_cache_directory(benchmark, large_sdl, tmp_path):
+    options = EngineOptions(schema_cache_directory=str(tmp_path / "schemas"))
+    _cook(large_sdl, options)
+
+    engine = benchmark.pedantic(_cook, args=(large_sdl, options), rounds=3)
+    # pylint: disable=protected-access
+    assert len(engine._schema.type_definitions) > 5000
+
+
+@pytest.mark.benchmark(group="cook-large-schema")
+def test_cook_large_schema_base_engine(benchmark, large_sdl):
+    base_engine = asyncio.get_event_loop().run_until_complete(
+        create_engine(large_sdl, schema_name="benchmark_cook_base")
+    )
+    # The base SDL is parsed again the first time an engine extends it
+    options = EngineOptions(base_engine=base_engine)
+    _cook("", options)
+
+    engine = benchmark.pedantic(
+        _cook,
+        args=(
+            "type Tenant { name: String } extend type Query { tenant: Tenant }",
+            options,
+        ),
+        rounds=3,
+    )
+    del SchemaRegistry._schemas["benchmark_cook_base"]
+    # pylint: disable=protected-access
+    assert len(engine._schema.type_definitions) > 5000
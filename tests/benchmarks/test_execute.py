@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.benchmark(group="engine-execute")
+def test_execute_wide_query(
+    benchmark, wide_engine, wide_query, wide_root_value
+):
+    loop = asyncio.get_event_loop()
+
+    def execute():
+        return loop.run_until_complete(
+            wide_engine.execute(wide_query, initial_value=wide_root_value)
+        )
+
+    result = benchmark(execute)
+    assert "errors" not in result
+    assert len(result["data"]["a0"]) == 10
+
+
+@pytest.mark.benchmark(group="engine-execute-long-list")
+def test_execute_long_list_query(
+    benchmark, long_list_engine, long_list_root_value
+):
+    loop = asyncio.get_event_loop()
+
+    def execute():
+        return loop.run_until_complete(
+            long_list_engine.execute(
+                "{ points { x y norm } }", initial_value=long_list_root_value
+            )
+        )
+
+    result = benchmark(execute)
+    assert "errors" not in result
+    assert len(result["data"]["points"]) == 10000
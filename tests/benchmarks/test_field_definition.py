@@ -0,0 +1,32 @@
+import pytest
+
+from tartiflette.execution.helpers import get_field_definition
+
+
+def _get_field_definition_by_name(schema, parent_type, field_name):
+    try:
+        return schema.get_field_by_name(f"{parent_type}.{field_name}")
+    except Exception:  # pylint: disable=broad-except
+        pass
+    return None
+
+
+@pytest.mark.benchmark(group="get-field-definition")
+@pytest.mark.parametrize(
+    "lookup", [get_field_definition, _get_field_definition_by_name]
+)
+def test_get_field_definition_wide_type(benchmark, wide_engine, lookup):
+    # pylint: disable=protected-access
+    schema = wide_engine._schema
+    parent_type = schema.find_type("Item")
+    field_names = list(parent_type.implemented_fields) + ["unknownField"]
+
+    def lookup_fields():
+        return [
+            lookup(schema, parent_type, field_name)
+            for field_name in field_names
+        ]
+
+    field_definitions = benchmark(lookup_fields)
+    assert field_definitions[-1] is None
+    assert all(field_definitions[:-1])
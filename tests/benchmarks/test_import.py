@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import pytest
+
+_IMPORT_SCRIPT = """
+import tartiflette
+from tartiflette.language.parsers.lark import parser
+
+assert parser._LARK_PARSER is None
+"""
+
+
+def _import_tartiflette():
+    subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT], check=True)
+
+
+@pytest.mark.benchmark(group="import")
+def test_import_tartiflette(benchmark):
+    # The SDL parser shouldn't be built by `import tartiflette`, which can be
+    # profiled through `python -X importtime -c "import tartiflette"`
+    benchmark.pedantic(_import_tartiflette, rounds=5)
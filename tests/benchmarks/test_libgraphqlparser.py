@@ -0,0 +1,16 @@
+import pytest
+
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.parsers.libgraphqlparser.parser import (
+    parse_to_document_from_json,
+)
+
+
+@pytest.mark.benchmark(group="libgraphqlparser-parse-to-document")
+@pytest.mark.parametrize(
+    "parser", [parse_to_document, parse_to_document_from_json]
+)
+def test_parse_to_document(benchmark, wide_engine, wide_query, parser):
+    # pylint: disable=protected-access
+    document = benchmark(parser, wide_query, wide_engine._schema)
+    assert not document.validators.errors
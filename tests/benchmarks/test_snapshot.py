@@ -0,0 +1,32 @@
+import pytest
+
+from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.execution.snapshot import (
+    dump_document_snapshot,
+    load_document_snapshot,
+)
+
+
+@pytest.mark.benchmark(group="document-snapshot")
+def test_parse_and_validate_wide_query(benchmark, wide_engine, wide_query):
+    # pylint: disable=protected-access
+    document, _ = benchmark(
+        parse_and_validate_query, wide_query, wide_engine._schema
+    )
+    assert document is not None
+
+
+@pytest.mark.benchmark(group="document-snapshot")
+def test_load_wide_document_snapshot(
+    benchmark, wide_engine, wide_query, tmp_path
+):
+    # pylint: disable=protected-access
+    schema = wide_engine._schema
+    document, _ = parse_and_validate_query(wide_query, schema)
+    path = str(tmp_path / "documents.pickle")
+    dump_document_snapshot(path, [(wide_query, document)], schema.fingerprint)
+
+    ((_, loaded_document),) = benchmark(
+        load_document_snapshot, path, schema.fingerprint
+    )
+    assert loaded_document == document
@@ -0,0 +1,22 @@
+import pytest
+
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.validators import Validators
+from tartiflette.language.validators.query import RULE_SET
+from tartiflette.language.validators.visitor import ValidationVisitor
+
+
+@pytest.mark.benchmark(group="validation-visitor")
+def test_validate_wide_document(benchmark, wide_engine, wide_query):
+    # pylint: disable=protected-access
+    schema = wide_engine._schema
+    document = parse_to_document(wide_query, schema)
+    visitor = ValidationVisitor(RULE_SET)
+
+    def validate():
+        validators = Validators(schema, RULE_SET)
+        visitor.visit(document, validators)
+        return validators
+
+    validators = benchmark(validate)
+    assert not validators.errors
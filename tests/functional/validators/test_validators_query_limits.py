@@ -0,0 +1,182 @@
+import pytest
+
+from tartiflette import EngineOptions, create_engine
+from tartiflette.execution.limits import QueryLimits
+
+_SDL = """
+type Dog {
+  name: String
+  friends: [Dog]
+}
+
+type Query {
+  dog: Dog
+}
+"""
+
+
+def _error(message, path, line, column, tag):
+    return {
+        "message": message,
+        "path": path,
+        "locations": [{"line": line, "column": column}],
+        "extensions": {
+            "rule": None,
+            "spec": None,
+            "details": None,
+            "tag": tag,
+        },
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        (
+            "{ dog { friends { name } } }",
+            {"data": {"dog": {"friends": [{"name": "Dog"}]}}},
+        ),
+        (
+            "{ dog { friends { friends { name } } } }",
+            {
+                "data": None,
+                "errors": [
+                    _error(
+                        "Selection set exceeds the maximum depth of < 3 >.",
+                        ["dog", "friends", "friends"],
+                        1,
+                        27,
+                        "max-selection-depth",
+                    )
+                ],
+            },
+        ),
+        (
+            """
+            { dog { ...F } }
+            fragment F on Dog { friends { ...G } }
+            fragment G on Dog { friends { name } }
+            """,
+            {
+                "data": None,
+                "errors": [
+                    _error(
+                        "Selection set exceeds the maximum depth of < 3 >.",
+                        ["dog"],
+                        2,
+                        21,
+                        "max-selection-depth",
+                    )
+                ],
+            },
+        ),
+        (
+            "{ dog { a: name b: name c: name } }",
+            {
+                "data": None,
+                "errors": [
+                    _error(
+                        "Selection set contains < 3 > aliases which exceeds the maximum of < 2 > aliases.",
+                        ["dog"],
+                        1,
+                        7,
+                        "max-aliases",
+                    )
+                ],
+            },
+        ),
+        (
+            "{ dog { name friends { name } } d: dog { name friends { name } } }",
+            {
+                "data": None,
+                "errors": [
+                    _error(
+                        "Document contains more than < 6 > field nodes.",
+                        None,
+                        1,
+                        1,
+                        "max-field-nodes",
+                    )
+                ],
+            },
+        ),
+        (
+            """
+            { dog { a: name ...F } }
+            fragment F on Dog { b: name c: name }
+            """,
+            {
+                "data": None,
+                "errors": [
+                    _error(
+                        "Selection set contains < 3 > aliases which exceeds the maximum of < 2 > aliases.",
+                        ["dog"],
+                        2,
+                        19,
+                        "max-aliases",
+                    )
+                ],
+            },
+        ),
+        (
+            """
+            { dog { ...F } d: dog { ...F } }
+            fragment F on Dog { name friends { name } }
+            """,
+            {
+                "data": None,
+                "errors": [
+                    _error(
+                        "Document contains more than < 6 > field nodes.",
+                        None,
+                        2,
+                        13,
+                        "max-field-nodes",
+                    )
+                ],
+            },
+        ),
+        (
+            """
+            { dog { ...F ...F friends { ...F } } }
+            fragment F on Dog { name }
+            """,
+            {
+                "data": None,
+                "errors": [
+                    _error(
+                        "Document contains more than < 2 > fragment spreads.",
+                        ["dog"],
+                        2,
+                        19,
+                        "max-fragment-spreads",
+                    )
+                ],
+            },
+        ),
+    ],
+)
+async def test_validators_query_limits(random_schema_name, query, expected):
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        options=EngineOptions(
+            query_limits=QueryLimits(
+                max_depth=3,
+                max_aliases=2,
+                max_field_nodes=6,
+                max_fragment_spreads=2,
+            )
+        ),
+    )
+
+    assert (
+        await engine.execute(
+            query,
+            initial_value={
+                "dog": {"name": "Dog", "friends": [{"name": "Dog"}]}
+            },
+        )
+        == expected
+    )
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from tartiflette.schema.registry import SchemaRegistry
@@ -8,3 +10,18 @@ def clean_registry():
     SchemaRegistry.clean()
     yield SchemaRegistry
     SchemaRegistry.clean()
+
+
+@pytest.fixture
+def count_schema_snapshots():
+    def _count_schema_snapshots(directory):
+        # The SDL parser may also be cached into the directory
+        return len(
+            [
+                filename
+                for filename in os.listdir(directory)
+                if not filename.startswith("lark_")
+            ]
+        )
+
+    return _count_schema_snapshots
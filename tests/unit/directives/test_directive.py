@@ -68,3 +68,45 @@ def test_directive_bake(clean_registry):
 
     assert a_directive.bake(schema) is None
     assert isinstance(directive_internal.implementation, dontcare)
+
+
+@pytest.mark.asyncio
+async def test_directive_callables_are_baked(clean_registry):
+    from unittest.mock import patch
+
+    from tartiflette import Directive, create_engine
+    from tartiflette.types.helpers import get_directive_instances
+
+    @Directive("upper", schema_name="test_directive_callables_are_baked")
+    class UpperDirective:
+        async def on_field_execution(
+            self, directive_args, next_resolver, parent, args, ctx, info
+        ):
+            return (await next_resolver(parent, args, ctx, info)).upper()
+
+        def on_not_a_coroutine(self):
+            pass
+
+    engine = await create_engine(
+        """
+        directive @upper on FIELD
+
+        type Query { a: String }
+        """,
+        schema_name="test_directive_callables_are_baked",
+    )
+
+    # pylint: disable=protected-access
+    directive = engine._schema.find_directive("upper")
+    assert list(directive.callables) == ["on_field_execution"]
+
+    with patch.object(
+        get_directive_instances,
+        "get_callables",
+        wraps=get_directive_instances.get_callables,
+    ) as get_callables_mock:
+        assert await engine.execute(
+            "{ a @upper a2: a @upper @skip(if: false) }",
+            initial_value={"a": "a"},
+        ) == {"data": {"a": "A", "a2": "A"}}
+        get_callables_mock.assert_not_called()
@@ -0,0 +1,148 @@
+import pytest
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.cache import LFUDocumentCache, LRUDocumentCache
+
+
+@pytest.mark.parametrize("cache_class", [LRUDocumentCache, LFUDocumentCache])
+def test_document_cache_get_set(cache_class):
+    cache = cache_class()
+
+    assert cache.get("{ a }") is UNDEFINED_VALUE
+    cache.set("{ a }", "A")
+    assert cache.get("{ a }") == "A"
+    cache.set("{ a }", "AA")
+    assert cache.get("{ a }") == "AA"
+    assert "{ a }" in cache
+    assert "{ b }" not in cache
+
+    assert len(cache) == 1
+    assert cache.stats == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "size": 1,
+        "query_length": 5,
+    }
+
+    cache.clear()
+    assert cache.get("{ a }") is UNDEFINED_VALUE
+    assert cache.stats == {
+        "hits": 0,
+        "misses": 1,
+        "evictions": 0,
+        "size": 0,
+        "query_length": 0,
+    }
+
+
+def test_lru_document_cache_evicts_least_recently_used():
+    cache = LRUDocumentCache(max_size=2)
+    cache.set("{ a }", "A")
+    cache.set("{ b }", "B")
+    cache.get("{ a }")
+    cache.set("{ c }", "C")
+
+    assert cache.get("{ b }") is UNDEFINED_VALUE
+    assert cache.get("{ a }") == "A"
+    assert cache.get("{ c }") == "C"
+    assert cache.evictions == 1
+
+
+def test_lfu_document_cache_evicts_least_frequently_used():
+    cache = LFUDocumentCache(max_size=2)
+    cache.set("{ a }", "A")
+    cache.set("{ b }", "B")
+    cache.get("{ a }")
+    cache.get("{ a }")
+    cache.get("{ b }")
+    cache.set("{ c }", "C")
+
+    assert cache.get("{ b }") is UNDEFINED_VALUE
+    assert cache.get("{ a }") == "A"
+
+    cache.set("{ d }", "D")
+    assert cache.get("{ c }") is UNDEFINED_VALUE
+    assert cache.get("{ d }") == "D"
+    assert cache.evictions == 2
+
+
+@pytest.mark.parametrize("cache_class", [LRUDocumentCache, LFUDocumentCache])
+def test_document_cache_max_query_length(cache_class):
+    cache = cache_class(max_size=None, max_query_length=12)
+    cache.set("{ a }", "A")
+    cache.set("{ b }", "B")
+    assert cache.query_length == 10
+
+    cache.set("{ c }", "C")
+    assert cache.get("{ a }") is UNDEFINED_VALUE
+    assert cache.query_length == 10
+    assert cache.evictions == 1
+
+    cache.set("{ too_long_query }", "TOO_LONG")
+    assert cache.get("{ too_long_query }") is UNDEFINED_VALUE
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize("cache_class", [LRUDocumentCache, LFUDocumentCache])
+def test_document_cache_disabled(cache_class):
+    cache = cache_class(max_size=0)
+    cache.set("{ a }", "A")
+    assert cache.get("{ a }") is UNDEFINED_VALUE
+    assert len(cache) == 0
+
+
+def test_document_cache_items():
+    cache = LRUDocumentCache()
+    cache.set("{ a }", "A")
+    cache.set("{ b }", "B")
+    cache.get("{ a }")
+    assert cache.items() == [("{ b }", "B"), ("{ a }", "A")]
+
+    cache = LFUDocumentCache()
+    cache.set("{ a }", "A")
+    cache.set("{ b }", "B")
+    cache.get("{ a }")
+    cache.get("{ a }")
+    cache.set("{ c }", "C")
+    assert cache.items() == [("{ b }", "B"), ("{ c }", "C"), ("{ a }", "A")]
+
+
+@pytest.mark.parametrize("cache_class", [LRUDocumentCache, LFUDocumentCache])
+def test_document_cache_replace(cache_class):
+    cache = cache_class()
+    cache.set("{ a }", "A")
+    cache.set("{ b }", "B")
+    cache.get("{ a }")
+    stats = cache.stats
+
+    cache.replace("{ b }", "BB")
+    cache.replace("{ c }", "C")
+    assert cache.items() == [("{ b }", "BB"), ("{ a }", "A")]
+    assert cache.stats == stats
+
+
+@pytest.mark.parametrize("cache_class", [LRUDocumentCache, LFUDocumentCache])
+def test_document_cache_remove(cache_class):
+    cache = cache_class()
+    cache.set("{ a }", "A")
+    cache.set("{ b }", "B")
+    cache.remove("{ a }")
+    cache.remove("{ c }")
+
+    assert "{ a }" not in cache
+    assert cache.get("{ b }") == "B"
+    assert cache.stats == {
+        "hits": 1,
+        "misses": 0,
+        "evictions": 0,
+        "size": 1,
+        "query_length": 5,
+    }
+
+
+def test_document_cache_is_abstract():
+    from tartiflette.execution.cache import DocumentCache
+
+    with pytest.raises(TypeError):
+        DocumentCache()
@@ -0,0 +1,152 @@
+import pytest
+
+from tartiflette import Directive, create_engine
+
+
+@pytest.mark.parametrize(
+    "skip,include,expected",
+    [
+        (False, True, {"id": 1, "name": "a"}),
+        (True, True, {"id": 1}),
+        (False, False, {"id": 1}),
+        (True, False, {"id": 1}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_collect_builtin_inclusion_directives(
+    clean_registry, skip, include, expected
+):
+    engine = await create_engine(
+        """
+        type Item { id: Int name: String }
+        type Query { item: Item }
+        """
+    )
+
+    assert (
+        await engine.execute(
+            """
+        query ($skip: Boolean!, $include: Boolean!) {
+          item {
+            id
+            name @skip(if: $skip) @include(if: $include)
+            ... on Item @skip(if: true) { skipped: name }
+            ... on Item @include(if: false) { excluded: name }
+          }
+        }
+        """,
+            variables={"skip": skip, "include": include},
+            initial_value={"item": {"id": 1, "name": "a"}},
+        )
+        == {"data": {"item": expected}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_collect_overridden_inclusion_directive(clean_registry):
+    from tartiflette.types.exceptions.tartiflette import SkipCollection
+
+    @Directive("skip", schema_name="test_collect_overridden_skip")
+    class InvertedSkipDirective:
+        async def on_field_collection(
+            self, directive_args, next_directive, field_node, ctx
+        ):
+            if not directive_args["if"]:
+                raise SkipCollection()
+            return await next_directive(field_node, ctx)
+
+    engine = await create_engine(
+        """
+        directive @skip(if: Boolean!) on FIELD
+
+        type Item { id: Int name: String }
+        type Query { item: Item }
+        """,
+        schema_name="test_collect_overridden_skip",
+    )
+
+    assert await engine.execute(
+        "{ item { id @skip(if: false) name @skip(if: true) } }",
+        initial_value={"item": {"id": 1, "name": "a"}},
+    ) == {"data": {"item": {"name": "a"}}}
+
+
+@pytest.mark.asyncio
+async def test_collect_rebind_document(clean_registry):
+    from tartiflette.execution.collect import (
+        parse_and_validate_query,
+        rebind_document,
+    )
+
+    schemas = {}
+    for schema_name, sdl in (
+        ("test_collect_rebind_document", "type Query { a: Int }"),
+        ("test_collect_rebind_document_same", "type Query { a: Int }"),
+        (
+            "test_collect_rebind_document_extended",
+            "type Query { a: Int b: Int }",
+        ),
+        ("test_collect_rebind_document_invalid", "type Query { b: Int }"),
+    ):
+        schemas[schema_name] = (
+            await create_engine(sdl, schema_name=schema_name)
+        )._schema
+
+    document, _ = parse_and_validate_query(
+        "{ a }", schemas["test_collect_rebind_document"]
+    )
+    document.execution_plans["plan"] = "plan"
+    document.variable_definitions["operation"] = []
+
+    schema = schemas["test_collect_rebind_document_same"]
+    rebound_document, errors = rebind_document(document, schema)
+    assert errors is None
+    assert rebound_document is not document
+    assert rebound_document.definitions is document.definitions
+    assert rebound_document.execution_plans == {}
+    assert rebound_document.variable_definitions == {}
+    assert document.execution_plans == {"plan": "plan"}
+    assert document.variable_definitions == {"operation": []}
+
+    schema = schemas["test_collect_rebind_document_extended"]
+    rebound_document, errors = rebind_document(document, schema)
+    assert errors is None
+    assert rebound_document.schema_fingerprint == schema.fingerprint
+    assert document.schema_fingerprint != schema.fingerprint
+
+    schema = schemas["test_collect_rebind_document_invalid"]
+    rebound_document, errors = rebind_document(document, schema)
+    assert rebound_document is None
+    assert len(errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_collect_executable_variable_definitions(clean_registry):
+    from tartiflette.execution.collect import (
+        collect_executable_variable_definitions,
+        parse_and_validate_query,
+    )
+
+    schema = (
+        await create_engine(
+            "type Query { a(b: Int): Int }",
+            schema_name="test_collect_executable_variable_definitions",
+        )
+    )._schema
+
+    document, _ = parse_and_validate_query(
+        "query ($b: Int) { a(b: $b) }", schema
+    )
+    operation = document.definitions[0]
+
+    executable_variable_definitions = collect_executable_variable_definitions(
+        schema, document, operation
+    )
+    assert len(executable_variable_definitions) == 1
+    assert document.variable_definitions == {
+        id(operation): executable_variable_definitions
+    }
+    assert (
+        collect_executable_variable_definitions(schema, document, operation)
+        is executable_variable_definitions
+    )
@@ -0,0 +1,185 @@
+import pytest
+
+from tartiflette import EngineOptions, Resolver, create_engine
+from tartiflette.execution.cost import QueryCost, QueryCostAnalyzer
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+directive @cost(complexity: Int, multipliers: [String!]) on FIELD_DEFINITION
+
+type Dog {
+  name: String
+  friends(first: Int, ids: [Int]): [Dog] @cost(complexity: 2, multipliers: ["first", "ids"])
+}
+
+type Query {
+  dogs(first: Int): [Dog] @cost(complexity: 3, multipliers: ["first"])
+  dog: Dog
+}
+"""
+
+
+async def _create_engine(schema_name, cost_analyzer=None):
+    @Resolver("Query.dogs", schema_name=schema_name)
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return [{"name": "Dog"}] * args["first"]
+
+    return await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        options=EngineOptions(cost_analyzer=cost_analyzer),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,variables,expected",
+    [
+        ("{ dog { name } }", None, QueryCost(2, 2, 2, set())),
+        (
+            "{ dogs(first: 10) { name friends(first: 2) { name } } }",
+            None,
+            QueryCost((3 + 1 + (2 + 1) * 2) * 10, 3, 4, set()),
+        ),
+        (
+            "{ dog { friends(ids: [1, 2, 3]) { name } } }",
+            None,
+            QueryCost(1 + (2 + 1) * 3, 3, 3, set()),
+        ),
+        (
+            """
+            query ($first: Int = 4) { dogs(first: $first) { ...DogFields } }
+            fragment DogFields on Dog { name ... on Dog { name } }
+            """,
+            None,
+            QueryCost((3 + 2) * 4, 2, 3, {"first"}),
+        ),
+        (
+            """
+            query ($first: Int = 4) { dogs(first: $first) { ...DogFields } }
+            fragment DogFields on Dog { name ... on Dog { name } }
+            """,
+            {"first": 100},
+            QueryCost((3 + 2) * 100, 2, 3, {"first"}),
+        ),
+        (
+            """
+            query ($first: Int) { dogs(first: $first) { ...A ...A } }
+            fragment A on Dog { name friends { ...B } }
+            fragment B on Dog { name }
+            """,
+            None,
+            QueryCost(3 + 2 * (1 + 2 + 1), 3, 7, {"first"}),
+        ),
+    ],
+)
+async def test_compute_query_cost(clean_registry, query, variables, expected):
+    engine = await _create_engine(
+        "test_compute_query_cost", cost_analyzer=QueryCostAnalyzer()
+    )
+    assert engine.compute_query_cost(query, variables=variables) == expected
+
+
+@pytest.mark.asyncio
+async def test_compute_query_cost_of_invalid_query(clean_registry):
+    engine = await _create_engine("test_compute_query_cost_of_invalid_query")
+    assert engine.compute_query_cost("{ unknown }") is None
+    assert (
+        engine.compute_query_cost(
+            "query A { dog { name } } query B { dog { name } }"
+        )
+        is None
+    )
+    assert engine.compute_query_cost(
+        "query A { dog { name } } query B { dogs(first: 2) { name } }",
+        operation_name="B",
+    ) == QueryCost(3 * 2 + 2, 2, 2, set())
+
+
+@pytest.mark.asyncio
+async def test_query_cost_limits_are_validated(clean_registry):
+    engine = await _create_engine(
+        "test_query_cost_limits_are_validated",
+        cost_analyzer=QueryCostAnalyzer(
+            max_cost=50, max_depth=2, max_fields=3
+        ),
+    )
+
+    assert await engine.execute(
+        "query Dogs { dogs(first: 10) { name friends(first: 2) { name } } }"
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Operation < Dogs > has a cost of < 100 > which exceeds the maximum cost of < 50 >.",
+                "path": None,
+                "locations": [{"line": 1, "column": 1}],
+                "extensions": {
+                    "rule": None,
+                    "spec": None,
+                    "details": None,
+                    "tag": "query-cost",
+                },
+            },
+            {
+                "message": "Operation < Dogs > has a depth of < 3 > which exceeds the maximum depth of < 2 >.",
+                "path": None,
+                "locations": [{"line": 1, "column": 1}],
+                "extensions": {
+                    "rule": None,
+                    "spec": None,
+                    "details": None,
+                    "tag": "query-cost",
+                },
+            },
+            {
+                "message": "Operation < Dogs > has a number of fields of < 4 > which exceeds the maximum number of fields of < 3 >.",
+                "path": None,
+                "locations": [{"line": 1, "column": 1}],
+                "extensions": {
+                    "rule": None,
+                    "spec": None,
+                    "details": None,
+                    "tag": "query-cost",
+                },
+            },
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_query_cost_limits_are_validated_with_variables(clean_registry):
+    engine = await _create_engine(
+        "test_query_cost_limits_are_validated_with_variables",
+        cost_analyzer=QueryCostAnalyzer(max_cost=20),
+    )
+    query = "query ($first: Int!) { dogs(first: $first) { name } }"
+
+    assert await engine.execute(query, variables={"first": 2}) == {
+        "data": {"dogs": [{"name": "Dog"}, {"name": "Dog"}]}
+    }
+    assert await engine.execute(query, variables={"first": 6}) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Anonymous operation has a cost of < 24 > which exceeds the maximum cost of < 20 >.",
+                "path": None,
+                "locations": [{"line": 1, "column": 1}],
+                "extensions": {
+                    "rule": None,
+                    "spec": None,
+                    "details": None,
+                    "tag": "query-cost",
+                },
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_cost_analyzer_must_be_a_query_cost_analyzer(clean_registry):
+    with pytest.raises(ImproperlyConfigured):
+        await _create_engine(
+            "test_cost_analyzer_must_be_a_query_cost_analyzer",
+            cost_analyzer={"max_cost": 10},
+        )
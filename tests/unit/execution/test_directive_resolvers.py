@@ -0,0 +1,46 @@
+import pytest
+
+from tartiflette import Directive, create_engine
+
+
+@pytest.mark.asyncio
+async def test_directive_resolvers_are_stored_on_document(clean_registry):
+    @Directive("upper", schema_name="test_directive_resolvers")
+    class UpperDirective:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            result = await next_resolver(parent, args, ctx, info)
+            return result.upper() if directive_args["enabled"] else result
+
+    engine = await create_engine(
+        """
+        directive @upper(enabled: Boolean!) on FIELD
+
+        type Query { a: String b: String }
+        """,
+        schema_name="test_directive_resolvers",
+    )
+
+    query = """
+    query ($enabled: Boolean!) {
+      a @upper(enabled: true)
+      b @upper(enabled: $enabled)
+    }
+    """
+    root_value = {"a": "a", "b": "b"}
+
+    # pylint: disable=protected-access
+    document, _ = engine._parse_and_validate_query(query)
+
+    assert await engine.execute(
+        query, variables={"enabled": False}, initial_value=root_value
+    ) == {"data": {"a": "A", "b": "b"}}
+    assert len(document.directive_resolvers) == 1
+    (directive_resolver,) = document.directive_resolvers.values()
+
+    assert await engine.execute(
+        query, variables={"enabled": True}, initial_value=root_value
+    ) == {"data": {"a": "A", "b": "B"}}
+    assert list(document.directive_resolvers.values()) == [directive_resolver]
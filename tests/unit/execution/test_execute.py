@@ -0,0 +1,188 @@
+from unittest.mock import patch
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+from tartiflette.resolver import factory
+
+_SDL = """
+directive @upper on FIELD | FIELD_DEFINITION
+
+enum Color { RED }
+
+type Item {
+  name: String
+  required: String!
+  count: Int
+  upperName: String @upper
+  resolved: String
+  withArgs(prefix: String): String
+  color: Color
+  item: Item
+}
+
+type Query { item: Item }
+"""
+
+
+class _Item:
+    name = "item"
+    required = None
+    count = "not an int"
+    upperName = "upper"
+    resolved = "resolved"
+    withArgs = "args"
+    color = "RED"
+
+    @property
+    def item(self):
+        return self
+
+
+async def _create_engine(schema_name):
+    @Directive("upper", schema_name=schema_name)
+    class UpperDirective:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            return (await next_resolver(parent, args, ctx, info)).upper()
+
+    @Resolver("Item.resolved", schema_name=schema_name)
+    async def resolve_item_resolved(parent, args, ctx, info):
+        return parent.resolved
+
+    return await create_engine(_SDL, schema_name=schema_name)
+
+
+@pytest.mark.asyncio
+async def test_trivial_fields_have_sync_resolvers(clean_registry):
+    engine = await _create_engine("test_trivial_fields")
+    item_fields = engine._schema.find_type(  # pylint: disable=protected-access
+        "Item"
+    ).implemented_fields
+
+    assert {
+        name
+        for name, field in item_fields.items()
+        if field.sync_resolver is not None
+    } == {"name", "required", "count"}
+
+
+@pytest.mark.asyncio
+async def test_trivial_fields_are_resolved_synchronously(clean_registry):
+    engine = await _create_engine("test_trivial_fields_execution")
+
+    with patch.object(
+        factory, "build_resolve_info", wraps=factory.build_resolve_info
+    ) as build_resolve_info_mock:
+        result = await engine.execute(
+            """
+            {
+              item {
+                name
+                upperName
+                resolved
+                withArgs(prefix: "a")
+                color
+                item { name @skip(if: false) count }
+              }
+            }
+            """,
+            initial_value={"item": _Item()},
+        )
+
+    # Only `item.name` & `item.item.count` are resolved synchronously
+    assert build_resolve_info_mock.call_count == 7
+    assert result == {
+        "data": {
+            "item": {
+                "name": "item",
+                "upperName": "UPPER",
+                "resolved": "resolved",
+                "withArgs": "args",
+                "color": "RED",
+                "item": {"name": "item", "count": None},
+            }
+        },
+        "errors": [
+            {
+                "message": "Int cannot represent non-integer value: < not an int >.",
+                "path": ["item", "item", "count"],
+                "locations": [{"line": 9, "column": 46}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_trivial_non_null_fields_bubble_up_errors(clean_registry):
+    engine = await _create_engine("test_trivial_non_null_fields")
+
+    assert await engine.execute(
+        "{ item { name required } }", initial_value={"item": _Item()}
+    ) == {
+        "data": {"item": None},
+        "errors": [
+            {
+                "message": "Cannot return null for non-nullable field Item.required.",
+                "path": ["item", "required"],
+                "locations": [{"line": 1, "column": 15}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_trivial_non_null_fields_check_coerced_values(clean_registry):
+    from tartiflette import Scalar
+
+    schema_name = "test_trivial_non_null_fields_coerced"
+
+    @Scalar("Nullish", schema_name=schema_name)
+    class NullishScalar:
+        @staticmethod
+        def coerce_output(value):
+            return None
+
+        @staticmethod
+        def coerce_input(value):
+            return value
+
+        @staticmethod
+        def parse_literal(ast):
+            return ast.value
+
+    @Resolver("Item.resolved", schema_name=schema_name)
+    async def resolve_item_resolved(parent, args, ctx, info):
+        return "resolved"
+
+    engine = await create_engine(
+        """
+        scalar Nullish
+
+        type Item {
+          trivial: Nullish!
+          resolved: Nullish!
+        }
+
+        type Query { item: Item }
+        """,
+        schema_name=schema_name,
+    )
+
+    for field_name in ("trivial", "resolved"):
+        assert await engine.execute(
+            f"{{ item {{ {field_name} }} }}",
+            initial_value={"item": {"trivial": "trivial"}},
+        ) == {
+            "data": {"item": None},
+            "errors": [
+                {
+                    "message": "Cannot return null for non-nullable field "
+                    f"Item.{field_name}.",
+                    "path": ["item", field_name],
+                    "locations": [{"line": 1, "column": 10}],
+                }
+            ],
+        }
@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.execution.loader import DataLoader, DataLoaderRegistry
+
+
+@pytest.mark.asyncio
+async def test_data_loader_batches_loads():
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(keys)
+        return [key * 2 for key in keys]
+
+    loader = DataLoader(batch_load)
+    assert await asyncio.gather(
+        loader.load(1), loader.load(2), loader.load(1), loader.load(3)
+    ) == [2, 4, 2, 6]
+    assert batches == [[1, 2, 3]]
+
+    assert await loader.load_many([2, 4]) == [4, 8]
+    assert batches == [[1, 2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_max_batch_size_and_no_cache():
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(keys)
+        return keys
+
+    loader = DataLoader(batch_load, max_batch_size=2, cache=False)
+    assert await loader.load_many([1, 2, 3, 1]) == [1, 2, 3, 1]
+    assert batches == [[1, 2], [3, 1]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_prime_and_clear():
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(keys)
+        return keys
+
+    loader = DataLoader(batch_load)
+    loader.prime("a", "primed")
+    assert await loader.load("a") == "primed"
+    assert batches == []
+
+    loader.clear("a")
+    assert await loader.load("a") == "a"
+    loader.clear_all()
+    assert await loader.load("a") == "a"
+    assert batches == [["a"], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_errors():
+    async def batch_load(keys):
+        return [ValueError(key) if key < 0 else key for key in keys]
+
+    loader = DataLoader(batch_load)
+    first, second = await asyncio.gather(
+        loader.load(1), loader.load(-1), return_exceptions=True
+    )
+    assert first == 1
+    assert isinstance(second, ValueError)
+
+    async def invalid_batch_load(keys):
+        return keys[:-1]
+
+    loader = DataLoader(invalid_batch_load)
+    with pytest.raises(Exception, match="same length"):
+        await asyncio.gather(loader.load(1), loader.load(2))
+
+    # Failed keys aren't cached
+    assert 1 not in loader._cache  # pylint: disable=protected-access
+
+
+def test_data_loader_registry():
+    async def batch_load(keys):
+        return keys
+
+    registry = DataLoaderRegistry()
+    loader = registry.get(batch_load)
+    assert registry.get(batch_load) is loader
+    assert registry.get(batch_load, key="other") is not loader
+    assert registry.get(batch_load, key="sized", max_batch_size=3) is (
+        registry.get(batch_load, key="sized")
+    )
+    assert registry.get(batch_load, key="sized").max_batch_size == 3
+
+
+_SDL = """
+type Author { name: String }
+type Book { title: String author: Author authorName: String }
+type Query { books: [Book] }
+"""
+
+_BOOKS = [
+    {"title": "A", "authorId": 1},
+    {"title": "B", "authorId": 2},
+    {"title": "C", "authorId": 1},
+]
+
+_AUTHORS = {1: {"name": "Alice"}, 2: {"name": "Bob"}}
+
+
+@pytest.mark.asyncio
+async def test_info_loaders_are_scoped_to_the_request(clean_registry):
+    batches = []
+
+    async def load_authors(author_ids):
+        batches.append(author_ids)
+        return [_AUTHORS[author_id] for author_id in author_ids]
+
+    @Resolver("Query.books", schema_name="test_info_loaders")
+    async def resolve_books(parent, args, ctx, info):
+        return _BOOKS
+
+    @Resolver("Book.author", schema_name="test_info_loaders")
+    async def resolve_book_author(parent, args, ctx, info):
+        return await info.loaders.get(load_authors).load(parent["authorId"])
+
+    engine = await create_engine(_SDL, schema_name="test_info_loaders")
+
+    expected = {
+        "data": {
+            "books": [
+                {"title": "A", "author": {"name": "Alice"}},
+                {"title": "B", "author": {"name": "Bob"}},
+                {"title": "C", "author": {"name": "Alice"}},
+            ]
+        }
+    }
+    query = "{ books { title author { name } } }"
+    assert await engine.execute(query) == expected
+    assert await engine.execute(query) == expected
+    assert batches == [[1, 2], [1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver(clean_registry):
+    batches = []
+
+    @Resolver("Query.books", schema_name="test_batch_resolver")
+    async def resolve_books(parent, args, ctx, info):
+        return _BOOKS
+
+    @Resolver("Book.authorName", schema_name="test_batch_resolver", batch=True)
+    async def resolve_book_author_names(parents, args, ctx, info):
+        batches.append([parent["title"] for parent in parents])
+        return [_AUTHORS[parent["authorId"]]["name"] for parent in parents]
+
+    engine = await create_engine(_SDL, schema_name="test_batch_resolver")
+
+    assert await engine.execute(
+        "{ books { authorName } other: books { title authorName } }"
+    ) == {
+        "data": {
+            "books": [
+                {"authorName": "Alice"},
+                {"authorName": "Bob"},
+                {"authorName": "Alice"},
+            ],
+            "other": [
+                {"title": "A", "authorName": "Alice"},
+                {"title": "B", "authorName": "Bob"},
+                {"title": "C", "authorName": "Alice"},
+            ],
+        }
+    }
+    # One batch per field node
+    assert batches == [["A", "B", "C"], ["A", "B", "C"]]
@@ -0,0 +1,198 @@
+import os
+
+import pytest
+
+from tartiflette.execution.persisted import (
+    FilePersistedQueryStore,
+    InMemoryPersistedQueryStore,
+    compute_query_id,
+)
+
+
+def _parse(query, validate=True):
+    if "error" in query and validate:
+        return None, ["error"]
+    return f"document:{query}", None
+
+
+def test_compute_query_id():
+    assert compute_query_id("{ a }") == compute_query_id(b"{ a }")
+    assert (
+        compute_query_id("{ a }")
+        == "1c7e1e347f726166b5b1c55afd61f278cc9b45e00c108ec33d540a566379811b"
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_memory_persisted_query_store():
+    store = InMemoryPersistedQueryStore()
+    store.bind(_parse)
+
+    assert await store.get("an_id") is None
+    assert await store.set("an_id", "{ a }") == ("document:{ a }", None)
+    assert await store.get("an_id") == "document:{ a }"
+
+    assert await store.set("another_id", "{ error }") == (None, ["error"])
+    assert await store.get("another_id") is None
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_file_persisted_query_store(tmp_path):
+    query_id = compute_query_id("{ a }")
+
+    store = FilePersistedQueryStore(str(tmp_path / "queries"))
+    store.bind(_parse)
+    assert await store.get(query_id) is None
+    assert await store.set(query_id, "{ a }") == ("document:{ a }", None)
+    assert os.path.isfile(str(tmp_path / "queries" / f"{query_id}.graphql"))
+
+    store = FilePersistedQueryStore(str(tmp_path / "queries"))
+    store.bind(_parse)
+    assert await store.get(query_id) == "document:{ a }"
+    assert await store.get("../../etc/passwd") is None
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_store_prewarm(tmp_path):
+    (tmp_path / "a.graphql").write_text("{ a }")
+    (tmp_path / "b.graphql").write_text("{ b }")
+    (tmp_path / "readme.md").write_text("{ c }")
+
+    store = InMemoryPersistedQueryStore()
+    store.bind(_parse)
+    await store.prewarm(str(tmp_path))
+
+    assert len(store) == 2
+    assert await store.get(compute_query_id("{ a }")) == "document:{ a }"
+    assert await store.get(compute_query_id("{ b }")) == "document:{ b }"
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_store_prewarm_trusted(tmp_path):
+    (tmp_path / "a.graphql").write_text("{ a }")
+    (tmp_path / "error.graphql").write_text("{ error }")
+
+    store = InMemoryPersistedQueryStore()
+    store.bind(_parse)
+    await store.prewarm(str(tmp_path))
+    assert len(store) == 1
+
+    await store.prewarm(str(tmp_path), validate=False)
+    assert len(store) == 2
+    assert await store.get(compute_query_id("{ error }")) == (
+        "document:{ error }"
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_persisted_query_store_prewarm_trusted(tmp_path):
+    query_id = compute_query_id("{ a }")
+    (tmp_path / "queries").mkdir()
+    (tmp_path / "queries" / f"{query_id}.graphql").write_text("{ a }")
+    (tmp_path / "prewarm").mkdir()
+    (tmp_path / "prewarm" / "a.graphql").write_text("{ a }")
+
+    validations = []
+
+    def parse(query, validate=True):
+        validations.append(validate)
+        return _parse(query, validate)
+
+    # The queries of the directory aren't read & validated while pre-warming
+    store = FilePersistedQueryStore(str(tmp_path / "queries"))
+    store.bind(parse)
+    await store.prewarm(str(tmp_path / "prewarm"), validate=False)
+    assert validations == [False]
+    assert await store.get(query_id) == "document:{ a }"
+    assert validations == [False]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_persisted_query_store_max_size():
+    store = InMemoryPersistedQueryStore(max_size=2)
+    store.bind(_parse)
+
+    await store.set("a", "{ a }")
+    await store.set("b", "{ b }")
+    assert await store.get("a") == "document:{ a }"
+    await store.set("c", "{ c }")
+
+    assert len(store) == 2
+    assert await store.get("a") == "document:{ a }"
+    assert await store.get("b") is None
+    assert await store.get("c") == "document:{ c }"
+
+
+@pytest.mark.asyncio
+async def test_file_persisted_query_store_max_files(tmp_path):
+    directory = tmp_path / "queries"
+    directory.mkdir()
+    (directory / f"{compute_query_id('{ a }')}.graphql").write_text("{ a }")
+
+    store = FilePersistedQueryStore(str(directory), max_size=1, max_files=2)
+    store.bind(_parse)
+    for query in ("{ b }", "{ c }"):
+        assert await store.set(compute_query_id(query), query) == (
+            f"document:{query}",
+            None,
+        )
+
+    assert len(store) == 1
+    assert sorted(os.listdir(str(directory))) == sorted(
+        f"{compute_query_id(query)}.graphql" for query in ("{ a }", "{ b }")
+    )
+    assert await store.get(compute_query_id("{ a }")) == "document:{ a }"
+    assert await store.get(compute_query_id("{ b }")) == "document:{ b }"
+    assert await store.get(compute_query_id("{ c }")) is None
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_store_prewarm_invalid(tmp_path, caplog):
+    (tmp_path / "a.graphql").write_text("{ a }")
+    (tmp_path / "error.graphql").write_text("{ error }")
+
+    store = InMemoryPersistedQueryStore()
+    store.bind(_parse)
+    await store.prewarm(str(tmp_path))
+
+    assert len(store) == 1
+    assert [record.getMessage() for record in caplog.records] == [
+        "Persisted query < error.graphql > is invalid and hasn't been "
+        "persisted: error"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_persisted_query_store_bind_keeps_counters():
+    from tartiflette.language.ast import DocumentNode
+
+    class _Schema:
+        fingerprint = "a_fingerprint"
+
+    documents = {
+        "{ a }": DocumentNode([], schema_fingerprint="a_fingerprint"),
+        "{ b }": DocumentNode([], schema_fingerprint="b_fingerprint"),
+    }
+
+    def parse(query, validate=True):
+        return documents[query], None
+
+    store = InMemoryPersistedQueryStore()
+    store.bind(parse)
+    await store.set("a", "{ a }")
+    await store.set("b", "{ b }")
+    assert await store.get("a") is documents["{ a }"]
+    assert await store.get("c") is None
+
+    store.bind(parse, _Schema())
+    assert len(store) == 1
+    assert await store.get("a") is documents["{ a }"]
+    assert await store.get("b") is None
+    assert store._documents.stats == {
+        "hits": 2,
+        "misses": 2,
+        "evictions": 0,
+        "size": 1,
+        "query_length": 1,
+    }
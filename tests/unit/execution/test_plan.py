@@ -0,0 +1,139 @@
+import pytest
+
+from tartiflette import create_engine
+
+
+@pytest.mark.asyncio
+async def test_execution_plans_are_stored_on_document(clean_registry):
+    engine = await create_engine(
+        """
+        type Item { id: Int name: String }
+        type Query { itemList: [Item] item: Item }
+        """
+    )
+
+    query = """
+    query ($skip: Boolean!) {
+      itemList { ...ItemFields }
+      item { id name @skip(if: $skip) }
+    }
+
+    fragment ItemFields on Item { id name }
+    """
+    root_value = {
+        "itemList": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+        "item": {"id": 3, "name": "c"},
+    }
+
+    # pylint: disable=protected-access
+    document, _ = engine._parse_and_validate_query(query)
+    assert document.execution_plans == {}
+
+    for skip in (True, False):
+        assert await engine.execute(
+            query, variables={"skip": skip}, initial_value=root_value
+        ) == {
+            "data": {
+                "itemList": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+                "item": {"id": 3} if skip else {"id": 3, "name": "c"},
+            }
+        }
+
+    static_plans = [
+        execution_plan
+        for execution_plan in document.execution_plans.values()
+        if isinstance(execution_plan, list)
+    ]
+    assert len(document.execution_plans) == 3
+    assert sorted(
+        [entry_key for entry_key, _, _ in execution_plan]
+        for execution_plan in static_plans
+    ) == [["id", "name"], ["itemList", "item"]]
+
+
+@pytest.mark.asyncio
+async def test_dynamic_execution_plans_are_computed_once_per_request(
+    clean_registry,
+):
+    from unittest.mock import patch
+
+    from tartiflette.execution import plan
+
+    engine = await create_engine(
+        """
+        type Item { id: Int name: String }
+        type Query { itemList: [Item] }
+        """
+    )
+
+    query = "query ($skip: Boolean!) { itemList { id name @skip(if: $skip) } }"
+    root_value = {"itemList": [{"id": index} for index in range(100)]}
+
+    with patch.object(
+        plan, "build_execution_plan", wraps=plan.build_execution_plan
+    ) as build_execution_plan_mock:
+        result = await engine.execute(
+            query, variables={"skip": True}, initial_value=root_value
+        )
+        assert result == {"data": {"itemList": root_value["itemList"]}}
+        assert build_execution_plan_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execution_plans_fold_literal_inclusion_directives(
+    clean_registry,
+):
+    engine = await create_engine(
+        """
+        type Item { id: Int name: String }
+        type Query { item: Item }
+        """
+    )
+
+    query = "{ item { id @include(if: true) name @skip(if: true) } }"
+
+    # pylint: disable=protected-access
+    document, _ = engine._parse_and_validate_query(query)
+    assert await engine.execute(
+        query, initial_value={"item": {"id": 1, "name": "a"}}
+    ) == {"data": {"item": {"id": 1}}}
+
+    assert sorted(
+        [entry_key for entry_key, _, _ in execution_plan]
+        for execution_plan in document.execution_plans.values()
+    ) == [["id"], ["item"]]
+
+
+@pytest.mark.asyncio
+async def test_collection_hooks_are_called_for_each_object(clean_registry):
+    from tartiflette import Directive
+
+    calls = []
+
+    @Directive("track", schema_name="test_collection_hooks_each_object")
+    class TrackDirective:
+        @staticmethod
+        async def on_field_collection(
+            directive_args, next_directive, field_node, ctx
+        ):
+            calls.append(field_node.name.value)
+            return await next_directive(field_node, ctx)
+
+    engine = await create_engine(
+        """
+        directive @track on FIELD
+
+        type Item { id: Int name: String }
+        type Query { itemList: [Item] }
+        """,
+        schema_name="test_collection_hooks_each_object",
+    )
+
+    query = "query ($skip: Boolean!) { itemList { id @track name @skip(if: $skip) } }"
+    root_value = {"itemList": [{"id": index} for index in range(3)]}
+
+    for _ in range(2):
+        assert await engine.execute(
+            query, variables={"skip": True}, initial_value=root_value
+        ) == {"data": {"itemList": root_value["itemList"]}}
+    assert calls == ["id"] * 6
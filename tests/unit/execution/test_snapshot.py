@@ -0,0 +1,64 @@
+import pytest
+
+from tartiflette import EngineOptions, create_engine
+from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.execution.snapshot import (
+    dump_document_snapshot,
+    load_document_snapshot,
+)
+
+
+@pytest.mark.asyncio
+async def test_document_snapshot_dump_load(clean_registry, tmp_path):
+    engine = await create_engine(
+        "type Query { a(b: Int): String }",
+        schema_name="test_document_snapshot_dump_load",
+    )
+    query = "query ($b: Int) { a(b: $b) ... on Query { c: a } }"
+    document, _ = parse_and_validate_query(query, engine._schema)
+    path = str(tmp_path / "snapshots" / "documents.pickle")
+
+    dump_document_snapshot(path, [(query, document)], "fingerprint")
+    assert load_document_snapshot(path, "another_fingerprint") is None
+    assert load_document_snapshot(str(tmp_path / "missing"), "fp") is None
+
+    ((loaded_query, loaded_document),) = load_document_snapshot(
+        path, "fingerprint"
+    )
+    assert loaded_query == query
+    assert loaded_document == document
+    assert loaded_document.schema_fingerprint == document.schema_fingerprint
+    assert loaded_document.validators is None
+    assert loaded_document.execution_plans == {}
+
+
+@pytest.mark.asyncio
+async def test_engine_document_snapshot(clean_registry, tmp_path):
+    path = str(tmp_path / "documents.pickle")
+    sdl = "type Query { a: String }"
+
+    engine = await create_engine(
+        sdl,
+        schema_name="test_engine_document_snapshot_1",
+        options=EngineOptions(document_snapshot=path),
+    )
+    assert len(engine.query_cache) == 0
+    assert await engine.execute("{ a }") == {"data": {"a": None}}
+    assert await engine.execute("{ b }") != {"data": {"b": None}}
+    assert await engine.dump_document_snapshot() == 1
+
+    engine = await create_engine(
+        sdl,
+        schema_name="test_engine_document_snapshot_2",
+        options=EngineOptions(document_snapshot=path),
+    )
+    assert len(engine.query_cache) == 1
+    assert await engine.execute("{ a }") == {"data": {"a": None}}
+    assert engine.query_cache.stats["hits"] == 1
+
+    engine = await create_engine(
+        "type Query { a: Int }",
+        schema_name="test_engine_document_snapshot_3",
+        options=EngineOptions(document_snapshot=path),
+    )
+    assert len(engine.query_cache) == 0
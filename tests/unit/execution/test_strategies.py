@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+
+from tartiflette import EngineOptions, Resolver, create_engine
+from tartiflette.execution.strategies import eager_strategy, gather_strategy
+from tartiflette.types.exceptions.tartiflette import NonCoroutine
+
+
+async def _value(value):
+    return value
+
+
+async def _raise(exception):
+    raise exception
+
+
+async def _suspend(value):
+    await asyncio.sleep(0)
+    future = asyncio.get_event_loop().create_future()
+    asyncio.get_event_loop().call_soon(future.set_result, value)
+    return await future
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", [gather_strategy, eager_strategy])
+async def test_strategies_results(strategy):
+    error = ValueError("error")
+    assert await strategy(
+        [_value(1), _suspend(2), _raise(error), _value(3), _suspend(4)]
+    ) == [1, 2, error, 3, 4]
+    assert await strategy([]) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", [gather_strategy, eager_strategy])
+async def test_strategies_shared_future(strategy):
+    future = asyncio.get_event_loop().create_future()
+
+    async def wait_future():
+        return await future
+
+    asyncio.get_event_loop().call_soon(future.set_result, 1)
+    assert await strategy([wait_future(), wait_future()]) == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_eager_strategy_only_schedules_suspended_coroutines():
+    tasks = set()
+    loop = asyncio.get_event_loop()
+    task_factory = loop.get_task_factory()
+
+    def factory(loop, coro):
+        task = asyncio.Task(coro, loop=loop)
+        tasks.add(task)
+        return task
+
+    loop.set_task_factory(factory)
+    try:
+        results = await eager_strategy([_value(1), _suspend(2), _value(3)])
+    finally:
+        loop.set_task_factory(task_factory)
+
+    assert results == [1, 2, 3]
+    assert len(tasks) == 1
+
+
+@pytest.mark.asyncio
+async def test_eager_strategy_cancellation():
+    cancelled = []
+
+    async def wait_forever():
+        try:
+            await asyncio.get_event_loop().create_future()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    task = asyncio.ensure_future(eager_strategy([wait_forever()]))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled == [True]
+
+
+class _Interruption(BaseException):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_eager_strategy_base_exception():
+    cancelled = []
+
+    async def wait_forever():
+        try:
+            await asyncio.get_event_loop().create_future()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    remaining_coroutine = _value(3)
+    with pytest.raises(_Interruption):
+        await eager_strategy(
+            [wait_forever(), _raise(_Interruption()), remaining_coroutine]
+        )
+    assert cancelled == [True]
+    assert remaining_coroutine.cr_frame is None
+
+
+_SDL = """
+type Item { id: Int slowId: Int error: Int! }
+type Query { items: [Item] }
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", [gather_strategy, eager_strategy])
+async def test_engine_execution_strategy(clean_registry, strategy):
+    schema_name = f"test_engine_execution_strategy_{strategy.__name__}"
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_items(parent, args, ctx, info):
+        return [{"id": 1}, {"id": 2}]
+
+    @Resolver("Item.slowId", schema_name=schema_name)
+    async def resolve_item_slow_id(parent, args, ctx, info):
+        return await _suspend(parent["id"])
+
+    @Resolver("Item.error", schema_name=schema_name)
+    async def resolve_item_error(parent, args, ctx, info):
+        if parent["id"] == 2:
+            raise ValueError("error")
+        return parent["id"]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        options=EngineOptions(execution_strategy=strategy),
+    )
+
+    assert await engine.execute("{ items { id slowId error } }") == {
+        "data": {"items": [{"id": 1, "slowId": 1, "error": 1}, None]},
+        "errors": [
+            {
+                "message": "error",
+                "path": ["items", 1, "error"],
+                "locations": [{"line": 1, "column": 21}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_engine_execution_strategy_must_be_a_coroutine(clean_registry):
+    with pytest.raises(NonCoroutine):
+        await create_engine(
+            "type Query { a: Int }",
+            schema_name="test_engine_execution_strategy_must_be_a_coroutine",
+            options=EngineOptions(
+                execution_strategy=lambda coroutines: coroutines
+            ),
+        )
@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+
+from tartiflette.coercers.common import Path
+from tartiflette.execution.types import build_resolve_info
+
+
+def test_build_resolve_info_reads_shared_information_on_demand():
+    execution_context = Mock()
+    field_definition = Mock()
+    field_nodes = [Mock()]
+    parent_type = Mock()
+    parent_path = Path(None, "parent")
+
+    info = build_resolve_info(
+        execution_context,
+        field_definition,
+        field_nodes,
+        parent_type,
+        parent_path,
+        "field",
+        is_introspection_context=True,
+    )
+
+    assert not hasattr(info, "__dict__")
+    assert info.field_nodes is field_nodes
+    assert info.parent_type is parent_type
+    assert info.path.prev is parent_path
+    assert info.path.key == "field"
+    assert info.path is info.path
+    assert info.is_introspection is True
+    assert info.field_name is field_definition.name
+    assert info.return_type is field_definition.graphql_type
+    assert info.schema is execution_context.schema
+    assert info.fragments is execution_context.fragments
+    assert info.root_value is execution_context.root_value
+    assert info.operation is execution_context.operation
+    assert info.variable_values is execution_context.variable_values
+    assert info.loaders is execution_context.loaders
+
+
+def test_path_as_list_is_computed_once():
+    parent_path = Path(Path(None, "items"), 0)
+    first_path = Path(parent_path, "first")
+    second_path = Path(parent_path, "second")
+
+    assert first_path.as_list() == ["items", 0, "first"]
+    assert second_path.as_list() == ["items", 0, "second"]
+    assert parent_path._as_list == [
+        "items",
+        0,
+    ]  # pylint: disable=protected-access
+
+    # Returned lists can be mutated without altering the computed ones
+    first_path.as_list().append("other")
+    assert first_path.as_list() == ["items", 0, "first"]
+
+
+def test_build_resolve_info_allocates_path_once_read():
+    info = build_resolve_info(
+        Mock(), Mock(), [Mock()], Mock(), Path(None, "parent"), "field"
+    )
+
+    assert info._path is None  # pylint: disable=protected-access
+    assert info.path.as_list() == ["parent", "field"]
+    assert info._path is info.path  # pylint: disable=protected-access
@@ -43,7 +43,11 @@ from tartiflette.language.ast import (
     UnionTypeDefinitionNode,
     UnionTypeExtensionNode,
 )
-from tartiflette.language.parsers.lark import parse_to_document
+from tartiflette.language.parsers.lark import (
+    get_lark_parser,
+    parse_to_document,
+    parser as parser_module,
+)
 
 _BASE_DIR = os.path.dirname(__file__)
 
@@ -7793,9 +7797,10 @@ def test_parse_to_document_mock():
     sdl = "type MyType { a: String }"
 
     with patch(
-        "tartiflette.language.parsers.lark.parser._LARK_PARSER.parse",
-        return_value=parsed_mock,
-    ) as lark_parser_mock:
+        "tartiflette.language.parsers.lark.parser.get_lark_parser"
+    ) as get_lark_parser_mock:
+        lark_parser_mock = get_lark_parser_mock.return_value.parse
+        lark_parser_mock.return_value = parsed_mock
         with patch(
             "tartiflette.language.parsers.lark.parser.NodeTransformer",
             return_value=node_transformed,
@@ -7807,3 +7812,22 @@ def test_parse_to_document_mock():
                 node_transformer_mock.assert_called_once()
                 token_transformer_mock.assert_called_once()
                 lark_parser_mock.assert_called_once_with(sdl)
+                get_lark_parser_mock.assert_called_once_with(None)
+
+
+def test_get_lark_parser_cache_directory(monkeypatch, tmp_path):
+    cache_directory = str(tmp_path / "parsers")
+    sdl = "type MyType { a(b: Int = 2): [String!] @c }"
+
+    monkeypatch.setattr(parser_module, "_LARK_PARSER", None)
+    built_parser = get_lark_parser(cache_directory)
+    assert get_lark_parser() is built_parser
+    assert len(os.listdir(cache_directory)) == 1
+
+    monkeypatch.setattr(parser_module, "_LARK_PARSER", None)
+    with patch.object(parser_module.Lark, "open") as lark_open_mock:
+        cached_parser = get_lark_parser(cache_directory)
+        lark_open_mock.assert_not_called()
+
+    assert cached_parser is not built_parser
+    assert cached_parser.parse(sdl) == built_parser.parse(sdl)
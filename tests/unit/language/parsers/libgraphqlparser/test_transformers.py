@@ -1,5 +1,3 @@
-from unittest.mock import Mock
-
 import pytest
 
 from tartiflette.language.ast import (
@@ -76,22 +74,6 @@ _EXPECTED_DEFAULT_LOCATION = Location(
 )
 
 
-@pytest.fixture(scope="module", name="validators", params=[True, False])
-def validators_fixture(request):
-    validators = Mock()
-    validators.validate = Mock(return_value=None)
-    validators.ctx = {
-        "parent_type_name": "Query",
-        "in_operation": request.param,
-        "per_fragment": {"Robert": {}},
-        "per_operation": {"Query": {}},
-        "current_fragment_name": "Robert",
-        "current_operation_name": "Query",
-    }
-
-    return validators
-
-
 def test_parse_location():
     assert (
         _parse_location(_DEFAULT_JSON_AST_LOCATION)
@@ -174,8 +156,8 @@ def test_parse_named_type(json_ast, expected):
         ),
     ],
 )
-def test_parse_variable(json_ast, expected, validators):
-    assert _parse_variable(json_ast, validators) == expected
+def test_parse_variable(json_ast, expected):
+    assert _parse_variable(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -402,8 +384,8 @@ def test_parse_int_value(json_ast, expected):
         ),
     ],
 )
-def test_parse_values(json_ast, expected, validators):
-    assert _parse_values(json_ast, validators, None) == expected
+def test_parse_values(json_ast, expected):
+    assert _parse_values(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -540,8 +522,8 @@ def test_parse_values(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_list_value(json_ast, expected, validators):
-    assert _parse_list_value(json_ast, validators, None) == expected
+def test_parse_list_value(json_ast, expected):
+    assert _parse_list_value(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -602,8 +584,8 @@ def test_parse_null_value(json_ast, expected):
         ),
     ],
 )
-def test_parse_object_field(json_ast, expected, validators):
-    assert _parse_object_field(json_ast, validators, None) == expected
+def test_parse_object_field(json_ast, expected):
+    assert _parse_object_field(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -854,8 +836,8 @@ def test_parse_object_field(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_object_fields(json_ast, expected, validators):
-    assert _parse_object_fields(json_ast, validators, None) == expected
+def test_parse_object_fields(json_ast, expected):
+    assert _parse_object_fields(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1127,8 +1109,8 @@ def test_parse_object_fields(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_object_value(json_ast, expected, validators):
-    assert _parse_object_value(json_ast, validators, None) == expected
+def test_parse_object_value(json_ast, expected):
+    assert _parse_object_value(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1278,8 +1260,8 @@ def test_parse_string_value(json_ast, expected):
         ),
     ],
 )
-def test_parse_value(json_ast, expected, validators):
-    assert _parse_value(json_ast, validators, None) == expected
+def test_parse_value(json_ast, expected):
+    assert _parse_value(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1310,8 +1292,8 @@ def test_parse_value(json_ast, expected, validators):
         )
     ],
 )
-def test_parse_argument(json_ast, expected, validators):
-    assert _parse_argument(json_ast, validators, None) == expected
+def test_parse_argument(json_ast, expected):
+    assert _parse_argument(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1366,8 +1348,8 @@ def test_parse_argument(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_arguments(json_ast, expected, validators):
-    assert _parse_arguments(json_ast, validators, None) == expected
+def test_parse_arguments(json_ast, expected):
+    assert _parse_arguments(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1415,8 +1397,8 @@ def test_parse_arguments(json_ast, expected, validators):
         )
     ],
 )
-def test_parse_directive(json_ast, expected, validators):
-    assert _parse_directive(json_ast, validators, None) == expected
+def test_parse_directive(json_ast, expected):
+    assert _parse_directive(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1487,8 +1469,8 @@ def test_parse_directive(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_directives(json_ast, expected, validators):
-    assert _parse_directives(json_ast, validators, None) == expected
+def test_parse_directives(json_ast, expected):
+    assert _parse_directives(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1652,8 +1634,8 @@ def test_parse_directives(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_field(json_ast, expected, validators):
-    assert _parse_field(json_ast, validators, None) == expected
+def test_parse_field(json_ast, expected):
+    assert _parse_field(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1754,8 +1736,8 @@ def test_parse_field(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_fragment_spread(json_ast, expected, validators):
-    assert _parse_fragment_spread(json_ast, validators, None) == expected
+def test_parse_fragment_spread(json_ast, expected):
+    assert _parse_fragment_spread(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -1890,8 +1872,8 @@ def test_parse_fragment_spread(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_inline_fragment(json_ast, expected, validators):
-    assert _parse_inline_fragment(json_ast, validators, None) == expected
+def test_parse_inline_fragment(json_ast, expected):
+    assert _parse_inline_fragment(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -2223,8 +2205,8 @@ def test_parse_inline_fragment(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_selection(json_ast, expected, validators):
-    assert _parse_selection(json_ast, validators, None) == expected
+def test_parse_selection(json_ast, expected):
+    assert _parse_selection(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -2558,8 +2540,8 @@ def test_parse_selection(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_selections(json_ast, expected, validators):
-    assert _parse_selections(json_ast, validators, None) == expected
+def test_parse_selections(json_ast, expected):
+    assert _parse_selections(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -2902,8 +2884,8 @@ def test_parse_selections(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_selection_set(json_ast, expected, validators):
-    assert _parse_selection_set(json_ast, validators, None) == expected
+def test_parse_selection_set(json_ast, expected):
+    assert _parse_selection_set(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -3057,8 +3039,8 @@ def test_parse_selection_set(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_fragment_definition(json_ast, expected, validators):
-    assert _parse_fragment_definition(json_ast, validators, None) == expected
+def test_parse_fragment_definition(json_ast, expected):
+    assert _parse_fragment_definition(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -3170,8 +3152,8 @@ def test_parse_type(json_ast, expected):
         )
     ],
 )
-def test_parse_variable_definition(json_ast, expected, validators):
-    assert _parse_variable_definition(json_ast, validators, None) == expected
+def test_parse_variable_definition(json_ast, expected):
+    assert _parse_variable_definition(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -3230,8 +3212,8 @@ def test_parse_variable_definition(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_variable_definitions(json_ast, expected, validators):
-    assert _parse_variable_definitions(json_ast, validators, None) == expected
+def test_parse_variable_definitions(json_ast, expected):
+    assert _parse_variable_definitions(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -3407,8 +3389,8 @@ def test_parse_variable_definitions(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_operation_definition(json_ast, expected, validators):
-    assert _parse_operation_definition(json_ast, validators, None) == expected
+def test_parse_operation_definition(json_ast, expected):
+    assert _parse_operation_definition(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -3682,8 +3664,8 @@ def test_parse_operation_definition(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_definition(json_ast, expected, validators):
-    assert _parse_definition(json_ast, validators, None) == expected
+def test_parse_definition(json_ast, expected):
+    assert _parse_definition(json_ast) == expected
 
 
 @pytest.mark.parametrize(
@@ -3962,8 +3944,8 @@ def test_parse_definition(json_ast, expected, validators):
         ),
     ],
 )
-def test_parse_definitions(json_ast, expected, validators):
-    assert _parse_definitions(json_ast, validators, None) == expected
+def test_parse_definitions(json_ast, expected):
+    assert _parse_definitions(json_ast) == expected
 
 
 @pytest.mark.skip(
@@ -4262,5 +4244,5 @@ def test_parse_definitions(json_ast, expected, validators):
         ),
     ],
 )
-def test_document_from_ast_json(json_ast, expected, validators):
-    assert document_from_ast_json(json_ast, validators, None) == expected
+def test_document_from_ast_json(json_ast, expected):
+    assert document_from_ast_json(json_ast, "", None) == expected
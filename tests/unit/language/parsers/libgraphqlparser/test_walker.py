@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from tartiflette.language.ast import Location
+from tartiflette.language.parsers.libgraphqlparser.parser import (
+    _parse_to_ast,
+    _parse_to_json_ast,
+)
+
+
+def _json_locations(ast):
+    if isinstance(ast, list):
+        return [_json_locations(item) for item in ast]
+
+    if isinstance(ast, Location):
+        return {
+            "start": {"line": ast.line, "column": ast.column},
+            "end": {"line": ast.line_end, "column": ast.column_end},
+        }
+
+    if isinstance(ast, dict):
+        return {key: _json_locations(value) for key, value in ast.items()}
+
+    return ast
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ a { a1 a2 } }",
+        b"{ a { a1 a2 } }",
+        """
+        query Dog($id: Int = 42, $names: [String!]!) @aDir {
+          alias: dog(id: $id, names: $names) @skip(if: false) {
+            name
+            ... on Dog @include(if: true) { barkVolume }
+            ... @include(if: true) { nickname }
+            ...DogFragment @skip(if: $skip)
+          }
+        }
+
+        fragment DogFragment on Dog @aDir(arg: "value") {
+          owner(
+            int: 1
+            float: 1.5
+            string: "a\\"string\\" with é"
+            block: \"\"\"a block string\"\"\"
+            boolean: true
+            falsy: false
+            null: null
+            enum: AN_ENUM
+            list: [1, [2, 3], []]
+            object: {key: {nested: $var}, empty: {}}
+          )
+        }
+        """,
+        "mutation { a } subscription B { b }",
+    ],
+)
+def test_parse_to_ast(query):
+    assert _json_locations(_parse_to_ast(query)) == json.loads(
+        _parse_to_json_ast(query)
+    )
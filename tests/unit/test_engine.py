@@ -1,8 +1,9 @@
 import asyncio
+import sys
 
 import pytest
 
-from tartiflette import create_engine
+from tartiflette import EngineOptions, create_engine
 
 
 @pytest.mark.asyncio
@@ -31,6 +32,470 @@ async def test_engine_execute(clean_registry):
     assert result == {"data": {"a": None}}
 
 
+@pytest.mark.asyncio
+async def test_engine_query_cache(clean_registry):
+    from tartiflette.execution.cache import LFUDocumentCache
+
+    e = await create_engine(
+        "type Query { a:String }",
+        options=EngineOptions(query_cache=LFUDocumentCache(max_size=1)),
+    )
+    assert isinstance(e.query_cache, LFUDocumentCache)
+
+    for _ in range(2):
+        assert await e.execute("{ a }") == {"data": {"a": None}}
+    result = await e.execute("{ b }")
+    assert result["data"] is None
+    assert len(result["errors"]) == 1
+
+    assert e.query_cache.stats == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+        "size": 1,
+        "query_length": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_engine_query_cache_improperly_configured(clean_registry):
+    from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+    with pytest.raises(ImproperlyConfigured):
+        await create_engine(
+            "type Query { a:String }", options=EngineOptions(query_cache={})
+        )
+
+
+@pytest.mark.asyncio
+async def test_engine_options(clean_registry):
+    from tartiflette.execution.cache import LRUDocumentCache
+    from tartiflette.execution.strategies import gather_strategy
+
+    options = EngineOptions(lazy_builtins=True)
+    e = await create_engine(
+        "type Query { a:String }",
+        schema_name="test_engine_options_1",
+        options=options,
+    )
+    ee = await create_engine(
+        "type Query { a:String }",
+        schema_name="test_engine_options_2",
+        options=options,
+    )
+
+    # The default query caches are owned by each engine
+    assert options.query_cache is None
+    assert isinstance(e.query_cache, LRUDocumentCache)
+    assert e.query_cache is not ee.query_cache
+    assert e.options.lazy_builtins
+    assert e.options.execution_strategy is gather_strategy
+
+
+@pytest.mark.asyncio
+async def test_engine_options_improperly_configured(clean_registry):
+    from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+    with pytest.raises(
+        ImproperlyConfigured,
+        match=r"Given < options > is not an EngineOptions instance\.",
+    ):
+        await create_engine(
+            "type Query { a:String }", options={"lazy_builtins": True}
+        )
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_persisted(clean_registry, tmp_path):
+    from tartiflette.execution.persisted import compute_query_id
+
+    (tmp_path / "a.graphql").write_text("query aquery { a }")
+
+    e = await create_engine(
+        "type Query { a:String b:String }",
+        options=EngineOptions(persisted_queries_directory=str(tmp_path)),
+    )
+    assert len(e.persisted_query_store) == 1
+
+    assert await e.execute_persisted(
+        compute_query_id("query aquery { a }"), operation_name="aquery"
+    ) == {"data": {"a": None}}
+
+    query_id = compute_query_id("{ b }")
+    assert await e.execute_persisted(query_id) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotFound",
+                "path": None,
+                "locations": [],
+            }
+        ],
+    }
+    assert await e.execute_persisted(query_id, query="{ a }") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Provided < query_id > doesn't match the query.",
+                "path": None,
+                "locations": [],
+            }
+        ],
+    }
+    assert await e.execute_persisted(query_id, query="{ b }") == {
+        "data": {"b": None}
+    }
+    assert await e.execute_persisted(query_id) == {"data": {"b": None}}
+    assert len(e.persisted_query_store) == 2
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_persisted_allow_list_only(
+    clean_registry, tmp_path
+):
+    from tartiflette.execution.persisted import (
+        InMemoryPersistedQueryStore,
+        compute_query_id,
+    )
+
+    (tmp_path / "a.graphql").write_text("{ a }")
+
+    e = await create_engine(
+        "type Query { a:String b:String }",
+        options=EngineOptions(
+            persisted_query_store=InMemoryPersistedQueryStore(
+                allow_list_only=True
+            ),
+            persisted_queries_directory=str(tmp_path),
+        ),
+    )
+    assert await e.execute_persisted(compute_query_id("{ a }")) == {
+        "data": {"a": None}
+    }
+    assert await e.execute_persisted(
+        compute_query_id("{ b }"), query="{ b }"
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotFound",
+                "path": None,
+                "locations": [],
+            }
+        ],
+    }
+    assert len(e.persisted_query_store) == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_execute_persisted_other_schema(clean_registry):
+    from tartiflette.execution.collect import parse_and_validate_query
+    from tartiflette.execution.persisted import compute_query_id
+
+    other_engine = await create_engine(
+        "type Query { a:String b:String }",
+        schema_name="test_engine_execute_persisted_other_schema_1",
+    )
+    e = await create_engine(
+        "type Query { a:String }",
+        schema_name="test_engine_execute_persisted_other_schema_2",
+    )
+
+    # Documents persisted while the engine was reloaded are validated again
+    for query in ("{ a }", "{ b }"):
+        document, _ = parse_and_validate_query(query, other_engine._schema)
+        e.persisted_query_store._documents.set(
+            compute_query_id(query), document
+        )
+
+    assert await e.execute_persisted(compute_query_id("{ a }")) == {
+        "data": {"a": None}
+    }
+    result = await e.execute_persisted(compute_query_id("{ b }"))
+    assert result["data"] is None
+    assert [error["message"] for error in result["errors"]] == [
+        "Field b doesn't exist on Query"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_engine_trust_persisted_queries(clean_registry, tmp_path):
+    from tartiflette.execution.persisted import compute_query_id
+
+    (tmp_path / "a.graphql").write_text("{ a unknown }")
+
+    e = await create_engine(
+        "type Query { a:String }",
+        options=EngineOptions(persisted_queries_directory=str(tmp_path)),
+    )
+    assert len(e.persisted_query_store) == 0
+
+    e = await create_engine(
+        "type Query { a:String }",
+        schema_name="test_engine_trust_persisted_queries",
+        options=EngineOptions(
+            persisted_queries_directory=str(tmp_path),
+            trust_persisted_queries=True,
+        ),
+    )
+    assert len(e.persisted_query_store) == 1
+    assert await e.execute_persisted(compute_query_id("{ a unknown }")) == {
+        "data": {"a": None}
+    }
+
+
+@pytest.mark.asyncio
+async def test_engine_reuses_persisted_documents(clean_registry, tmp_path):
+    from tartiflette.execution.limits import QueryLimits
+    from tartiflette.execution.persisted import (
+        InMemoryPersistedQueryStore,
+        compute_query_id,
+    )
+
+    (tmp_path / "a.graphql").write_text("{ a }")
+    query_id = compute_query_id("{ a }")
+    store = InMemoryPersistedQueryStore()
+
+    e = await create_engine(
+        "type Query { a:String }",
+        schema_name="test_engine_reuses_persisted_documents_1",
+        options=EngineOptions(
+            persisted_query_store=store,
+            persisted_queries_directory=str(tmp_path),
+        ),
+    )
+    document = await store.get(query_id)
+    assert document.schema_fingerprint == e._schema.fingerprint
+    assert await e.execute_persisted(query_id) == {"data": {"a": None}}
+    assert document.execution_plans
+
+    e = await create_engine(
+        "type Query { a:String }",
+        schema_name="test_engine_reuses_persisted_documents_2",
+        options=EngineOptions(
+            persisted_query_store=store,
+            persisted_queries_directory=str(tmp_path),
+        ),
+    )
+    assert await store.get(query_id) is document
+    assert not document.execution_plans
+    assert await e.execute_persisted(query_id) == {"data": {"a": None}}
+
+    e = await create_engine(
+        "type Query { a:String }",
+        schema_name="test_engine_reuses_persisted_documents_3",
+        options=EngineOptions(
+            persisted_query_store=store,
+            persisted_queries_directory=str(tmp_path),
+            query_limits=QueryLimits(max_depth=10),
+        ),
+    )
+    assert await store.get(query_id) is not document
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_schema_cache_directory(
+    clean_registry, tmp_path, count_schema_snapshots
+):
+    from tartiflette import Resolver
+
+    sdl = "type Query { a(b: Int = 2): Int }"
+    cache_directory = str(tmp_path / "schemas")
+
+    for schema_name in (
+        "test_engine_schema_cache_directory",
+        "test_engine_schema_cache_directory_renamed",
+    ):
+        clean_registry.clean()
+
+        @Resolver("Query.a", schema_name=schema_name)
+        async def resolve_query_a(parent, args, ctx, info):
+            return args["b"] * 2
+
+        e = await create_engine(
+            sdl,
+            schema_name=schema_name,
+            options=EngineOptions(schema_cache_directory=cache_directory),
+        )
+        assert e._schema.name == schema_name
+        assert await e.execute("{ a }") == {"data": {"a": 4}}
+
+    assert count_schema_snapshots(cache_directory) == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_lazy_builtins(clean_registry):
+    e = await create_engine(
+        """
+        type Query {
+          a: Int
+          createdAt: DateTime @nonIntrospectable
+        }
+        """,
+        schema_name="test_engine_lazy_builtins",
+        options=EngineOptions(lazy_builtins=True),
+    )
+    assert e._schema.has_type("DateTime")
+    assert e._schema.has_directive("nonIntrospectable")
+    assert not e._schema.has_type("Date")
+    assert not e._schema.has_type("Time")
+    assert e._schema.has_type("String")
+    assert e._schema.has_directive("skip")
+    assert await e.execute("{ a }") == {"data": {"a": None}}
+
+    clean_registry.clean()
+
+    e = await create_engine(
+        "type Query { a: Int }", schema_name="test_engine_lazy_builtins"
+    )
+    assert e._schema.has_type("Date")
+    assert e._schema.has_directive("nonIntrospectable")
+
+
+def _write_resolvers_module(directory, module_name, body):
+    (directory / f"{module_name}.py").write_text(
+        "from tartiflette import Resolver\n\n\n"
+        f'@Resolver("Query.a", schema_name="{module_name}")\n'
+        "async def resolve_query_a(parent, args, ctx, info):\n"
+        f"    {body}\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_engine_reload(clean_registry, tmp_path, monkeypatch):
+    from tartiflette.schema.registry import SchemaRegistry
+    from tartiflette.types.exceptions.tartiflette import (
+        UnknownSchemaFieldResolver,
+    )
+
+    module_name = "test_engine_reload"
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_resolvers_module(tmp_path, module_name, 'return "v1"')
+
+    try:
+        e = await create_engine(
+            "type Query { a: String }",
+            schema_name=module_name,
+            modules=[module_name],
+        )
+        assert await e.execute("{ a }") == {"data": {"a": "v1"}}
+        ((_, (document, _)),) = e.query_cache.items()
+        fingerprint = e._schema.fingerprint
+
+        # Updated resolvers, same SDL: the cached document is reused as is
+        _write_resolvers_module(tmp_path, module_name, 'return "v22"')
+        await e.reload()
+        assert e._schema.fingerprint == fingerprint
+        assert await e.execute("{ a }") == {"data": {"a": "v22"}}
+        ((_, (reloaded_document, _)),) = e.query_cache.items()
+        assert reloaded_document is not document
+        assert reloaded_document.definitions is document.definitions
+        assert e.query_cache.misses == 1
+
+        # Updated SDL: the cached document is validated again
+        await e.reload("type Query { a: String b: Int }")
+        assert e._schema.fingerprint != fingerprint
+        assert await e.execute("{ a }") == {"data": {"a": "v22"}}
+        ((_, (reloaded_document, _)),) = e.query_cache.items()
+        assert reloaded_document.schema_fingerprint == e._schema.fingerprint
+        assert e.query_cache.misses == 1
+
+        # The engine & the registry are left untouched by a failed reload
+        schema = e._schema
+        with pytest.raises(UnknownSchemaFieldResolver):
+            await e.reload("type Query { b: Int }")
+        assert e._schema is schema
+        assert await e.execute("{ a }") == {"data": {"a": "v22"}}
+        assert SchemaRegistry.find_schema(module_name) is schema
+    finally:
+        sys.modules.pop(module_name, None)
+
+
+@pytest.mark.asyncio
+async def test_engine_reload_carries_over_objects(
+    clean_registry, tmp_path, monkeypatch
+):
+    from tartiflette import Resolver
+
+    module_name = "test_engine_reload_carries_over_objects"
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_resolvers_module(tmp_path, module_name, 'return "v1"')
+
+    @Resolver("Query.b", schema_name=module_name)
+    async def resolve_query_b(parent, args, ctx, info):
+        return "inline"
+
+    try:
+        e = await create_engine(
+            "type Query { a: String b: String }",
+            schema_name=module_name,
+            modules=[module_name],
+        )
+        assert await e.execute("{ a b }") == {
+            "data": {"a": "v1", "b": "inline"}
+        }
+
+        # The resolver declared outside of the modules is carried over
+        _write_resolvers_module(tmp_path, module_name, 'return "v2"')
+        await e.reload()
+        assert await e.execute("{ a b }") == {
+            "data": {"a": "v2", "b": "inline"}
+        }
+
+        # The resolver removed from the modules isn't
+        (tmp_path / f"{module_name}.py").write_text("")
+        await e.reload()
+        assert await e.execute("{ a b }") == {
+            "data": {"a": None, "b": "inline"}
+        }
+    finally:
+        sys.modules.pop(module_name, None)
+
+
+@pytest.mark.asyncio
+async def test_engine_reload_in_flight_execution(
+    clean_registry, tmp_path, monkeypatch
+):
+    module_name = "test_engine_reload_in_flight_execution"
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _write_resolvers_module(
+        tmp_path, module_name, 'await ctx.wait()\n    return "v1"'
+    )
+
+    try:
+        e = await create_engine(
+            "type Query { a: String }",
+            schema_name=module_name,
+            modules=[module_name],
+        )
+        event = asyncio.Event()
+        in_flight = asyncio.ensure_future(e.execute("{ a }", context=event))
+        while not e.query_cache.items():
+            await asyncio.sleep(0)
+
+        _write_resolvers_module(tmp_path, module_name, 'return "v2"')
+        await e.reload()
+        assert await e.execute("{ a }") == {"data": {"a": "v2"}}
+
+        event.set()
+        assert await in_flight == {"data": {"a": "v1"}}
+    finally:
+        sys.modules.pop(module_name, None)
+
+
+@pytest.mark.asyncio
+async def test_engine_reload_uncooked(clean_registry):
+    from tartiflette import Engine
+    from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+    with pytest.raises(
+        ImproperlyConfigured,
+        match=r"Can't reload an engine which hasn't been cooked\.",
+    ):
+        await Engine("type Query { a: String }").reload()
+
+
 @pytest.mark.skip(reason="Waiting for the validation part to be merged.")
 @pytest.mark.asyncio
 async def test_engine_execute_parse_error(clean_registry):
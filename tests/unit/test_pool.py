@@ -0,0 +1,263 @@
+import pytest
+
+from tartiflette import Engine, EnginePool, Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_BASE_SDL = """
+interface Node {
+  id: ID!
+}
+
+type User implements Node {
+  id: ID!
+  name: String
+}
+
+type Post implements Node {
+  id: ID!
+  title: String
+  author: User
+}
+
+type Query {
+  user(id: ID!): User
+  posts: [Post]
+}
+"""
+
+
+async def _create_pool():
+    @Resolver("Query.user", schema_name="test_pool_base")
+    async def resolve_query_user(parent, args, ctx, info):
+        return {"id": args["id"], "name": "Base"}
+
+    @Resolver("Query.posts", schema_name="test_pool_base")
+    async def resolve_query_posts(parent, args, ctx, info):
+        return [{"id": "1", "title": "Post", "author": {"name": "Author"}}]
+
+    return EnginePool(
+        await create_engine(_BASE_SDL, schema_name="test_pool_base")
+    )
+
+
+def _get_rebuilt_type_names(schema):
+    return {
+        type_name
+        for type_name in schema.type_definitions
+        if type_name not in schema.shared_type_names
+    }
+
+
+@pytest.mark.asyncio
+async def test_pool_add_engine(clean_registry):
+    pool = await _create_pool()
+
+    @Resolver("Query.tenant", schema_name="test_pool_tenant")
+    async def resolve_query_tenant(parent, args, ctx, info):
+        return {"name": "Tenant"}
+
+    engine = await pool.add_engine(
+        "test_pool_tenant",
+        """
+        type Tenant {
+          name: String
+        }
+
+        extend type Query {
+          tenant: Tenant
+        }
+        """,
+    )
+    assert pool["test_pool_tenant"] is engine
+    assert "test_pool_tenant" in pool
+    assert list(pool) == ["test_pool_tenant"]
+    assert len(pool) == 1
+
+    base_schema = pool.base_engine._schema
+    assert _get_rebuilt_type_names(engine._schema) == {"Query", "Tenant"}
+    assert engine._schema.find_type("User") is base_schema.find_type("User")
+    assert engine._schema.find_directive("skip") is (
+        base_schema.find_directive("skip")
+    )
+
+    assert await engine.execute(
+        "{ tenant { name } user(id: 1) { name } posts { author { name } } }"
+    ) == {
+        "data": {
+            "tenant": {"name": "Tenant"},
+            "user": {"name": "Base"},
+            "posts": [{"author": {"name": "Author"}}],
+        }
+    }
+    assert await pool.base_engine.execute("{ user(id: 1) { name } }") == {
+        "data": {"user": {"name": "Base"}}
+    }
+    assert "tenant" not in base_schema.find_type("Query").implemented_fields
+
+
+@pytest.mark.asyncio
+async def test_pool_add_engine_implements_base_interface(clean_registry):
+    pool = await _create_pool()
+
+    engine = await pool.add_engine(
+        "test_pool_tenant",
+        """
+        type Comment implements Node {
+          id: ID!
+        }
+        """,
+    )
+
+    # Objects implementing the interface register into its possible types
+    assert _get_rebuilt_type_names(engine._schema) == {
+        "Comment",
+        "Node",
+        "Post",
+        "Query",
+        "User",
+    }
+    assert {
+        possible_type.name
+        for possible_type in engine._schema.find_type("Node").possibleTypes
+    } == {"Comment", "Post", "User"}
+    assert {
+        possible_type.name
+        for possible_type in pool.base_engine._schema.find_type(
+            "Node"
+        ).possibleTypes
+    } == {"Post", "User"}
+    assert await engine.execute("{ user(id: 1) { name } }") == {
+        "data": {"user": {"name": "Base"}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_pool_add_engine_overrides_base_resolver(clean_registry):
+    pool = await _create_pool()
+
+    @Resolver("Query.user", schema_name="test_pool_tenant")
+    async def resolve_query_user(parent, args, ctx, info):
+        return {"id": args["id"], "name": "Tenant"}
+
+    engine = await pool.add_engine("test_pool_tenant")
+    assert _get_rebuilt_type_names(engine._schema) == {"Query"}
+    assert await engine.execute("{ user(id: 1) { name } }") == {
+        "data": {"user": {"name": "Tenant"}}
+    }
+    assert await pool.base_engine.execute("{ user(id: 1) { name } }") == {
+        "data": {"user": {"name": "Base"}}
+    }
+    assert engine._schema.fingerprint != pool.base_engine._schema.fingerprint
+
+
+@pytest.mark.asyncio
+async def test_pool_add_engine_while_base_engine_reloads(clean_registry):
+    from tartiflette.schema.registry import SchemaRegistry
+
+    pool = await _create_pool()
+
+    @Resolver("Query.user", schema_name="test_pool_tenant")
+    async def resolve_query_user(parent, args, ctx, info):
+        return {"id": args["id"], "name": "Tenant"}
+
+    # The information of the base schema is missing while it's reloaded
+    previous_schema_info = SchemaRegistry.replace_schema_info("test_pool_base")
+    try:
+        engine = await pool.add_engine("test_pool_tenant")
+    finally:
+        SchemaRegistry.replace_schema_info(
+            "test_pool_base", previous_schema_info
+        )
+
+    assert await engine.execute(
+        "{ user(id: 1) { name } posts { title } }"
+    ) == {"data": {"user": {"name": "Tenant"}, "posts": [{"title": "Post"}]}}
+
+
+@pytest.mark.asyncio
+async def test_pool_add_engine_already_added(clean_registry):
+    pool = await _create_pool()
+    await pool.add_engine("test_pool_tenant")
+
+    with pytest.raises(
+        ImproperlyConfigured,
+        match=r"Engine < test_pool_tenant > is already part of the pool\.",
+    ):
+        await pool.add_engine("test_pool_tenant")
+
+
+@pytest.mark.asyncio
+async def test_pool_uncooked_base_engine(clean_registry):
+    pool = EnginePool(Engine(_BASE_SDL, schema_name="test_pool_base"))
+
+    with pytest.raises(
+        ImproperlyConfigured,
+        match=r"Given < base_engine > is not a cooked Engine instance\.",
+    ):
+        await pool.add_engine("test_pool_tenant")
+
+
+async def _default_resolver(parent, args, ctx, info):
+    return f"Default {info.field_name}"
+
+
+@pytest.mark.asyncio
+async def test_pool_inherits_default_resolvers(clean_registry):
+    @Resolver("Query.user", schema_name="test_pool_base")
+    async def resolve_query_user(parent, args, ctx, info):
+        return {"id": args["id"]}
+
+    pool = EnginePool(
+        await create_engine(
+            _BASE_SDL,
+            schema_name="test_pool_base",
+            custom_default_resolver=_default_resolver,
+        )
+    )
+
+    @Resolver("Query.tenant", schema_name="test_pool_tenant")
+    async def resolve_query_tenant(parent, args, ctx, info):
+        return {}
+
+    engine = await pool.add_engine(
+        "test_pool_tenant",
+        """
+        type Tenant {
+          name: String
+        }
+
+        extend type Query {
+          tenant: Tenant
+        }
+        """,
+    )
+    assert engine._custom_default_resolver is _default_resolver
+    assert await engine.execute(
+        "{ user(id: 1) { name } tenant { name } }"
+    ) == {
+        "data": {
+            "user": {"name": "Default name"},
+            "tenant": {"name": "Default name"},
+        }
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "parameter_name,value",
+    [
+        ("custom_default_resolver", _default_resolver),
+        ("custom_default_type_resolver", lambda *_: "User"),
+    ],
+)
+async def test_pool_differing_default_resolvers(
+    clean_registry, parameter_name, value
+):
+    pool = await _create_pool()
+
+    with pytest.raises(
+        ImproperlyConfigured,
+        match=rf"Given < {parameter_name} > differs from the one of the "
+        r"< base_engine >\.",
+    ):
+        await pool.add_engine("test_pool_tenant", **{parameter_name: value})
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from tartiflette import Directive, Resolver, Scalar
@@ -581,6 +583,56 @@ async def test_schema_has_type(clean_registry, type_name, expected):
     assert schema.has_type(type_name) is expected
 
 
+@pytest.mark.parametrize(
+    "parent_type_name,field_name,expected",
+    [
+        ("User", "name", True),
+        ("User", "__typename", True),
+        ("Query", "viewer", True),
+        ("Query", "__schema", True),
+        ("Node", "id", True),
+        ("Entity", "__typename", True),
+        ("User", "unknown", False),
+        ("Unknown", "name", False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_schema_field_definitions(
+    clean_registry, parent_type_name, field_name, expected
+):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        interface Node {
+            id: ID
+        }
+
+        type User implements Node {
+            id: ID
+            name: String
+        }
+
+        union Entity = User
+
+        type Query {
+            viewer: User
+        }
+        """,
+        "a",
+    )
+    clean_registry.register_sdl("a", full_sdl)
+    schema = await SchemaBakery.bake("a")
+
+    field_definition = schema.field_definitions.get(
+        (parent_type_name, field_name)
+    )
+    assert (field_definition is not None) is expected
+    if expected:
+        assert field_definition is schema.get_field_by_name(
+            f"{parent_type_name}.{field_name}"
+        )
+
+
 @pytest.mark.parametrize(
     "schema_name,where,obj",
     [
@@ -607,3 +659,38 @@ def test_schema_registry_register(clean_registry, schema_name, where, obj):
         "Can't register < %s > to < %s > %s because it's already registered"
         % (obj.name, schema_name, where)
     )
+
+
+@pytest.mark.asyncio
+async def test_schema_bake_schema_cache_directory(
+    clean_registry, tmp_path, count_schema_snapshots
+):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        type Query {
+            lol(arg: Int = 3): [Int!] @deprecated(reason: "lol")
+        }""",
+        "a",
+    )
+    clean_registry.register_sdl("a", full_sdl)
+    cache_directory = str(tmp_path / "schemas")
+
+    schema = SchemaBakery._preheat("a", cache_directory)
+    assert count_schema_snapshots(cache_directory) == 1
+
+    with patch(
+        "tartiflette.schema.bakery.schema_from_sdl",
+        side_effect=AssertionError("SDL shouldn't be parsed"),
+    ):
+        cached_schema = SchemaBakery._preheat("a", cache_directory)
+
+    assert cached_schema is not schema
+    assert cached_schema == schema
+
+    await cached_schema.bake()
+    assert cached_schema.find_type("Query").find_field("lol").isDeprecated
+
+    clean_registry.register_sdl("a", full_sdl + " type Other { a: Int }")
+    await SchemaBakery.bake("a", cache_directory=cache_directory)
+    assert count_schema_snapshots(cache_directory) == 2